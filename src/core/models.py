@@ -34,7 +34,7 @@ class ErrorType(Enum):
     CONFIG_ERROR = "config_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class DramaInfo:
     """短剧信息数据模型
     
@@ -95,7 +95,7 @@ class DramaInfo:
                 self.play_cnt == other.play_cnt)
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeInfo:
     """剧集信息数据模型
     
@@ -118,7 +118,7 @@ class EpisodeInfo:
                 self.chapter_word_number == other.chapter_word_number)
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoInfo:
     """视频信息数据模型
     
@@ -149,7 +149,7 @@ class VideoInfo:
         return self.pic
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """搜索结果数据模型"""
     code: int
@@ -173,7 +173,7 @@ class SearchResult:
         return 1
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeList:
     """剧集列表数据模型"""
     code: int
@@ -193,7 +193,7 @@ class EpisodeList:
         return self.book_name
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryResult:
     """分类结果数据模型"""
     code: int
@@ -202,7 +202,7 @@ class CategoryResult:
     offset: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiError:
     """API错误数据模型"""
     code: int
@@ -259,7 +259,7 @@ class ErrorItem:
     retry_callback: Optional[Callable[[], None]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """缓存条目"""
     data: str
@@ -272,7 +272,7 @@ class CacheEntry:
         return elapsed > self.ttl
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiResponse:
     """API 响应数据结构"""
     status_code: int
@@ -281,7 +281,7 @@ class ApiResponse:
     success: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FavoriteItem:
     """收藏项"""
     drama: DramaInfo
@@ -294,7 +294,7 @@ class FavoriteItem:
                 self.added_time == other.added_time)
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryItem:
     """观看历史项"""
     drama: DramaInfo
@@ -30,7 +30,7 @@ def _get_cache_dir() -> Path:
         return user_cache_dir
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """缓存条目"""
     data: str
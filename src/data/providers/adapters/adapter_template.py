@@ -11,15 +11,12 @@
 
 限流说明:
 - 默认配置: 10秒内最多5次请求
-- 使用滑动窗口算法自动控制请求频率
+- 使用基类 BaseDataProvider 的滑动窗口算法自动控制请求频率
 - 超限时会自动等待，无需手动处理
 """
 import json
-import time
 from typing import List
-from collections import deque
 import aiohttp
-import asyncio
 
 from ..provider_base import BaseDataProvider, ProviderInfo, ProviderCapabilities
 from ....core.models import (
@@ -74,8 +71,6 @@ class TemplateAdapter(BaseDataProvider):
                 available_qualities=["1080p", "720p", "480p"],
             ),
         )
-        # 限流：滑动窗口记录请求时间戳
-        self._request_timestamps: deque = deque()
 
     @property
     def info(self) -> ProviderInfo:
@@ -84,33 +79,6 @@ class TemplateAdapter(BaseDataProvider):
 
     # ==================== 网络请求（带限流） ====================
 
-    async def _wait_for_rate_limit(self) -> None:
-        """等待直到满足限流条件（滑动窗口算法）"""
-        now = time.monotonic()
-        window_start = now - self.RATE_LIMIT_WINDOW
-
-        # 清理过期的时间戳
-        while self._request_timestamps and self._request_timestamps[0] < window_start:
-            self._request_timestamps.popleft()
-
-        # 如果窗口内请求数已达上限，等待最早的请求过期
-        if len(self._request_timestamps) >= self.RATE_LIMIT_MAX_REQUESTS:
-            wait_time = self._request_timestamps[0] - window_start
-            if wait_time > 0:
-                logger.debug(f"限流等待 {wait_time:.2f} 秒")
-                await asyncio.sleep(wait_time)
-                # 等待后重新清理
-                now = time.monotonic()
-                window_start = now - self.RATE_LIMIT_WINDOW
-                while (
-                    self._request_timestamps
-                    and self._request_timestamps[0] < window_start
-                ):
-                    self._request_timestamps.popleft()
-
-        # 记录本次请求时间
-        self._request_timestamps.append(time.monotonic())
-
     async def _request(self, params: dict, endpoint: str = "") -> str:
         """发送 HTTP 请求（带限流）
 
@@ -5,12 +5,13 @@
 """
 import re
 import json
-from typing import List
+from functools import lru_cache
+from typing import List, Union
 
 from ..provider_base import (
     BaseDataProvider, 
     ProviderInfo, 
-    ProviderCapabilities
+    ProviderCapabilities,
 )
 from ....core.models import (
     DramaInfo,
@@ -20,18 +21,24 @@ from ....core.models import (
     SearchResult,
     CategoryResult,
 )
+from ....utils.json_serializer import json_loads
 from ....utils.log_manager import get_logger
+from ....utils.string_utils import intern_label, to_int
 
 logger = get_logger()
 
+# 集数解析正则：一次扫描同时匹配"第N集"（组 1）与裸数字（组 2）
+_EPISODE_RE = re.compile(r'第(\d+)集|(\d+)')
+_EPISODE_TITLE_RE = re.compile(r'第(\d+)集')
+
 
 class CenguiguiAdapter(BaseDataProvider):
     """Cenguigui API 数据提供者"""
     
     BASE_URL = "https://api.cenguigui.cn/api/duanju/api.php"
     
-    # 静态分类列表
-    CATEGORIES = [
+    # 静态分类列表（只读，按展示顺序排列）
+    CATEGORIES = (
         "推荐榜", "新剧", "逆袭", "霸总", "现代言情", "打脸虐渣", 
         "豪门恩怨", "神豪", "马甲", "都市日常", "战神归来", "小人物", 
         "女性成长", "大女主", "穿越", "都市修仙", "强者回归", "亲情", 
@@ -42,7 +49,7 @@ class CenguiguiAdapter(BaseDataProvider):
         "破镜重圆", "暗恋成真", "民国", "欢喜冤家", "系统", "真假千金", 
         "龙王", "校园", "穿书", "女帝", "团宠", "年代爱情", "玄幻仙侠", 
         "青梅竹马", "悬疑推理", "皇后", "替身", "大叔", "喜剧", "剧情"
-    ]
+    )
     
     def __init__(self, timeout: int = 10000):
         super().__init__(timeout)
@@ -62,21 +69,21 @@ class CenguiguiAdapter(BaseDataProvider):
     def info(self) -> ProviderInfo:
         return self._info
     
-    async def _request(self, params: dict) -> str:
+    async def _request(self, params: dict) -> Union[bytes, str]:
         """发送 HTTP 请求（带限流）"""
         # 使用基类的请求方法（包含限流和基础重试）
-        text = await super()._request(params=params)
+        body = await super()._request(params=params)
         
         # 检查 API 业务逻辑错误
         try:
-            data = json.loads(text)
+            data = json_loads(body)
             if data.get("code") != 200:
                 error_msg = data.get("msg", "未知错误")
                 logger.warning(f"Cenguigui API 返回非 200 状态: code={data.get('code')}, msg={error_msg}")
         except json.JSONDecodeError:
             pass  # 不是 JSON 格式，可能是纯文本或其他，留给调用者处理或忽略
             
-        return text
+        return body
     
     async def search(self, keyword: str, page: int = 1) -> SearchResult:
         """搜索短剧"""
@@ -85,7 +92,7 @@ class CenguiguiAdapter(BaseDataProvider):
     
     async def get_categories(self) -> List[str]:
         """获取分类列表（静态）"""
-        return self.CATEGORIES.copy()
+        return list(self.CATEGORIES)
     
     async def get_category_dramas(self, category: str, page: int = 1) -> CategoryResult:
         """获取分类下的短剧"""
@@ -113,16 +120,15 @@ class CenguiguiAdapter(BaseDataProvider):
     
     # ==================== 响应解析方法 ====================
     
-    def _parse_search_result(self, json_str: str) -> SearchResult:
+    def _parse_search_result(self, json_str: Union[bytes, str]) -> SearchResult:
         try:
-            data = json.loads(json_str)
+            data = json_loads(json_str)
         except json.JSONDecodeError:
             return SearchResult(code=1, msg="响应格式错误", data=[], page=1)
             
-        dramas = [self._parse_drama_item(item) for item in data.get("data", [])]
-        page = data.get("page", 1)
-        if isinstance(page, str):
-            page = int(page) if page.isdigit() else 1
+        parse_item = self._parse_drama_item
+        dramas = [parse_item(item) for item in data.get("data", [])]
+        page = to_int(data.get("page", 1), 1)
         return SearchResult(
             code=data.get("code", 0),
             msg=data.get("msg", ""),
@@ -130,24 +136,14 @@ class CenguiguiAdapter(BaseDataProvider):
             page=page
         )
     
-    def _parse_category_result(self, json_str: str, category: str) -> CategoryResult:
+    def _parse_category_result(self, json_str: Union[bytes, str], category: str) -> CategoryResult:
         try:
-            data = json.loads(json_str)
+            data = json_loads(json_str)
         except json.JSONDecodeError:
             return CategoryResult(code=1, category=category, data=[], offset=1)
             
-        dramas = []
-        for item in data.get("data", []):
-            dramas.append(DramaInfo(
-                book_id=str(item.get("book_id", "")),
-                title=item.get("title", ""),
-                cover=item.get("cover", ""),
-                episode_cnt=int(item.get("episode_cnt", 0)),
-                intro=item.get("video_desc", ""),
-                type=item.get("sub_title", category),
-                author="",
-                play_cnt=int(item.get("play_cnt", 0))
-            ))
+        parse_item = self._parse_category_item
+        dramas = [parse_item(item, category) for item in data.get("data", [])]
         return CategoryResult(
             code=data.get("code", 0),
             category=category,
@@ -155,48 +151,32 @@ class CenguiguiAdapter(BaseDataProvider):
             offset=1
         )
     
-    def _parse_recommendations(self, json_str: str) -> List[DramaInfo]:
+    def _parse_recommendations(self, json_str: Union[bytes, str]) -> List[DramaInfo]:
         try:
-            data = json.loads(json_str)
+            data = json_loads(json_str)
         except json.JSONDecodeError:
             return []
             
-        dramas = []
-        for item in data.get("data", []):
-            book_data = item.get("book_data", {})
-            serial_count = book_data.get("serial_count", 0)
-            if isinstance(serial_count, str):
-                serial_count = int(serial_count) if serial_count.isdigit() else 0
-            dramas.append(DramaInfo(
-                book_id=str(book_data.get("book_id", "")),
-                title=book_data.get("book_name", ""),
-                cover=book_data.get("thumb_url", ""),
-                episode_cnt=serial_count,
-                intro="",
-                type=book_data.get("category", ""),
-                author="",
-                play_cnt=int(item.get("hot", 0))
-            ))
-        return dramas
+        parse_item = self._parse_recommendation_item
+        return [parse_item(item) for item in data.get("data", [])]
     
-    def _parse_episode_list(self, json_str: str) -> EpisodeList:
+    def _parse_episode_list(self, json_str: Union[bytes, str]) -> EpisodeList:
         try:
-            data = json.loads(json_str)
+            data = json_loads(json_str)
         except json.JSONDecodeError:
             return EpisodeList(code=1, book_name="", episodes=[], total=0, book_id="", author="", category="", desc="解析错误", duration="", book_pic="")
             
+        parse_number = self._parse_episode_number
         episodes = []
         for item in data.get("data", []):
             title = item.get("title", "")
             episodes.append(EpisodeInfo(
                 video_id=str(item.get("video_id", "")),
                 title=title,
-                episode_number=self._parse_episode_number(title),
+                episode_number=parse_number(title),
                 chapter_word_number=int(item.get("chapter_word_number", 0))
             ))
-        total = data.get("total", 0)
-        if isinstance(total, str):
-            total = int(total) if total.isdigit() else 0
+        total = to_int(data.get("total", 0), 0)
         return EpisodeList(
             code=data.get("code", 0),
             book_name=data.get("book_name", ""),
@@ -204,17 +184,17 @@ class CenguiguiAdapter(BaseDataProvider):
             total=total,
             book_id=str(data.get("book_id", "")),
             author=data.get("author", ""),
-            category=data.get("category", ""),
+            category=intern_label(data.get("category", "")),
             desc=data.get("desc", ""),
             duration=data.get("duration", ""),
             book_pic=data.get("book_pic", "")
         )
     
-    def _parse_video_info(self, json_str: str) -> VideoInfo:
+    def _parse_video_info(self, json_str: Union[bytes, str]) -> VideoInfo:
         try:
-            data = json.loads(json_str)
+            data = json_loads(json_str)
         except json.JSONDecodeError:
-             return VideoInfo(code=1, url="", pic="", quality="", title="解析错误", duration="", size_str="")
+            return VideoInfo(code=1, url="", title="解析错误")
 
         video_data = data.get("data", {})
         info = video_data.get("info", {})
@@ -228,24 +208,57 @@ class CenguiguiAdapter(BaseDataProvider):
             size_str=info.get("size_str", "")
         )
     
+    @staticmethod
+    def _parse_category_item(item: dict, category: str) -> DramaInfo:
+        get = item.get
+        return DramaInfo(
+            book_id=str(get("book_id", "")),
+            title=get("title", ""),
+            cover=get("cover", ""),
+            episode_cnt=int(get("episode_cnt", 0)),
+            intro=get("video_desc", ""),
+            type=intern_label(get("sub_title", category)),
+            author="",
+            play_cnt=int(get("play_cnt", 0))
+        )
+    
+    @staticmethod
+    def _parse_recommendation_item(item: dict) -> DramaInfo:
+        get = item.get("book_data", {}).get
+        return DramaInfo(
+            book_id=str(get("book_id", "")),
+            title=get("book_name", ""),
+            cover=get("thumb_url", ""),
+            episode_cnt=to_int(get("serial_count", 0), 0),
+            intro="",
+            type=intern_label(get("category", "")),
+            author="",
+            play_cnt=int(item.get("hot", 0))
+        )
+    
     def _parse_drama_item(self, item: dict) -> DramaInfo:
+        get = item.get
         return DramaInfo(
-            book_id=str(item.get("book_id", "")),
-            title=item.get("title", ""),
-            cover=item.get("cover", ""),
-            episode_cnt=int(item.get("episode_cnt", 0)),
-            intro=item.get("intro", ""),
-            type=item.get("type", ""),
-            author=item.get("author", ""),
-            play_cnt=int(item.get("play_cnt", 0))
+            book_id=str(get("book_id", "")),
+            title=get("title", ""),
+            cover=get("cover", ""),
+            episode_cnt=int(get("episode_cnt", 0)),
+            intro=get("intro", ""),
+            type=intern_label(get("type", "")),
+            author=get("author", ""),
+            play_cnt=int(get("play_cnt", 0))
         )
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_episode_number(title: str) -> int:
-        match = re.search(r'第(\d+)集', title)
-        if match:
-            return int(match.group(1))
-        match = re.search(r'(\d+)', title)
-        if match:
-            return int(match.group(1))
-        return 0
+        # "第N集" 形式的标题在各剧之间大量重复，按标题缓存解析结果
+        match = _EPISODE_RE.search(title)
+        if match is None:
+            return 0
+        number = match.group(1)
+        if number is None:
+            # 先命中了裸数字，后面仍可能出现"第N集"，保持其优先级
+            later = _EPISODE_TITLE_RE.search(title, match.end()) if "第" in title else None
+            number = later.group(1) if later else match.group(2)
+        return int(number)
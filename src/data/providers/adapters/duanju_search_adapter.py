@@ -4,12 +4,15 @@
 注意：此 API 返回的是网盘链接，不提供直接的视频播放地址。
 """
 import json
-from typing import List
+import time
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import List, Optional, Tuple
 
 from ..provider_base import (
     BaseDataProvider,
     ProviderInfo,
-    ProviderCapabilities
+    ProviderCapabilities,
 )
 from ....core.models import (
     DramaInfo,
@@ -19,10 +22,18 @@ from ....core.models import (
     SearchResult,
     CategoryResult,
 )
+from ....utils.json_serializer import json_loads
 from ....utils.log_manager import get_logger
+from ....utils.string_utils import is_net_link, stable_id
 
 logger = get_logger()
 
+# 网盘链接说明文案（固定前后缀，仅链接部分随条目变化）
+_NET_DESC_PREFIX = "🔗 此短剧资源存储在网盘中，请复制以下链接到浏览器打开：\n\n"
+_NET_DESC_SUFFIX = "\n\n提示：点击链接可能需要登录对应网盘账号"
+_NET_PREFIX = "🔗 夸克网盘链接"
+_NET_INTRO_SUFFIX = "\n\n点击短剧后可复制链接到浏览器打开"
+
 
 class DuanjuSearchAdapter(BaseDataProvider):
     """短剧分页搜索 API 数据提供者（全网短剧）"""
@@ -31,14 +42,23 @@ class DuanjuSearchAdapter(BaseDataProvider):
     BASE_URL = "https://kuoapp.com"
 
     # 分类映射（基于 API 文档）
-    CATEGORIES = {
+    CATEGORIES = MappingProxyType({
         "今日更新": "today",
         "热门榜单": "hot",
         "全部短剧": "all",
-    }
+    })
+    # 分类名称按展示顺序预先展开，get_categories 只需复制
+    CATEGORY_NAMES = tuple(CATEGORIES)
+
+    # 最近数据缓存有效期（秒），分类、推荐与本地搜索共用同一份数据
+    RECENT_DATA_TTL = 60.0
 
     def __init__(self, timeout: int = 10000, base_url: str = None):
         super().__init__(timeout)
+        # (获取时间, 数据)，避免每次调用都逐日回溯请求
+        self._recent_cache: Optional[Tuple[float, list]] = None
+        # (数据列表, 对应的 casefold 名称)，同一份最近数据只折叠一次
+        self._folded_names: Optional[Tuple[list, List[str]]] = None
         if base_url:
             self.BASE_URL = base_url
         self._info = ProviderInfo(
@@ -70,7 +90,7 @@ class DuanjuSearchAdapter(BaseDataProvider):
         text = await super()._request(params=params, url=url)
         
         try:
-            data = json.loads(text)
+            data = json_loads(text)
             return data
         except json.JSONDecodeError as e:
             logger.error(f"DuanjuSearch API JSON 解析错误: {e}")
@@ -82,22 +102,24 @@ class DuanjuSearchAdapter(BaseDataProvider):
         API: GET /duanju/api.php?param=1&name=关键词&page=1
         注意：搜索接口响应较慢，如果超时会使用本地数据过滤
         """
-        try:
-            # 尝试使用搜索 API
-            data = await self._request("/duanju/api.php", {
-                "param": 1,
-                "name": keyword,
-                "page": page
-            })
-            return self._parse_search_result(data, page)
-        except Exception as e:
-            logger.warning(f"DuanjuSearch 搜索接口失败: {e}，使用本地数据过滤")
-            # 搜索接口失败时，从最近数据中过滤
-            return await self._search_from_local(keyword, page)
+        # 搜索失败后的本地过滤会逐日拉取数据，与搜索请求共用同一个 HTTP 会话
+        async with self.shared_session():
+            try:
+                # 尝试使用搜索 API
+                data = await self._request("/duanju/api.php", {
+                    "param": 1,
+                    "name": keyword,
+                    "page": page
+                })
+                return self._parse_search_result(data, page)
+            except Exception as e:
+                logger.warning(f"DuanjuSearch 搜索接口失败: {e}，使用本地数据过滤")
+                # 搜索接口失败时，从最近数据中过滤
+                return await self._search_from_local(keyword, page)
 
     async def get_categories(self) -> List[str]:
         """获取分类列表"""
-        return list(self.CATEGORIES.keys())
+        return list(self.CATEGORY_NAMES)
 
     async def get_category_dramas(self, category: str, page: int = 1) -> CategoryResult:
         """获取分类下的短剧"""
@@ -120,12 +142,14 @@ class DuanjuSearchAdapter(BaseDataProvider):
         """从本地数据中搜索（当搜索接口不可用时的备选方案）"""
         try:
             data = await self._get_recent_data()
-            # 过滤包含关键词的数据
-            filtered = [
-                item for item in data
-                if keyword.lower() in (item.get("name") or "").lower()
+            # 过滤包含关键词的数据（名称按数据列表缓存折叠结果）
+            kw = keyword.casefold()
+            parse_item = self._parse_item
+            dramas = [
+                parse_item(item)
+                for item, name in zip(data, self._get_folded_names(data))
+                if kw in name
             ]
-            dramas = [self._parse_item(item) for item in filtered]
             logger.info(f"DuanjuSearch: 本地搜索找到 {len(dramas)} 条结果")
             return SearchResult(
                 code=0,
@@ -137,27 +161,42 @@ class DuanjuSearchAdapter(BaseDataProvider):
             logger.error(f"DuanjuSearch 本地搜索失败: {e}")
             return SearchResult(code=1, msg=f"搜索失败: {e}", data=[], page=page)
 
+    def _get_folded_names(self, data: list) -> List[str]:
+        """返回与 data 一一对应的 casefold 名称，data 未变时复用上次结果"""
+        cached = self._folded_names
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        names = [(item.get("name") or "").casefold() for item in data]
+        self._folded_names = (data, names)
+        return names
+
     async def _get_recent_data(self) -> list:
         """获取最近日期的数据
         
-        从今天开始往前查找，直到找到有数据的日期
+        从今天开始往前查找，直到找到有数据的日期。
+        结果在 RECENT_DATA_TTL 秒内复用，未找到数据时不缓存。
         """
-        from datetime import date, timedelta
+        cached = self._recent_cache
+        if cached and time.monotonic() - cached[0] < self.RECENT_DATA_TTL:
+            return cached[1]
         
-        # 从今天开始，往前查找最多30天
-        for days_ago in range(30):
-            check_date = date.today() - timedelta(days=days_ago)
-            date_str = check_date.strftime("%Y-%m-%d")
-            
-            try:
-                logger.debug(f"DuanjuSearch: 尝试获取 {date_str} 的数据...")
-                data = await self._request("/duanju/get.php", {"day": date_str})
-                if data and isinstance(data, list) and len(data) > 0:
-                    logger.info(f"DuanjuSearch: 获取到 {date_str} 的 {len(data)} 条数据")
-                    return data
-            except Exception as e:
-                logger.debug(f"DuanjuSearch: {date_str} 无数据: {e}")
-                continue
+        # 从今天开始，往前查找最多30天；逐日请求共用同一个 HTTP 会话
+        # 当前日期只读取一次，跨午夜时也不会跳过或重复日期
+        today = date.today()
+        async with self.shared_session():
+            for days_ago in range(30):
+                date_str = (today - timedelta(days=days_ago)).isoformat()
+                
+                try:
+                    logger.debug(f"DuanjuSearch: 尝试获取 {date_str} 的数据...")
+                    data = await self._request("/duanju/get.php", {"day": date_str})
+                    if data and isinstance(data, list) and len(data) > 0:
+                        logger.info(f"DuanjuSearch: 获取到 {date_str} 的 {len(data)} 条数据")
+                        self._recent_cache = (time.monotonic(), data)
+                        return data
+                except Exception as e:
+                    logger.debug(f"DuanjuSearch: {date_str} 无数据: {e}")
+                    continue
         
         logger.warning("DuanjuSearch: 未找到任何数据")
         return []
@@ -181,10 +220,10 @@ class DuanjuSearchAdapter(BaseDataProvider):
         drama_id 实际上是网盘链接。
         """
         source_link = drama_id
-        is_valid_link = source_link.startswith("http")
+        is_valid_link = is_net_link(source_link)
         
         if is_valid_link:
-            desc = f"🔗 此短剧资源存储在网盘中，请复制以下链接到浏览器打开：\n\n{source_link}\n\n提示：点击链接可能需要登录对应网盘账号"
+            desc = f"{_NET_DESC_PREFIX}{source_link}{_NET_DESC_SUFFIX}"
             logger.info(f"DuanjuSearch: 返回网盘链接 - {source_link}")
         else:
             desc = "[全网短剧API] 此数据源仅提供短剧索引，不支持在线播放。"
@@ -205,17 +244,8 @@ class DuanjuSearchAdapter(BaseDataProvider):
 
     async def get_video_url(self, episode_id: str, quality: str = "1080p") -> VideoInfo:
         """获取视频播放地址 - 此 API 不支持"""
-        error_msg = "[全网短剧API] 此数据源不支持获取视频播放地址"
         logger.warning(f"DuanjuSearch API 不支持获取视频播放地址: episode_id={episode_id}")
-        return VideoInfo(
-            code=1,
-            url="",
-            pic="",
-            quality="",
-            title=error_msg,
-            duration="",
-            size_str=""
-        )
+        return VideoInfo(code=1, url="", title="[全网短剧API] 此数据源不支持获取视频播放地址")
 
     # ==================== 响应解析方法 ====================
 
@@ -291,20 +321,22 @@ class DuanjuSearchAdapter(BaseDataProvider):
             "state": 0
         }
         """
+        get = item.get
+        
         # 获取标题
-        title = item.get("name") or item.get("title") or "未知短剧"
+        title = get("name") or get("title") or "未知短剧"
         
         # 获取网盘链接（夸克网盘）
-        source_link = item.get("url") or ""
+        source_link = get("url") or ""
         
         # 使用 source_link 作为 book_id，方便后续提取
-        book_id = source_link if source_link else item.get("id") or str(hash(title))
+        book_id = source_link if source_link else get("id") or stable_id(title)
         
         # 获取更新时间
-        update_time = item.get("addtime") or ""
+        update_time = get("addtime") or ""
         
         # 获取集数
-        episode_cnt = item.get("episodes") or 0
+        episode_cnt = get("episodes") or 0
         if isinstance(episode_cnt, str):
             try:
                 episode_cnt = int(episode_cnt.replace("集", "").strip())
@@ -312,11 +344,11 @@ class DuanjuSearchAdapter(BaseDataProvider):
                 episode_cnt = 0
 
         # 获取封面
-        cover = item.get("cover") or ""
+        cover = get("cover") or ""
 
-        intro = f"🔗 夸克网盘链接\n更新时间: {update_time}" if update_time else "🔗 夸克网盘链接"
+        intro = f"{_NET_PREFIX}\n更新时间: {update_time}" if update_time else _NET_PREFIX
         if source_link:
-            intro += f"\n\n点击短剧后可复制链接到浏览器打开"
+            intro += _NET_INTRO_SUFFIX
 
         return DramaInfo(
             book_id=book_id,
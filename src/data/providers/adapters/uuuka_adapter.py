@@ -4,12 +4,13 @@
 注意：此 API 返回的是外部链接 (source_link)，不提供直接的视频播放地址。
 """
 import json
+from types import MappingProxyType
 from typing import List
 
 from ..provider_base import (
     BaseDataProvider,
     ProviderInfo,
-    ProviderCapabilities
+    ProviderCapabilities,
 )
 from ....core.models import (
     DramaInfo,
@@ -19,10 +20,21 @@ from ....core.models import (
     SearchResult,
     CategoryResult,
 )
+from ....utils.json_serializer import json_loads
 from ....utils.log_manager import get_logger
+from ....utils.string_utils import intern_label, is_net_link, stable_id
 
 logger = get_logger()
 
+# 网盘链接说明文案（固定前后缀，仅链接部分随条目变化）
+_NET_DESC_PREFIX = "🔗 此短剧资源存储在网盘中，请复制以下链接到浏览器打开：\n\n"
+_NET_DESC_SUFFIX = "\n\n提示：点击链接可能需要登录对应网盘账号"
+_NET_PREFIX = "🔗 网盘链接: "
+_NET_INTRO_SUFFIX = "\n\n点击短剧后可复制链接到浏览器打开"
+
+# 不支持播放时返回的提示标题
+_UNSUPPORTED_VIDEO_TITLE = "[即刻短剧API] 此数据源不支持获取视频播放地址"
+
 
 class UuukaAdapter(BaseDataProvider):
     """UuuKa API 数据提供者（即刻短剧）"""
@@ -30,14 +42,16 @@ class UuukaAdapter(BaseDataProvider):
     BASE_URL = "https://api.uuuka.com"
 
     # 内容类型映射
-    CONTENT_TYPES = {
+    CONTENT_TYPES = MappingProxyType({
         "短剧": "post",
         "动漫": "dongman",
         "电影": "movie",
         "电视剧": "tv",
         "学习资源": "xuexi",
         "百度短剧": "baidu",
-    }
+    })
+    # 分类名称按展示顺序预先展开，get_categories 只需复制
+    CATEGORY_NAMES = tuple(CONTENT_TYPES)
 
     def __init__(self, timeout: int = 10000):
         super().__init__(timeout)
@@ -70,7 +84,7 @@ class UuukaAdapter(BaseDataProvider):
         text = await super()._request(params=params, url=url)
         
         try:
-            data = json.loads(text)
+            data = json_loads(text)
             if not data.get("success"):
                 logger.warning(f"UuuKa API 返回失败: {data.get('message', 'Unknown error')}")
             return data
@@ -90,7 +104,7 @@ class UuukaAdapter(BaseDataProvider):
 
     async def get_categories(self) -> List[str]:
         """获取分类列表"""
-        return list(self.CONTENT_TYPES.keys())
+        return list(self.CATEGORY_NAMES)
 
     async def get_category_dramas(self, category: str, page: int = 1) -> CategoryResult:
         """获取分类下的短剧"""
@@ -103,26 +117,28 @@ class UuukaAdapter(BaseDataProvider):
 
     async def get_recommendations(self) -> List[DramaInfo]:
         """获取推荐内容（优先今日更新，否则获取最新列表）"""
-        # 先尝试获取今日更新
-        logger.debug("UuuKa: 尝试获取今日更新...")
-        data = await self._request("/api/contents/post", {
-            "today": "today",
-            "page": 1,
-            "limit": 20
-        })
-        dramas = self._parse_recommendations(data)
-        
-        # 如果今日更新为空，获取最新短剧列表
-        if not dramas:
-            logger.debug("UuuKa: 今日更新为空，获取最新短剧列表...")
+        # 今日更新与回退请求共用同一个 HTTP 会话
+        async with self.shared_session():
+            # 先尝试获取今日更新
+            logger.debug("UuuKa: 尝试获取今日更新...")
             data = await self._request("/api/contents/post", {
+                "today": "today",
                 "page": 1,
                 "limit": 20
             })
             dramas = self._parse_recommendations(data)
-            logger.debug(f"UuuKa: 获取到 {len(dramas)} 条最新短剧")
-        else:
-            logger.debug(f"UuuKa: 获取到 {len(dramas)} 条今日更新")
+            
+            # 如果今日更新为空，获取最新短剧列表
+            if not dramas:
+                logger.debug("UuuKa: 今日更新为空，获取最新短剧列表...")
+                data = await self._request("/api/contents/post", {
+                    "page": 1,
+                    "limit": 20
+                })
+                dramas = self._parse_recommendations(data)
+                logger.debug(f"UuuKa: 获取到 {len(dramas)} 条最新短剧")
+            else:
+                logger.debug(f"UuuKa: 获取到 {len(dramas)} 条今日更新")
         
         return dramas
 
@@ -136,10 +152,10 @@ class UuukaAdapter(BaseDataProvider):
         source_link = drama_id
         
         # 判断是否是有效的链接
-        is_valid_link = source_link.startswith("http")
+        is_valid_link = is_net_link(source_link)
         
         if is_valid_link:
-            desc = f"🔗 此短剧资源存储在网盘中，请复制以下链接到浏览器打开：\n\n{source_link}\n\n提示：点击链接可能需要登录对应网盘账号"
+            desc = f"{_NET_DESC_PREFIX}{source_link}{_NET_DESC_SUFFIX}"
             logger.info(f"UuuKa: 返回网盘链接 - {source_link}")
         else:
             desc = "[即刻短剧API] 此数据源仅提供短剧索引，不支持在线播放。"
@@ -163,18 +179,9 @@ class UuukaAdapter(BaseDataProvider):
         
         即刻短剧 API 只提供短剧索引链接，不提供视频播放地址。
         """
-        error_msg = "[即刻短剧API] 此数据源不支持获取视频播放地址"
         logger.warning(f"UuuKa API 不支持获取视频播放地址: episode_id={episode_id}")
-        logger.info(error_msg)
-        return VideoInfo(
-            code=1,
-            url="",
-            pic="",
-            quality="",
-            title=error_msg,
-            duration="",
-            size_str=""
-        )
+        logger.info(_UNSUPPORTED_VIDEO_TITLE)
+        return VideoInfo(code=1, url="", title=_UNSUPPORTED_VIDEO_TITLE)
 
     # ==================== 响应解析方法 ====================
 
@@ -220,18 +227,19 @@ class UuukaAdapter(BaseDataProvider):
 
     def _parse_item(self, item: dict) -> DramaInfo:
         """解析单个内容项"""
-        # 使用 source_link 的 hash 作为 book_id，同时保存原始链接
-        source_link = item.get("source_link", "")
-        # 使用 source_link 作为 book_id，方便后续提取
-        book_id = source_link if source_link else str(hash(item.get("title", "")))
+        get = item.get
+        title = get("title", "")
+        source_link = get("source_link", "")
+        # 使用 source_link 作为 book_id，方便后续提取；缺失时使用标题的稳定哈希
+        book_id = source_link if source_link else stable_id(title)
 
         return DramaInfo(
             book_id=book_id,
-            title=item.get("title", ""),
+            title=title,
             cover="",  # 此 API 不提供封面
             episode_cnt=0,  # 此 API 不提供集数
-            intro=f"🔗 网盘链接: {source_link}\n\n点击短剧后可复制链接到浏览器打开",
-            type=item.get("type", "post"),
+            intro=f"{_NET_PREFIX}{source_link}{_NET_INTRO_SUFFIX}",
+            type=intern_label(get("type", "post")),
             author="",
             play_cnt=0
         )
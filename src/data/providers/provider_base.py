@@ -8,13 +8,16 @@
 2. 继承 BaseDataProvider 并实现所有抽象方法
 3. 在 provider_registry.py 中注册
 """
+import codecs
 import time
 import asyncio
 import aiohttp
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from collections import deque
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import AsyncIterator, List, Optional, Protocol, Union, runtime_checkable
 
 from ...core.models import (
     DramaInfo,
@@ -27,6 +30,21 @@ from ...utils.log_manager import get_logger
 
 logger = get_logger()
 
+# 当前任务内复用的 HTTP 会话（由 BaseDataProvider.shared_session 设置）
+# 每个 AsyncWorker 线程运行独立的事件循环，会话不能跨循环共享，
+# ContextVar 保证会话只在设置它的线程/任务内可见
+_current_session: ContextVar[Optional[aiohttp.ClientSession]] = ContextVar(
+    "_current_session", default=None
+)
+
+
+def _is_foreign_charset(charset: str) -> bool:
+    """判断 Content-Type 声明的编码是否需要先解码（非 UTF-8 且可识别）"""
+    try:
+        return codecs.lookup(charset).name != "utf-8"
+    except LookupError:
+        return False
+
 
 @dataclass
 class ProviderCapabilities:
@@ -143,32 +161,42 @@ class BaseDataProvider(ABC):
     def timeout(self) -> int:
         return self._timeout
 
+    def _prune_request_timestamps(self, window_start: float) -> None:
+        """从队首清理窗口外的时间戳（时间戳按时间顺序追加）"""
+        timestamps = self._request_timestamps
+        while timestamps and timestamps[0] < window_start:
+            timestamps.popleft()
+
     async def _wait_for_rate_limit(self) -> None:
         """等待直到满足限流条件（滑动窗口算法）"""
+        timestamps = self._request_timestamps
         now = time.monotonic()
+        if not timestamps:
+            # 空闲后的首个请求无需清理与判断
+            timestamps.append(now)
+            return
         window_start = now - self.RATE_LIMIT_WINDOW
-        
-        # 清理过期的时间戳
-        while self._request_timestamps and self._request_timestamps[0] < window_start:
-            self._request_timestamps.popleft()
+        self._prune_request_timestamps(window_start)
         
         # 如果窗口内请求数已达上限，等待最早的请求过期
-        if len(self._request_timestamps) >= self.RATE_LIMIT_MAX_REQUESTS:
-            wait_time = self._request_timestamps[0] - window_start
+        if len(timestamps) >= self.RATE_LIMIT_MAX_REQUESTS:
+            wait_time = timestamps[0] - window_start
             if wait_time > 0:
                 logger.debug(f"限流等待 {wait_time:.2f} 秒")
                 await asyncio.sleep(wait_time)
                 # 等待后重新清理
                 now = time.monotonic()
-                window_start = now - self.RATE_LIMIT_WINDOW
-                while self._request_timestamps and self._request_timestamps[0] < window_start:
-                    self._request_timestamps.popleft()
+                self._prune_request_timestamps(now - self.RATE_LIMIT_WINDOW)
         
-        # 记录本次请求时间
-        self._request_timestamps.append(time.monotonic())
+        # 记录本次请求时间（未等待时复用已读取的时钟）
+        timestamps.append(now)
     
-    async def _request(self, params: dict, url: Optional[str] = None) -> str:
-        """发送 HTTP 请求（带限流）"""
+    async def _request(self, params: dict, url: Optional[str] = None) -> Union[bytes, str]:
+        """发送 HTTP 请求（带限流）
+
+        UTF-8 响应（含未声明 charset 的响应）返回原始字节，由 json_loads 直接解析，
+        省去解码为 str 的开销；Content-Type 声明了其他编码时按该编码解码为 str。
+        """
         await self._wait_for_rate_limit()
         
         target_url = url or self.info.base_url
@@ -176,16 +204,45 @@ class BaseDataProvider(ABC):
             raise ValueError("未设置基础 URL")
 
         try:
+            session = _current_session.get()
+            if session is not None:
+                return await self._fetch(session, target_url, params)
             async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    target_url, 
-                    params=params, 
-                    timeout=aiohttp.ClientTimeout(total=self._timeout / 1000),
-                    headers={"User-Agent": "Mozilla/5.0"}
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP Error: {response.status}")
-                    return await response.text()
+                return await self._fetch(session, target_url, params)
         except Exception as e:
             logger.error(f"API 请求失败: {e}")
             raise
+
+    async def _fetch(
+        self, session: aiohttp.ClientSession, url: str, params: dict
+    ) -> Union[bytes, str]:
+        """通过给定会话发送 GET 请求并返回响应内容（见 _request）"""
+        async with session.get(
+            url, 
+            params=params, 
+            timeout=aiohttp.ClientTimeout(total=self._timeout / 1000),
+            headers={"User-Agent": "Mozilla/5.0"}
+        ) as response:
+            if response.status != 200:
+                raise Exception(f"HTTP Error: {response.status}")
+            body = await response.read()
+            charset = response.charset
+            if charset and _is_foreign_charset(charset):
+                return body.decode(charset)
+            return body
+
+    @asynccontextmanager
+    async def shared_session(self) -> AsyncIterator[None]:
+        """在一组连续请求内复用同一个 aiohttp 会话
+
+        块内的 _request 共用连接池、DNS 缓存与 TLS 会话；已处于共享会话中时直接复用。
+        """
+        if _current_session.get() is not None:
+            yield
+            return
+        async with aiohttp.ClientSession() as session:
+            token = _current_session.set(session)
+            try:
+                yield
+            finally:
+                _current_session.reset(token)
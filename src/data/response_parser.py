@@ -15,6 +15,8 @@ from ..core.models import (
     CategoryResult,
     ApiError
 )
+from ..utils.json_serializer import json_loads
+from ..utils.string_utils import to_int
 
 
 class ApiResponseError(Exception):
@@ -41,7 +43,7 @@ class ResponseParser:
     @staticmethod
     def parse_search_result(json_str: str) -> SearchResult:
         """解析搜索响应"""
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         
         # 检查 API 返回的错误码
         code = data.get("code", 0)
@@ -53,9 +55,8 @@ class ResponseParser:
                 error_msg = f"{msg}\n{tips}"
             raise ApiResponseError(code, error_msg)
         
-        dramas = []
-        for item in data.get("data", []):
-            dramas.append(DramaInfo(
+        dramas = [
+            DramaInfo(
                 book_id=str(item.get("book_id", "")),
                 title=item.get("title", ""),
                 cover=item.get("cover", ""),
@@ -64,11 +65,11 @@ class ResponseParser:
                 type=item.get("type", ""),
                 author=item.get("author", ""),
                 play_cnt=int(item.get("play_cnt", 0))
-            ))
+            )
+            for item in data.get("data", [])
+        ]
         
-        page = data.get("page", 1)
-        if isinstance(page, str):
-            page = int(page) if page.isdigit() else 1
+        page = to_int(data.get("page", 1), 1)
         
         return SearchResult(
             code=code,
@@ -91,7 +92,7 @@ class ResponseParser:
     @staticmethod
     def parse_episode_list(json_str: str) -> EpisodeList:
         """解析剧集列表响应"""
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         
         # 检查 API 返回的错误码
         code = data.get("code", 0)
@@ -103,19 +104,18 @@ class ResponseParser:
                 error_msg = f"{msg}\n{tips}"
             raise ApiResponseError(code, error_msg)
         
+        parse_number = ResponseParser.parse_episode_number
         episodes = []
         for item in data.get("data", []):
             title = item.get("title", "")
             episodes.append(EpisodeInfo(
                 video_id=str(item.get("video_id", "")),
                 title=title,
-                episode_number=ResponseParser.parse_episode_number(title),
+                episode_number=parse_number(title),
                 chapter_word_number=int(item.get("chapter_word_number", 0))
             ))
         
-        total = data.get("total", 0)
-        if isinstance(total, str):
-            total = int(total) if total.isdigit() else 0
+        total = to_int(data.get("total", 0))
         
         return EpisodeList(
             code=code,
@@ -133,7 +133,7 @@ class ResponseParser:
     @staticmethod
     def parse_video_info(json_str: str) -> VideoInfo:
         """解析视频信息响应"""
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         
         # 检查 API 返回的错误码
         code = data.get("code", 0)
@@ -161,7 +161,7 @@ class ResponseParser:
     @staticmethod
     def parse_category_result(json_str: str, category: str = "") -> CategoryResult:
         """解析分类响应"""
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         
         # 检查 API 返回的错误码
         code = data.get("code", 0)
@@ -173,9 +173,8 @@ class ResponseParser:
                 error_msg = f"{msg}\n{tips}"
             raise ApiResponseError(code, error_msg)
         
-        dramas = []
-        for item in data.get("data", []):
-            dramas.append(DramaInfo(
+        dramas = [
+            DramaInfo(
                 book_id=str(item.get("book_id", "")),
                 title=item.get("title", ""),
                 cover=item.get("cover", ""),
@@ -184,7 +183,9 @@ class ResponseParser:
                 type=item.get("sub_title", category),
                 author="",
                 play_cnt=int(item.get("play_cnt", 0))
-            ))
+            )
+            for item in data.get("data", [])
+        ]
         
         return CategoryResult(
             code=code,
@@ -196,7 +197,7 @@ class ResponseParser:
     @staticmethod
     def parse_recommendations(json_str: str) -> List[DramaInfo]:
         """解析推荐响应"""
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         
         # 检查 API 返回的错误码
         code = data.get("code", 0)
@@ -211,16 +212,11 @@ class ResponseParser:
         dramas = []
         for item in data.get("data", []):
             book_data = item.get("book_data", {})
-            
-            serial_count = book_data.get("serial_count", 0)
-            if isinstance(serial_count, str):
-                serial_count = int(serial_count) if serial_count.isdigit() else 0
-            
             dramas.append(DramaInfo(
                 book_id=str(book_data.get("book_id", "")),
                 title=book_data.get("book_name", ""),
                 cover=book_data.get("thumb_url", ""),
-                episode_cnt=serial_count,
+                episode_cnt=to_int(book_data.get("serial_count", 0)),
                 intro="",
                 type=book_data.get("category", ""),
                 author="",
@@ -233,7 +229,7 @@ class ResponseParser:
     def parse_error(json_str: str) -> ApiError:
         """解析错误响应"""
         try:
-            data = json.loads(json_str)
+            data = json_loads(json_str)
             return ApiError(
                 code=data.get("code", 0),
                 message=data.get("msg", "未知错误"),
@@ -35,7 +35,7 @@ class DownloadStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadTask:
     """下载任务"""
     drama: DramaInfo
@@ -113,9 +113,8 @@ class UnifiedService(QObject):
     def _deserialize_search_result(self, json_str: str) -> SearchResult:
         """反序列化缓存的搜索结果"""
         data = json.loads(json_str)
-        dramas = []
-        for item in data.get("data", []):
-            dramas.append(DramaInfo(
+        dramas = [
+            DramaInfo(
                 book_id=item.get("book_id", ""),
                 title=item.get("title", ""),
                 cover=item.get("cover", ""),
@@ -124,7 +123,9 @@ class UnifiedService(QObject):
                 type=item.get("type", ""),
                 author=item.get("author", ""),
                 play_cnt=item.get("play_cnt", 0)
-            ))
+            )
+            for item in data.get("data", [])
+        ]
         
         return SearchResult(
             code=data.get("code", 0),
@@ -3,6 +3,24 @@ import json
 from typing import Any, Dict, List
 from ..core.models import AppConfig, ThemeMode, DramaInfo, EpisodeInfo
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(text):
+    """解析 JSON 响应（bytes 或 str）
+
+    安装了 orjson 时使用 orjson 解析，否则回退到标准库 json。
+    orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，
+    调用方统一捕获 json.JSONDecodeError 即可。
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 def serialize_config(config: AppConfig) -> str:
     """序列化配置对象为 JSON 字符串"""
@@ -1,6 +1,8 @@
 """字符串处理工具函数"""
 from typing import List, Optional
+import hashlib
 import re
+import sys
 
 
 def trim(s: str) -> str:
@@ -38,3 +40,33 @@ def format_file_size(size_bytes: int) -> str:
             return f"{size_bytes:.1f} {unit}"
         size_bytes /= 1024
     return f"{size_bytes:.1f} TB"
+
+
+def to_int(value, default: int = 0) -> int:
+    """将 int 或数字字符串转换为 int，无法转换时返回默认值"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def stable_id(text: Optional[str]) -> str:
+    """根据文本生成跨进程稳定的短标识（内置 hash 对 str 按进程随机化）
+
+    None（如 JSON 中的 null 标题）按空字符串处理。
+    """
+    text = "" if text is None else str(text)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def is_net_link(link: str) -> bool:
+    """判断文本是否为可复制到浏览器打开的网盘链接"""
+    return link.startswith("http")
+
+
+def intern_label(value):
+    """驻留取值有限的分类标签（如类型、分类名），使重复标签共享同一对象
+
+    非字符串（如 JSON 中的 null）原样返回；不要用于标题、简介等用户内容。
+    """
+    return sys.intern(value) if type(value) is str else value
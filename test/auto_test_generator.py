@@ -142,9 +142,8 @@ class TestGenerator:
         lines = [
             f'"""自动生成的测试 - {Path(module.path).stem}',
             '', '此文件由 auto_test_generator.py 自动生成。', '"""',
-            'import pytest', 'import sys', 'from pathlib import Path',
-            'from unittest.mock import MagicMock, AsyncMock', '',
-            'sys.path.insert(0, str(Path(__file__).parent.parent))', ''
+            'import pytest',
+            'from unittest.mock import MagicMock, AsyncMock', ''
         ]
         
         import_path = self._get_import_path(module.path)
@@ -194,7 +193,6 @@ class TestGenerator:
         args_str = ", ".join("None" for _ in method.args)
         
         if method.is_async:
-            lines.append('    @pytest.mark.asyncio')
             lines.append(f'    async def test_{method.name}(self, instance):')
             lines.append(f'        """测试 {class_name}.{method.name}"""')
             lines.append(f'        result = await instance.{method.name}({args_str})')
@@ -212,7 +210,6 @@ class TestGenerator:
         args_str = ", ".join("None" for _ in func.args)
         
         if func.is_async:
-            lines.append('@pytest.mark.asyncio')
             lines.append(f'async def test_{func.name}():')
             lines.append(f'    """测试 {func.name}"""')
             lines.append(f'    result = await {func.name}({args_str})')
@@ -60,6 +60,66 @@ class TestReport:
     timestamp: str = ""
 
 
+class ResultCollector:
+    """pytest 插件：在当前进程内收集测试结果，供报告层使用"""
+    
+    def __init__(self):
+        self.results: List[TestResult] = []
+    
+    def pytest_collectreport(self, report) -> None:
+        """记录收集阶段的错误（如测试模块导入失败）"""
+        if report.failed:
+            self.results.append(self._to_result(report, TestStatus.ERROR))
+    
+    def pytest_runtest_logreport(self, report) -> None:
+        """记录每个测试的执行结果"""
+        if report.when == "call":
+            if report.passed:
+                status = TestStatus.PASSED
+            elif report.skipped:
+                status = TestStatus.SKIPPED
+            else:
+                status = TestStatus.FAILED
+        elif report.failed:
+            # setup / teardown 阶段失败视为错误
+            status = TestStatus.ERROR
+        elif report.when == "setup" and report.skipped:
+            status = TestStatus.SKIPPED
+        else:
+            return
+        self.results.append(self._to_result(report, status))
+    
+    @staticmethod
+    def _to_result(report, status: TestStatus) -> TestResult:
+        crash = getattr(report.longrepr, "reprcrash", None)
+        return TestResult(
+            name=report.nodeid,
+            status=status,
+            duration=getattr(report, "duration", 0.0),
+            error_message=crash.message if crash else (
+                report.longreprtext if status in (TestStatus.FAILED, TestStatus.ERROR) else ""
+            ),
+            error_traceback=report.longreprtext if report.failed else "",
+            file_path=report.nodeid.split("::")[0],
+            line_number=crash.lineno if crash else 0,
+        )
+    
+    def build_report(self) -> TestReport:
+        """根据收集到的结果生成测试报告"""
+        report = TestReport(results=list(self.results))
+        for result in report.results:
+            if result.status == TestStatus.PASSED:
+                report.passed += 1
+            elif result.status == TestStatus.FAILED:
+                report.failed += 1
+            elif result.status == TestStatus.ERROR:
+                report.errors += 1
+            elif result.status == TestStatus.SKIPPED:
+                report.skipped += 1
+        report.total = len(report.results)
+        return report
+
+
 class AutoTestRunner:
     """全自动测试运行器
     
@@ -100,12 +160,60 @@ class AutoTestRunner:
         
         return self.report
     
-    def run_specific_tests(self, test_pattern: str) -> TestReport:
-        """运行特定测试"""
+    def run_in_process(
+        self,
+        verbose: bool = True,
+        extra_args: Optional[List[str]] = None
+    ) -> TestReport:
+        """在当前进程内通过 pytest.main 运行测试
+        
+        省去启动子进程、重新导入项目模块的开销；结果由 ResultCollector
+        插件直接收集，无需解析 pytest 的文本输出。
+        """
+        import pytest
+        
+        print("=" * 60)
+        print("🚀 开始运行自动化测试...")
+        print("=" * 60)
+        
+        args = [
+            str(self.test_dir),
+            "--tb=short",
+            "-q" if not verbose else "-v",
+            "--no-header",
+        ]
+        if extra_args:
+            args.extend(extra_args)
+        
+        collector = ResultCollector()
+        start_time = time.time()
+        pytest.main(args, plugins=[collector])
+        
+        self.report = collector.build_report()
+        self.report.duration = time.time() - start_time
+        self.report.timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        
+        if self.report.failed > 0 or self.report.errors > 0:
+            self._analyze_errors()
+        
+        self._print_report()
+        return self.report
+    
+    def run_specific_tests(self, test_pattern: str, last_failed: bool = False) -> TestReport:
+        """运行特定测试
+        
+        Args:
+            test_pattern: pytest -k 表达式
+            last_failed: 优先只运行上次失败的测试（pytest --lf），没有失败记录时运行全部匹配测试
+        """
         print(f"🔍 运行匹配 '{test_pattern}' 的测试...")
         
+        extra_args = ["-k", test_pattern]
+        if last_failed:
+            extra_args.append("--lf")
+        
         start_time = time.time()
-        result = self._run_pytest(True, extra_args=["-k", test_pattern])
+        result = self._run_pytest(True, extra_args=extra_args)
         
         self.report = self._parse_results(result)
         self.report.duration = time.time() - start_time
@@ -3,29 +3,57 @@
 提供测试所需的通用配置、mock 对象和 fixtures。
 支持自动化测试和未来新代码测试。
 """
+from __future__ import annotations
+
 import sys
-import asyncio
+import functools
+import importlib.abc
+import importlib.util
+import types
 import tempfile
 import shutil
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Any
-from unittest.mock import MagicMock, AsyncMock
+from typing import TYPE_CHECKING, Generator, Any
+from unittest.mock import MagicMock, AsyncMock, patch
 from dataclasses import dataclass
+from enum import Enum
 
 import pytest
+import pytest_asyncio
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from test.helpers import async_return, dumps_json
+
+if TYPE_CHECKING:
+    from src.core.models import (
+        DramaInfo, EpisodeInfo, VideoInfo, SearchResult,
+        EpisodeList, CategoryResult, ApiResponse, ApiError,
+        AppConfig
+    )
 
 
 # ==================== Qt Mock 设置 ====================
-# 在导入任何可能依赖 Qt 的模块之前设置 mock
+# PySide6 不可用时注册导入钩子：只有在首次导入 PySide6 / qfluentwidgets 时
+# 才安装 mock，纯模型/适配器测试不再为 Qt mock 付出任何开销
+
+_QT_MOCK_SENTINEL = '__duanju_qt_mocked__'
+
 
 def _setup_qt_mocks():
-    """设置 Qt mock（如果 PySide6 不可用）"""
-    try:
-        import PySide6
-        # PySide6 可用，不需要 mock
-        return False
-    except ImportError:
-        pass
+    """安装 Qt mock 模块
+    
+    安装后在 sys.modules 中留下哨兵，conftest 被重复导入时直接复用已安装的 mock。
+    已存在的条目（如测试通过 patch.dict 注入的 mock）不会被覆盖。
+    """
+    if _QT_MOCK_SENTINEL in sys.modules:
+        return True
     
     # 创建 mock 模块
     class MockSignal:
@@ -72,37 +100,79 @@ def _setup_qt_mocks():
     mock_qtcore.QUrl = MagicMock()
     mock_qtcore.Qt = MagicMock()
     
-    mock_qtwidgets = MagicMock()
-    mock_qtgui = MagicMock()
-    mock_qtnetwork = MagicMock()
+    class LazyMockModule(types.ModuleType):
+        """按需创建属性的 mock 模块
+
+        只有被实际访问的属性才会构造 MagicMock，并缓存在模块上，
+        避免为整个模块预先搭建 MagicMock 子树。
+        """
+        def __getattr__(self, name):
+            if name.startswith('__'):
+                raise AttributeError(name)
+            value = MagicMock(name=f"{self.__name__}.{name}")
+            setattr(self, name, value)
+            return value
+    
+    mock_qtwidgets = LazyMockModule('PySide6.QtWidgets')
+    mock_qtgui = LazyMockModule('PySide6.QtGui')
+    mock_qtnetwork = LazyMockModule('PySide6.QtNetwork')
     
-    mock_pyside6 = MagicMock()
+    mock_pyside6 = types.ModuleType('PySide6')
     mock_pyside6.QtCore = mock_qtcore
     mock_pyside6.QtWidgets = mock_qtwidgets
     mock_pyside6.QtGui = mock_qtgui
     mock_pyside6.QtNetwork = mock_qtnetwork
     
-    mock_fluent = MagicMock()
-    mock_fluent.setTheme = MagicMock()
-    mock_fluent.setThemeColor = MagicMock()
-    mock_fluent.isDarkTheme = MagicMock(return_value=False)
-    mock_fluent.Theme = MagicMock()
+    class MockTheme(Enum):
+        LIGHT = "Light"
+        DARK = "Dark"
+        AUTO = "Auto"
     
-    sys.modules['PySide6'] = mock_pyside6
-    sys.modules['PySide6.QtCore'] = mock_qtcore
-    sys.modules['PySide6.QtWidgets'] = mock_qtwidgets
-    sys.modules['PySide6.QtGui'] = mock_qtgui
-    sys.modules['PySide6.QtNetwork'] = mock_qtnetwork
-    sys.modules['qfluentwidgets'] = mock_fluent
+    mock_fluent = LazyMockModule('qfluentwidgets')
+    mock_fluent.setTheme = lambda *args, **kwargs: None
+    mock_fluent.setThemeColor = lambda *args, **kwargs: None
+    mock_fluent.isDarkTheme = lambda: False
+    mock_fluent.Theme = MockTheme
+    
+    sys.modules.setdefault('PySide6', mock_pyside6)
+    sys.modules.setdefault('PySide6.QtCore', mock_qtcore)
+    sys.modules.setdefault('PySide6.QtWidgets', mock_qtwidgets)
+    sys.modules.setdefault('PySide6.QtGui', mock_qtgui)
+    sys.modules.setdefault('PySide6.QtNetwork', mock_qtnetwork)
+    sys.modules.setdefault('qfluentwidgets', mock_fluent)
+    sys.modules[_QT_MOCK_SENTINEL] = types.ModuleType(_QT_MOCK_SENTINEL)
     
     return True
 
-# 尝试设置 Qt mock
-_qt_mocked = _setup_qt_mocks()
 
-# 添加项目根目录到 Python 路径
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+class _InstalledModuleLoader(importlib.abc.Loader):
+    """直接返回已放入 sys.modules 的 mock 模块"""
+    
+    def create_module(self, spec):
+        return sys.modules[spec.name]
+    
+    def exec_module(self, module):
+        pass
+
+
+class _QtMockFinder(importlib.abc.MetaPathFinder):
+    """首次导入 Qt 相关模块时才安装 mock"""
+    
+    _ROOT_MODULES = ('PySide6', 'qfluentwidgets')
+    
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.partition('.')[0] not in self._ROOT_MODULES:
+            return None
+        _setup_qt_mocks()
+        if fullname not in sys.modules:
+            return None
+        return importlib.util.spec_from_loader(fullname, _InstalledModuleLoader())
+
+
+# PySide6 不可用时才需要 mock
+_qt_mocked = importlib.util.find_spec('PySide6') is None
+if _qt_mocked and not any(isinstance(f, _QtMockFinder) for f in sys.meta_path):
+    sys.meta_path.insert(0, _QtMockFinder())
 
 
 # ==================== pytest 配置 ====================
@@ -115,9 +185,28 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: 慢速测试")
 
 
+if UVLOOP_AVAILABLE:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """安装了 uvloop（Windows 不支持）时用它创建测试事件循环
+
+        只注册一个工厂，pytest-asyncio 不会因此给测试 ID 追加后缀；
+        工厂按 pytest.ini 的 asyncio_default_test_loop_scope 参数化，整个会话只创建一个循环。
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
 def pytest_collection_modifyitems(config, items):
     """修改测试收集"""
+    # 异步测试默认共享同一个会话级事件循环（与 asyncio_default_fixture_loop_scope 一致）；
+    # 已显式指定 loop_scope 的测试保持原样（auto 模式自动添加的是不带参数的 asyncio 标记）
+    session_loop_marker = pytest.mark.asyncio(loop_scope="session")
     for item in items:
+        if pytest_asyncio.is_async_test(item):
+            marker = item.get_closest_marker("asyncio")
+            if marker is None or not (marker.args or "loop_scope" in marker.kwargs):
+                item.add_marker(session_loop_marker, append=False)
+        
         # 自动标记测试类型
         if "integration" in item.nodeid:
             item.add_marker(pytest.mark.integration)
@@ -126,62 +215,61 @@ def pytest_collection_modifyitems(config, items):
         else:
             item.add_marker(pytest.mark.unit)
 
-from src.core.models import (
-    DramaInfo, EpisodeInfo, VideoInfo, SearchResult,
-    EpisodeList, CategoryResult, ApiResponse, ApiError,
-    AppConfig, ThemeMode
-)
-
-
-# ==================== 事件循环配置 ====================
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """创建事件循环供异步测试使用"""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@functools.cache
+def _models():
+    """延迟导入数据模型模块，只有用到模型的 fixture 才付出导入开销"""
+    from src.core import models
+    return models
 
 
 # ==================== 模拟数据 Fixtures ====================
+# 样例数据的构造参数（关键字参数字典）在模块加载时生成一次，
+# fixture 每次按参数新建对象：省去逐项格式化与深拷贝，测试之间也互不共享对象。
+
+_SAMPLE_DRAMA_FIELDS = dict(
+    book_id="test_001",
+    title="测试短剧",
+    cover="https://example.com/cover.jpg",
+    episode_cnt=20,
+    intro="这是一部测试短剧的简介",
+    type="都市",
+    author="测试作者",
+    play_cnt=10000,
+)
+
 
 @pytest.fixture
 def sample_drama() -> DramaInfo:
     """示例短剧数据"""
-    return DramaInfo(
-        book_id="test_001",
-        title="测试短剧",
-        cover="https://example.com/cover.jpg",
-        episode_cnt=20,
-        intro="这是一部测试短剧的简介",
-        type="都市",
-        author="测试作者",
-        play_cnt=10000
+    return _models().DramaInfo(**_SAMPLE_DRAMA_FIELDS)
+
+
+_SAMPLE_DRAMA_LIST_FIELDS = tuple(
+    dict(
+        book_id=f"drama_{i}",
+        title=f"短剧{i}",
+        cover=f"https://example.com/cover_{i}.jpg",
+        episode_cnt=10 + i,
+        intro=f"短剧{i}的简介",
+        type="都市" if i % 2 == 0 else "甜宠",
+        author=f"作者{i}",
+        play_cnt=1000 * i,
     )
+    for i in range(1, 6)
+)
 
 
 @pytest.fixture
 def sample_drama_list() -> list[DramaInfo]:
     """示例短剧列表"""
-    return [
-        DramaInfo(
-            book_id=f"drama_{i}",
-            title=f"短剧{i}",
-            cover=f"https://example.com/cover_{i}.jpg",
-            episode_cnt=10 + i,
-            intro=f"短剧{i}的简介",
-            type="都市" if i % 2 == 0 else "甜宠",
-            author=f"作者{i}",
-            play_cnt=1000 * i
-        )
-        for i in range(1, 6)
-    ]
+    DramaInfo = _models().DramaInfo
+    return [DramaInfo(**kw) for kw in _SAMPLE_DRAMA_LIST_FIELDS]
 
 
 @pytest.fixture
 def sample_episode() -> EpisodeInfo:
     """示例剧集数据"""
-    return EpisodeInfo(
+    return _models().EpisodeInfo(
         video_id="video_001",
         title="第1集",
         episode_number=1,
@@ -189,35 +277,39 @@ def sample_episode() -> EpisodeInfo:
     )
 
 
+_SAMPLE_EPISODE_FIELDS = tuple(
+    dict(
+        video_id=f"video_{i:03d}",
+        title=f"第{i}集",
+        episode_number=i,
+        chapter_word_number=0,
+    )
+    for i in range(1, 21)
+)
+
+
 @pytest.fixture
-def sample_episode_list(sample_drama: DramaInfo) -> EpisodeList:
+def sample_episode_list() -> EpisodeList:
     """示例剧集列表"""
-    episodes = [
-        EpisodeInfo(
-            video_id=f"video_{i:03d}",
-            title=f"第{i}集",
-            episode_number=i,
-            chapter_word_number=0
-        )
-        for i in range(1, 21)
-    ]
-    return EpisodeList(
+    models = _models()
+    drama = _SAMPLE_DRAMA_FIELDS
+    return models.EpisodeList(
         code=200,
-        book_name=sample_drama.title,
-        episodes=episodes,
+        book_name=drama["title"],
+        episodes=[models.EpisodeInfo(**kw) for kw in _SAMPLE_EPISODE_FIELDS],
         total=20,
-        book_id=sample_drama.book_id,
-        author=sample_drama.author,
-        category=sample_drama.type,
-        desc=sample_drama.intro,
-        book_pic=sample_drama.cover
+        book_id=drama["book_id"],
+        author=drama["author"],
+        category=drama["type"],
+        desc=drama["intro"],
+        book_pic=drama["cover"]
     )
 
 
 @pytest.fixture
 def sample_video_info() -> VideoInfo:
     """示例视频信息"""
-    return VideoInfo(
+    return _models().VideoInfo(
         code=200,
         url="https://example.com/video.m3u8",
         pic="https://example.com/pic.jpg",
@@ -231,7 +323,7 @@ def sample_video_info() -> VideoInfo:
 @pytest.fixture
 def sample_search_result(sample_drama_list: list[DramaInfo]) -> SearchResult:
     """示例搜索结果"""
-    return SearchResult(
+    return _models().SearchResult(
         code=200,
         msg="搜索成功",
         data=sample_drama_list,
@@ -242,7 +334,7 @@ def sample_search_result(sample_drama_list: list[DramaInfo]) -> SearchResult:
 @pytest.fixture
 def sample_category_result(sample_drama_list: list[DramaInfo]) -> CategoryResult:
     """示例分类结果"""
-    return CategoryResult(
+    return _models().CategoryResult(
         code=200,
         category="都市",
         data=sample_drama_list,
@@ -253,7 +345,7 @@ def sample_category_result(sample_drama_list: list[DramaInfo]) -> CategoryResult
 @pytest.fixture
 def sample_api_response() -> ApiResponse:
     """示例 API 响应"""
-    return ApiResponse(
+    return _models().ApiResponse(
         status_code=200,
         body='{"code": 200, "msg": "success", "data": []}',
         error="",
@@ -264,112 +356,216 @@ def sample_api_response() -> ApiResponse:
 @pytest.fixture
 def sample_api_error() -> ApiError:
     """示例 API 错误"""
-    return ApiError(
+    return _models().ApiError(
         code=500,
         message="服务器内部错误",
         details="Connection timeout"
     )
 
 
+# theme_mode 需要延迟导入的 ThemeMode，由 fixture 补上
+_SAMPLE_CONFIG_FIELDS = dict(
+    api_timeout=10000,
+    default_quality="1080p",
+    current_provider="cenguigui",
+    enable_cache=True,
+    cache_ttl=300000,
+    max_retries=3,
+)
+
+
 @pytest.fixture
 def sample_config() -> AppConfig:
     """示例应用配置"""
-    return AppConfig(
-        api_timeout=10000,
-        default_quality="1080p",
-        theme_mode=ThemeMode.AUTO,
-        current_provider="cenguigui",
-        enable_cache=True,
-        cache_ttl=300000,
-        max_retries=3
-    )
+    models = _models()
+    return models.AppConfig(theme_mode=models.ThemeMode.AUTO, **_SAMPLE_CONFIG_FIELDS)
 
 
 # ==================== Mock Fixtures ====================
+# mock 对象在会话级只构造一次，每个测试开始前重置调用记录、返回值，
+# 并挂回可能被测试替换掉的子 mock，保证测试之间相互隔离。
+# 只返回固定值、无需断言调用的异步方法使用普通 async 桩函数。
+
+def _reset_shared_mock(mock: MagicMock, children: dict[str, MagicMock]) -> None:
+    """重置会话级共享 mock 及其默认子 mock"""
+    mock.reset_mock(return_value=True, side_effect=True)
+    for name, child in children.items():
+        child.reset_mock(return_value=True, side_effect=True)
+        setattr(mock, name, child)
+
+
+@pytest.fixture(scope="session")
+def _mock_api_client_session() -> tuple[MagicMock, dict[str, MagicMock]]:
+    """会话级 API 客户端 mock"""
+    return MagicMock(), {
+        "set_timeout": MagicMock(),
+    }
+
 
 @pytest.fixture
-def mock_api_client() -> MagicMock:
+def mock_api_client(_mock_api_client_session) -> MagicMock:
     """模拟 API 客户端"""
-    client = MagicMock()
-    client.get = AsyncMock(return_value=ApiResponse(
+    client, children = _mock_api_client_session
+    _reset_shared_mock(client, children)
+    client.get = async_return(_models().ApiResponse(
         status_code=200,
         body='{"code": 200, "data": []}',
         success=True
     ))
-    client.set_timeout = MagicMock()
     client.base_url = "https://api.example.com"
     client.timeout = 10000
     return client
 
 
+def _join_cache_key(*args: str) -> str:
+    """mock 缓存管理器的 generate_key 实现"""
+    return "_".join(args)
+
+
+@pytest.fixture(scope="session")
+def _mock_cache_manager_session() -> tuple[MagicMock, dict[str, MagicMock]]:
+    """会话级缓存管理器 mock"""
+    return MagicMock(), {
+        "get": MagicMock(),
+        "set": MagicMock(),
+        "clear": MagicMock(),
+    }
+
+
 @pytest.fixture
-def mock_cache_manager() -> MagicMock:
+def mock_cache_manager(_mock_cache_manager_session) -> MagicMock:
     """模拟缓存管理器"""
-    cache = MagicMock()
-    cache.get = MagicMock(return_value=None)
-    cache.set = MagicMock()
-    cache.clear = MagicMock()
-    cache.generate_key = MagicMock(side_effect=lambda *args: "_".join(args))
+    cache, children = _mock_cache_manager_session
+    _reset_shared_mock(cache, children)
+    cache.get.return_value = None
+    cache.generate_key = _join_cache_key
     return cache
 
 
+@pytest.fixture(scope="session")
+def _mock_provider_session() -> tuple[MagicMock, dict[str, MagicMock]]:
+    """会话级数据提供者 mock"""
+    return MagicMock(), {
+        "info": MagicMock(),
+        "search": AsyncMock(),
+        "get_category_dramas": AsyncMock(),
+        "get_episodes": AsyncMock(),
+        "get_video_url": AsyncMock(),
+        "get_recommendations": AsyncMock(),
+    }
+
+
 @pytest.fixture
-def mock_provider() -> MagicMock:
+def mock_provider(_mock_provider_session) -> MagicMock:
     """模拟数据提供者"""
-    provider = MagicMock()
-    provider.info = MagicMock()
+    provider, children = _mock_provider_session
+    _reset_shared_mock(provider, children)
     provider.info.id = "test_provider"
     provider.info.name = "测试提供者"
-    provider.search = AsyncMock()
-    provider.get_categories = AsyncMock(return_value=["都市", "甜宠", "悬疑"])
-    provider.get_category_dramas = AsyncMock()
-    provider.get_episodes = AsyncMock()
-    provider.get_video_url = AsyncMock()
-    provider.get_recommendations = AsyncMock()
+    provider.get_categories = async_return(["都市", "甜宠", "悬疑"])
     return provider
 
 
+@pytest.fixture
+def mock_aiohttp_session():
+    """构造替换 aiohttp.ClientSession 的 mock 会话工厂
+
+    用法：with mock_aiohttp_session(status, body) as (session_cls, session): ...
+    响应的 read()/text() 均返回 body，charset 模拟 Content-Type 声明的编码；
+    传入 side_effect 时 session.get 直接抛出该异常。
+    响应与上下文协议方法使用普通 async 桩函数，只有 session.get 保留调用记录。
+    """
+    import aiohttp
+    
+    @contextmanager
+    def _make(status=200, body=b"", side_effect=None, charset=None):
+        mock_response = MagicMock()
+        mock_response.status = status
+        mock_response.charset = charset
+        mock_response.read = async_return(body)
+        mock_response.text = async_return(body)
+        
+        mock_session = MagicMock()
+        if side_effect is not None:
+            mock_session.get = MagicMock(side_effect=side_effect)
+        else:
+            mock_session.get = MagicMock(return_value=MagicMock(
+                __aenter__=async_return(mock_response),
+                __aexit__=async_return(None)
+            ))
+        mock_session.__aenter__ = async_return(mock_session)
+        mock_session.__aexit__ = async_return(None)
+        
+        with patch.object(aiohttp, 'ClientSession', return_value=mock_session) as mock_session_class:
+            yield mock_session_class, mock_session
+    
+    return _make
+
+
 # ==================== 辅助函数 ====================
 
 def create_mock_response(data: dict, success: bool = True) -> ApiResponse:
     """创建模拟 API 响应"""
-    import json
-    return ApiResponse(
+    return _models().ApiResponse(
         status_code=200 if success else 500,
-        body=json.dumps(data),
+        body=dumps_json(data),
         error="" if success else "Error",
         success=success
     )
 
 
 # ==================== 临时目录 Fixtures ====================
+# 有 /dev/shm（内存文件系统）时把临时文件放在内存中，避免管理器测试落盘；
+# 否则（如 Windows）退回 pytest 的 tmp_path_factory。
+
+_RAMFS_DIR = Path("/dev/shm")
+
+
+@pytest.fixture(scope="session")
+def _ramfs_root(tmp_path_factory) -> Generator[Path, None, None]:
+    """会话级临时根目录（优先使用内存文件系统）"""
+    if _RAMFS_DIR.is_dir():
+        root = Path(tempfile.mkdtemp(prefix="duanju-tests-", dir=_RAMFS_DIR))
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("duanju")
+
 
 @pytest.fixture
-def temp_dir(tmp_path):
+def _ram_tmp_path(_ramfs_root: Path) -> Path:
+    """每个测试独立的临时目录"""
+    path = _ramfs_root / uuid.uuid4().hex
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def temp_dir(_ram_tmp_path):
     """创建临时目录"""
-    return tmp_path
+    return _ram_tmp_path
 
 
 @pytest.fixture
-def temp_config_file(tmp_path):
+def temp_config_file(_ram_tmp_path):
     """创建临时配置文件"""
-    config_dir = tmp_path / "config"
+    config_dir = _ram_tmp_path / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir / "config.json"
 
 
 @pytest.fixture
-def temp_data_dir(tmp_path):
+def temp_data_dir(_ram_tmp_path):
     """创建临时数据目录"""
-    data_dir = tmp_path / "data"
+    data_dir = _ram_tmp_path / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
 
 
 @pytest.fixture
-def temp_cache_dir(tmp_path):
+def temp_cache_dir(_ram_tmp_path):
     """创建临时缓存目录"""
-    cache_dir = tmp_path / "cache"
+    cache_dir = _ram_tmp_path / "cache"
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir
 
@@ -409,74 +605,80 @@ def history_manager(temp_data_dir):
 
 
 # ==================== API 响应 Fixtures ====================
+# JSON 字符串不可变，模块加载时序列化一次，fixture 直接返回
+
+_SEARCH_RESPONSE_JSON = dumps_json({
+    "code": 200,
+    "msg": "搜索成功",
+    "page": 1,
+    "data": [
+        {
+            "book_id": "123",
+            "title": "测试短剧",
+            "cover": "https://example.com/cover.jpg",
+            "episode_cnt": 20,
+            "intro": "简介",
+            "type": "都市",
+            "author": "作者",
+            "play_cnt": 10000
+        }
+    ]
+})
+
+_EPISODE_RESPONSE_JSON = dumps_json({
+    "code": 200,
+    "book_name": "测试短剧",
+    "book_id": "123",
+    "total": 20,
+    "data": [
+        {"video_id": f"v{i}", "title": f"第{i}集", "chapter_word_number": 0}
+        for i in range(1, 21)
+    ]
+})
+
+_VIDEO_RESPONSE_JSON = dumps_json({
+    "code": 200,
+    "data": {
+        "url": "https://example.com/video.m3u8",
+        "pic": "https://example.com/pic.jpg",
+        "title": "第1集",
+        "info": {
+            "quality": "1080p",
+            "duration": "05:30",
+            "size_str": "50MB"
+        }
+    }
+})
+
+_ERROR_RESPONSE_JSON = dumps_json({
+    "code": 500,
+    "msg": "服务器内部错误",
+    "tips": "请稍后重试"
+})
+
 
 @pytest.fixture
 def mock_search_response_json():
     """模拟搜索响应 JSON"""
-    import json
-    return json.dumps({
-        "code": 200,
-        "msg": "搜索成功",
-        "page": 1,
-        "data": [
-            {
-                "book_id": "123",
-                "title": "测试短剧",
-                "cover": "https://example.com/cover.jpg",
-                "episode_cnt": 20,
-                "intro": "简介",
-                "type": "都市",
-                "author": "作者",
-                "play_cnt": 10000
-            }
-        ]
-    })
+    return _SEARCH_RESPONSE_JSON
 
 
 @pytest.fixture
 def mock_episode_response_json():
     """模拟剧集响应 JSON"""
-    import json
-    return json.dumps({
-        "code": 200,
-        "book_name": "测试短剧",
-        "book_id": "123",
-        "total": 20,
-        "data": [
-            {"video_id": f"v{i}", "title": f"第{i}集", "chapter_word_number": 0}
-            for i in range(1, 21)
-        ]
-    })
+    return _EPISODE_RESPONSE_JSON
 
 
 @pytest.fixture
 def mock_video_response_json():
     """模拟视频响应 JSON"""
-    import json
-    return json.dumps({
-        "code": 200,
-        "data": {
-            "url": "https://example.com/video.m3u8",
-            "pic": "https://example.com/pic.jpg",
-            "title": "第1集",
-            "info": {
-                "quality": "1080p",
-                "duration": "05:30",
-                "size_str": "50MB"
-            }
-        }
-    })
+    return _VIDEO_RESPONSE_JSON
 
 
 @pytest.fixture
 def mock_error_response_json():
     """模拟错误响应 JSON"""
-    import json
-    return json.dumps({
-        "code": 500,
-        "msg": "服务器内部错误",
-        "tips": "请稍后重试"
-    })
+    return _ERROR_RESPONSE_JSON
 
 
 # ==================== 辅助函数 ====================
@@ -490,8 +692,7 @@ def assert_drama_valid(drama: DramaInfo):
 
 def assert_episode_valid(episode):
     """断言剧集数据有效"""
-    from src.core.models import EpisodeInfo
-    assert isinstance(episode, EpisodeInfo)
+    assert isinstance(episode, _models().EpisodeInfo)
     assert episode.video_id, "video_id 不能为空"
     assert episode.title, "title 不能为空"
 
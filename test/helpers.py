@@ -0,0 +1,26 @@
+"""测试辅助函数
+
+conftest 与各测试模块共用的小工具，避免在多个文件中重复实现。
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any) -> str:
+    """序列化测试 JSON；安装了 orjson 时使用其 C 实现编码"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+def async_return(value: Any):
+    """返回固定值的异步桩函数，调用时不经过 AsyncMock 的调用记录开销"""
+    async def _stub(*args, **kwargs):
+        return value
+    return _stub
@@ -13,21 +13,24 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 
 def run_all_tests(verbose: bool = False):
-    """运行所有测试"""
+    """运行所有测试（在当前进程内执行 pytest）"""
     from test.auto_test_runner import AutoTestRunner
     
     runner = AutoTestRunner()
-    report = runner.run_all_tests(verbose=verbose)
+    report = runner.run_in_process(verbose=verbose)
     
     return report.failed == 0 and report.errors == 0
 
 
-def run_quick_tests():
-    """运行快速测试（只运行单元测试）"""
+def run_quick_tests(last_failed: bool = False):
+    """运行快速测试（只运行单元测试）
+    
+    last_failed 为 True 时使用 pytest --lf，只重跑上次失败的单元测试。
+    """
     from test.auto_test_runner import AutoTestRunner
     
     runner = AutoTestRunner()
-    report = runner.run_specific_tests("not integration")
+    report = runner.run_specific_tests("not integration", last_failed=last_failed)
     
     return report.failed == 0 and report.errors == 0
 
@@ -64,7 +67,7 @@ def generate_report(output_path: str):
     from test.auto_test_runner import AutoTestRunner
     
     runner = AutoTestRunner()
-    report = runner.run_all_tests(verbose=False)
+    report = runner.run_in_process(verbose=False)
     runner.generate_json_report(Path(output_path))
     
     print(f"📄 报告已生成: {output_path}")
@@ -80,6 +83,7 @@ def main():
   python run_tests.py              # 运行所有测试
   python run_tests.py -v           # 详细模式运行
   python run_tests.py -q           # 快速测试
+  python run_tests.py -q --lf      # 快速测试，只重跑上次失败的测试
   python run_tests.py -a           # AI 分析
   python run_tests.py -r report.json  # 生成报告
         """
@@ -95,6 +99,12 @@ def main():
         action="store_true",
         help="快速测试模式（跳过集成测试）"
     )
+    parser.add_argument(
+        "--lf", "--last-failed",
+        dest="last_failed",
+        action="store_true",
+        help="快速测试时只重跑上次失败的测试"
+    )
     parser.add_argument(
         "-a", "--analyze",
         action="store_true",
@@ -114,7 +124,7 @@ def main():
     if args.analyze:
         success = run_ai_analysis()
     elif args.quick:
-        success = run_quick_tests()
+        success = run_quick_tests(last_failed=args.last_failed)
     elif args.report:
         success = generate_report(args.report)
     else:
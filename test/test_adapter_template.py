@@ -1,17 +1,26 @@
 """适配器模板测试"""
+import re
 import pytest
 import asyncio
 import time
-from unittest.mock import MagicMock, AsyncMock, patch
+from collections import deque
 
 from src.data.providers.adapters.adapter_template import TemplateAdapter
 from src.core.models import DramaInfo, EpisodeInfo
 
+# pytest.raises 的 match 模式在模块加载时编译一次
+_SEARCH_NOT_IMPLEMENTED = re.compile("请实现 search 方法")
+_CATEGORY_DRAMAS_NOT_IMPLEMENTED = re.compile("请实现 get_category_dramas 方法")
+_RECOMMENDATIONS_NOT_IMPLEMENTED = re.compile("请实现 get_recommendations 方法")
+_EPISODES_NOT_IMPLEMENTED = re.compile("请实现 get_episodes 方法")
+_VIDEO_URL_NOT_IMPLEMENTED = re.compile("请实现 get_video_url 方法")
+_HTTP_500 = re.compile("HTTP 500")
+
 
 class TestTemplateAdapter:
     """测试模板适配器"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def adapter(self):
         return TemplateAdapter(timeout=10000)
     
@@ -39,7 +48,6 @@ class TestTemplateAdapter:
         assert isinstance(categories, list)
         assert len(categories) > 0
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, adapter):
         """测试获取分类"""
         categories = await adapter.get_categories()
@@ -101,48 +109,47 @@ class TestTemplateAdapter:
         assert episode.title == "第5集"
         assert episode.episode_number == 5
     
-    @pytest.mark.asyncio
     async def test_search_not_implemented(self, adapter):
         """测试搜索未实现"""
-        with pytest.raises(NotImplementedError, match="请实现 search 方法"):
+        with pytest.raises(NotImplementedError, match=_SEARCH_NOT_IMPLEMENTED):
             await adapter.search("test")
     
-    @pytest.mark.asyncio
     async def test_get_category_dramas_not_implemented(self, adapter):
         """测试分类短剧未实现"""
-        with pytest.raises(NotImplementedError, match="请实现 get_category_dramas 方法"):
+        with pytest.raises(NotImplementedError, match=_CATEGORY_DRAMAS_NOT_IMPLEMENTED):
             await adapter.get_category_dramas("都市")
     
-    @pytest.mark.asyncio
     async def test_get_recommendations_not_implemented(self, adapter):
         """测试推荐未实现"""
-        with pytest.raises(NotImplementedError, match="请实现 get_recommendations 方法"):
+        with pytest.raises(NotImplementedError, match=_RECOMMENDATIONS_NOT_IMPLEMENTED):
             await adapter.get_recommendations()
     
-    @pytest.mark.asyncio
     async def test_get_episodes_not_implemented(self, adapter):
         """测试剧集未实现"""
-        with pytest.raises(NotImplementedError, match="请实现 get_episodes 方法"):
+        with pytest.raises(NotImplementedError, match=_EPISODES_NOT_IMPLEMENTED):
             await adapter.get_episodes("drama_001")
     
-    @pytest.mark.asyncio
     async def test_get_video_url_not_implemented(self, adapter):
         """测试视频地址未实现"""
-        with pytest.raises(NotImplementedError, match="请实现 get_video_url 方法"):
+        with pytest.raises(NotImplementedError, match=_VIDEO_URL_NOT_IMPLEMENTED):
             await adapter.get_video_url("video_001")
 
 
 class TestTemplateAdapterRateLimit:
     """测试限流功能"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def adapter(self):
         adapter = TemplateAdapter(timeout=10000)
         adapter.RATE_LIMIT_WINDOW = 1.0
         adapter.RATE_LIMIT_MAX_REQUESTS = 3
         return adapter
     
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def _reset_rate_limit(self, adapter):
+        """共享适配器实例，每个测试前清空限流记录"""
+        adapter._request_timestamps.clear()
+    
     async def test_rate_limit_tracking(self, adapter):
         """测试限流时间戳记录"""
         await adapter._wait_for_rate_limit()
@@ -151,57 +158,32 @@ class TestTemplateAdapterRateLimit:
         await adapter._wait_for_rate_limit()
         assert len(adapter._request_timestamps) == 2
     
-    @pytest.mark.asyncio
     async def test_rate_limit_cleanup(self, adapter):
         """测试过期时间戳清理"""
-        adapter._request_timestamps.append(time.monotonic() - 10)
-        adapter._request_timestamps.append(time.monotonic() - 10)
+        stale = time.monotonic() - 10
+        adapter._request_timestamps.extend((stale, stale))
         
         await adapter._wait_for_rate_limit()
         assert len(adapter._request_timestamps) == 1
     
-    @pytest.mark.asyncio
-    async def test_request_method(self, adapter):
-        """测试请求方法（模拟）"""
-        import aiohttp
+    async def test_rate_limit_cleanup_keeps_recent(self, adapter):
+        """测试只从队首清理过期时间戳，窗口内的记录保持原有顺序"""
+        assert isinstance(adapter._request_timestamps, deque)
+        recent = time.monotonic() - 0.5
+        adapter._request_timestamps.extend([time.monotonic() - 10, recent])
         
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"data": "test"}')
-        
-        async def mock_get(*args, **kwargs):
-            return mock_response
-        
-        with patch.object(aiohttp, 'ClientSession') as mock_session_class:
-            mock_session = MagicMock()
-            mock_session.get = MagicMock(return_value=MagicMock(
-                __aenter__=AsyncMock(return_value=mock_response),
-                __aexit__=AsyncMock(return_value=None)
-            ))
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock(return_value=None)
-            mock_session_class.return_value = mock_session
-            
+        await adapter._wait_for_rate_limit()
+        assert len(adapter._request_timestamps) == 2
+        assert adapter._request_timestamps[0] == recent
+    
+    async def test_request_method(self, adapter, mock_aiohttp_session):
+        """测试请求方法（模拟）"""
+        with mock_aiohttp_session(200, '{"data": "test"}'):
             result = await adapter._request({"key": "value"})
             assert result == '{"data": "test"}'
     
-    @pytest.mark.asyncio
-    async def test_request_error(self, adapter):
+    async def test_request_error(self, adapter, mock_aiohttp_session):
         """测试请求错误"""
-        import aiohttp
-        
-        mock_response = MagicMock()
-        mock_response.status = 500
-        
-        with patch.object(aiohttp, 'ClientSession') as mock_session_class:
-            mock_session = MagicMock()
-            mock_session.get = MagicMock(return_value=MagicMock(
-                __aenter__=AsyncMock(return_value=mock_response),
-                __aexit__=AsyncMock(return_value=None)
-            ))
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock(return_value=None)
-            mock_session_class.return_value = mock_session
-            
-            with pytest.raises(Exception, match="HTTP 500"):
+        with mock_aiohttp_session(500):
+            with pytest.raises(Exception, match=_HTTP_500):
                 await adapter._request({})
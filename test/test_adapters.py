@@ -1,11 +1,8 @@
 """API 适配器测试"""
 from collections import deque
-from unittest.mock import AsyncMock, MagicMock, patch
-from unittest.mock import MagicMock, AsyncMock, patch
-from unittest.mock import MagicMock, patch, AsyncMock
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
 import asyncio
-import json
-import re
 import time
 
 import aiohttp
@@ -14,48 +11,217 @@ import pytest
 from src.core.models import (
     DramaInfo, EpisodeInfo, EpisodeList, VideoInfo, SearchResult, CategoryResult
 )
-from src.core.models import DramaInfo, EpisodeInfo, SearchResult, CategoryResult
 from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
 from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
 from src.data.providers.adapters.uuuka_adapter import UuukaAdapter
+from src.utils.json_serializer import json_loads
+from src.utils.string_utils import stable_id, to_int
+from test.helpers import async_return, dumps_json
 
-class TestCenguiguiAdapter:
-    """Cenguigui 适配器测试"""
+
+# 适配器实例在模块内共享，只读测试无需每次重新构造
+@pytest.fixture(scope="module")
+def cenguigui():
+    return CenguiguiAdapter()
+
+
+@pytest.fixture(scope="module")
+def uuuka():
+    return UuukaAdapter()
+
+
+@pytest.fixture(scope="module")
+def duanju_search():
+    return DuanjuSearchAdapter()
+
+
+# 各测试类共用的响应数据，在模块加载时构造一次（只读，不要在测试中修改）
+# Cenguigui 接口返回 JSON 文本，由适配器的 _parse_* 方法解析
+_CENGUI_SEARCH_JSON = dumps_json({
+    "code": 200,
+    "msg": "success",
+    "page": 1,
+    "data": [
+        {
+            "book_id": "123",
+            "title": "测试短剧",
+            "cover": "https://example.com/cover.jpg",
+            "episode_cnt": 20,
+            "intro": "简介",
+            "type": "都市",
+            "author": "作者",
+            "play_cnt": 10000
+        }
+    ]
+})
+
+_CENGUI_SEARCH_STRING_PAGE_JSON = dumps_json({
+    "code": 200,
+    "msg": "success",
+    "page": "2",
+    "data": []
+})
+
+_CENGUI_CATEGORY_JSON = dumps_json({
+    "code": 200,
+    "data": [
+        {
+            "book_id": "456",
+            "title": "分类短剧",
+            "cover": "https://example.com/cover2.jpg",
+            "episode_cnt": 15,
+            "video_desc": "描述",
+            "sub_title": "霸总",
+            "play_cnt": 5000
+        }
+    ]
+})
+
+# serial_count 为字符串，覆盖 to_int 转换
+_CENGUI_RECOMMENDATIONS_JSON = dumps_json({
+    "code": 200,
+    "data": [
+        {
+            "book_data": {
+                "book_id": "789",
+                "book_name": "推荐短剧",
+                "thumb_url": "https://example.com/thumb.jpg",
+                "serial_count": "30",
+                "category": "悬疑"
+            },
+            "hot": 8000
+        }
+    ]
+})
+
+# total 为字符串，覆盖 to_int 转换
+_CENGUI_EPISODE_LIST_JSON = dumps_json({
+    "code": 200,
+    "book_name": "测试短剧",
+    "book_id": "123",
+    "total": "20",
+    "author": "作者",
+    "category": "都市",
+    "desc": "描述",
+    "duration": "10:00",
+    "book_pic": "https://example.com/pic.jpg",
+    "data": [
+        {"video_id": "v1", "title": "第1集", "chapter_word_number": 100},
+        {"video_id": "v2", "title": "第2集", "chapter_word_number": 200}
+    ]
+})
+
+_CENGUI_VIDEO_INFO_JSON = dumps_json({
+    "code": 200,
+    "data": {
+        "url": "https://example.com/video.m3u8",
+        "pic": "https://example.com/pic.jpg",
+        "title": "第1集",
+        "info": {
+            "quality": "1080p",
+            "duration": "05:30",
+            "size_str": "50MB"
+        }
+    }
+})
+
+# Uuuka / DuanjuSearch 的 _request 返回已解析的数据
+_UUUKA_SEARCH = {
+    "success": True,
+    "message": "success",
+    "data": {
+        "items": [
+            {"title": "测试短剧", "source_link": "https://pan.baidu.com/xxx", "type": "post"}
+        ],
+        "page": 1
+    }
+}
+
+_UUUKA_SEARCH_FAILURE = {
+    "success": False,
+    "message": "搜索失败"
+}
+
+_UUUKA_RECOMMENDATIONS = {
+    "success": True,
+    "data": {
+        "items": [
+            {"title": "推荐短剧", "source_link": "https://pan.baidu.com/xxx", "type": "post"}
+        ]
+    }
+}
+
+_DUANJU_SEARCH = {
+    "page": "1",
+    "totalPages": 10,
+    "data": [
+        {"name": "测试短剧", "url": "https://pan.quark.cn/xxx", "episodes": "10"}
+    ]
+}
+
+# _get_recent_data 的返回值
+_DUANJU_RECENT_DATA = [
+    {"name": "短剧1", "url": "https://pan.quark.cn/1", "episodes": "10"}
+]
+
+_DUANJU_LOCAL_SEARCH_DATA = [
+    {"name": "测试短剧1"},
+    {"name": "其他短剧"},
+    {"name": "测试短剧2"}
+]
+
+_DUANJU_RECENT_25 = [{"name": f"短剧{i}", "url": f"http://test{i}.com"} for i in range(25)]
+
+
+# 三个适配器共有的冒烟测试：(fixture 名, id, 名称, BASE_URL, 必含分类)
+_ADAPTER_SMOKE_CASES = [
+    ("cenguigui", "cenguigui", "笒鬼鬼短剧API",
+     "https://api.cenguigui.cn/api/duanju/api.php", "推荐榜"),
+    ("uuuka", "uuuka", "即刻短剧API", "https://api.uuuka.com", "短剧"),
+    ("duanju_search", "duanju_search", "全网短剧API", "https://kuoapp.com", "今日更新"),
+]
+
+
+@pytest.mark.parametrize(
+    "fixture_name,provider_id,name,base_url,category",
+    _ADAPTER_SMOKE_CASES,
+    ids=[case[0] for case in _ADAPTER_SMOKE_CASES],
+)
+class TestAdapterSmoke:
+    """适配器通用冒烟测试"""
     
-    def test_init(self):
+    def test_init(self, request, fixture_name, provider_id, name, base_url, category):
         """测试初始化"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
+        adapter = request.getfixturevalue(fixture_name)
         
-        adapter = CenguiguiAdapter()
+        assert (adapter.info.id, adapter.info.name, adapter.BASE_URL) == (provider_id, name, base_url)
+    
+    async def test_get_categories(self, request, fixture_name, provider_id, name, base_url, category):
+        """测试获取分类"""
+        adapter = request.getfixturevalue(fixture_name)
+        categories = await adapter.get_categories()
         
-        assert adapter.info.id == "cenguigui"
-        assert adapter.info.name == "笒鬼鬼短剧API"
-        assert adapter.BASE_URL == "https://api.cenguigui.cn/api/duanju/api.php"
+        assert category in categories
+
+
+class TestCenguiguiAdapter:
+    """Cenguigui 适配器测试"""
     
     def test_init_custom_timeout(self):
         """测试自定义超时"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
         adapter = CenguiguiAdapter(timeout=5000)
         
         assert adapter._timeout == 5000
     
-    def test_categories(self):
+    def test_categories(self, cenguigui):
         """测试分类列表"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        
-        assert len(adapter.CATEGORIES) > 0
-        assert "推荐榜" in adapter.CATEGORIES
-        assert "新剧" in adapter.CATEGORIES
+        assert len(cenguigui.CATEGORIES) > 0
+        assert "推荐榜" in cenguigui.CATEGORIES
+        assert "新剧" in cenguigui.CATEGORIES
     
-    def test_capabilities(self):
+    def test_capabilities(self, cenguigui):
         """测试能力配置"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        caps = adapter.info.capabilities
+        caps = cenguigui.info.capabilities
         
         assert caps.supports_search is True
         assert caps.supports_categories is True
@@ -64,372 +230,258 @@ class TestCenguiguiAdapter:
         assert caps.supports_dynamic_categories is False
         assert "1080p" in caps.available_qualities
     
-    def test_parse_episode_number_chinese(self):
-        """测试解析中文集数"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        assert CenguiguiAdapter._parse_episode_number("第1集") == 1
-        assert CenguiguiAdapter._parse_episode_number("第10集") == 10
-        assert CenguiguiAdapter._parse_episode_number("第100集") == 100
-    
-    def test_parse_episode_number_numeric(self):
-        """测试解析数字集数"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        assert CenguiguiAdapter._parse_episode_number("1") == 1
-        assert CenguiguiAdapter._parse_episode_number("Episode 5") == 5
-    
-    def test_parse_episode_number_no_number(self):
-        """测试无集数"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        assert CenguiguiAdapter._parse_episode_number("预告片") == 0
-        assert CenguiguiAdapter._parse_episode_number("") == 0
-    
-    def test_parse_search_result(self):
+    @pytest.mark.parametrize("text,expected", [
+        ("第1集", 1), ("第10集", 10), ("第100集", 100),
+        ("1", 1), ("Episode 5", 5),
+        ("预告片", 0), ("", 0),
+        ("2024版 第3集", 3), ("第一季 第12集 完", 12),
+    ])
+    def test_parse_episode_number(self, text, expected):
+        """测试解析集数（中文、数字、无集数）"""
+        assert CenguiguiAdapter._parse_episode_number(text) == expected
+    
+    def test_parse_episode_number_cached(self):
+        """测试重复标题命中解析缓存"""
+        CenguiguiAdapter._parse_episode_number("第7集")
+        hits = CenguiguiAdapter._parse_episode_number.cache_info().hits
+        
+        assert CenguiguiAdapter._parse_episode_number("第7集") == 7
+        assert CenguiguiAdapter._parse_episode_number.cache_info().hits == hits + 1
+    
+    def test_parse_search_result(self, cenguigui):
         """测试解析搜索结果"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        json_str = json.dumps({
-            "code": 200,
-            "msg": "success",
-            "page": 1,
-            "data": [
-                {
-                    "book_id": "123",
-                    "title": "测试短剧",
-                    "cover": "http://example.com/cover.jpg",
-                    "episode_cnt": 10,
-                    "intro": "简介",
-                    "type": "言情",
-                    "author": "作者",
-                    "play_cnt": 1000
-                }
-            ]
-        })
-        
-        result = adapter._parse_search_result(json_str)
+        result = cenguigui._parse_search_result(_CENGUI_SEARCH_JSON)
+        
+        assert (
+            result.code,
+            result.page,
+            len(result.data),
+            result.data[0].book_id,
+            result.data[0].title,
+        ) == (
+            200,
+            1,
+            1,
+            "123",
+            "测试短剧",
+        )
+    
+    def test_parse_search_result_bytes(self, cenguigui):
+        """测试直接解析原始响应字节（_request 对 UTF-8 响应返回 bytes）"""
+        result = cenguigui._parse_search_result(_CENGUI_SEARCH_JSON.encode())
         
-        assert result.code == 200
-        assert result.page == 1
-        assert len(result.data) == 1
+        assert result == cenguigui._parse_search_result(_CENGUI_SEARCH_JSON)
         assert result.data[0].book_id == "123"
-        assert result.data[0].title == "测试短剧"
     
-    def test_parse_search_result_string_page(self):
+    def test_parse_search_result_string_page(self, cenguigui):
         """测试解析字符串页码"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        json_str = json.dumps({
-            "code": 200,
-            "msg": "success",
-            "page": "2",
-            "data": []
-        })
-        
-        result = adapter._parse_search_result(json_str)
+        result = cenguigui._parse_search_result(_CENGUI_SEARCH_STRING_PAGE_JSON)
         
         assert result.page == 2
     
-    def test_parse_category_result(self):
-        """测试解析分类结果"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        json_str = json.dumps({
-            "code": 200,
-            "data": [
-                {
-                    "book_id": "456",
-                    "title": "分类短剧",
-                    "cover": "http://example.com/cover2.jpg",
-                    "episode_cnt": 20,
-                    "video_desc": "描述",
-                    "sub_title": "霸总",
-                    "play_cnt": 2000
-                }
-            ]
-        })
-        
-        result = adapter._parse_category_result(json_str, "霸总")
+    def test_parse_search_result_invalid_page(self, cenguigui):
+        """测试无法解析的页码回退为 1"""
+        result = cenguigui._parse_search_result('{"code": 200, "page": "abc", "data": []}')
         
-        assert result.code == 200
-        assert result.category == "霸总"
-        assert len(result.data) == 1
-        assert result.data[0].book_id == "456"
+        assert result.page == 1
     
-    def test_parse_recommendations(self):
+    def test_parse_category_result(self, cenguigui):
+        """测试解析分类结果"""
+        result = cenguigui._parse_category_result(_CENGUI_CATEGORY_JSON, "霸总")
+        
+        assert (
+            result.code,
+            result.category,
+            len(result.data),
+            result.data[0].book_id,
+        ) == (
+            200,
+            "霸总",
+            1,
+            "456",
+        )
+    
+    def test_parse_recommendations(self, cenguigui):
         """测试解析推荐内容"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        json_str = json.dumps({
-            "code": 200,
-            "data": [
-                {
-                    "book_data": {
-                        "book_id": "789",
-                        "book_name": "推荐短剧",
-                        "thumb_url": "http://example.com/thumb.jpg",
-                        "serial_count": 30,
-                        "category": "穿越"
-                    },
-                    "hot": 5000
-                }
-            ]
-        })
-        
-        dramas = adapter._parse_recommendations(json_str)
-        
-        assert len(dramas) == 1
-        assert dramas[0].book_id == "789"
-        assert dramas[0].title == "推荐短剧"
-        assert dramas[0].episode_cnt == 30
+        dramas = cenguigui._parse_recommendations(_CENGUI_RECOMMENDATIONS_JSON)
+        
+        assert (
+            len(dramas),
+            dramas[0].book_id,
+            dramas[0].title,
+            dramas[0].episode_cnt,
+        ) == (
+            1,
+            "789",
+            "推荐短剧",
+            30,
+        )
     
-    def test_parse_episode_list(self):
+    def test_parse_episode_list(self, cenguigui):
         """测试解析剧集列表"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        json_str = json.dumps({
-            "code": 200,
-            "book_name": "测试剧",
-            "book_id": "111",
-            "total": 5,
-            "author": "作者",
-            "category": "言情",
-            "desc": "描述",
-            "duration": "10:00",
-            "book_pic": "http://example.com/pic.jpg",
-            "data": [
-                {"video_id": "v1", "title": "第1集", "chapter_word_number": 100},
-                {"video_id": "v2", "title": "第2集", "chapter_word_number": 200}
-            ]
-        })
-        
-        result = adapter._parse_episode_list(json_str)
+        result = cenguigui._parse_episode_list(_CENGUI_EPISODE_LIST_JSON)
+        
+        assert (
+            result.code,
+            result.book_name,
+            result.total,
+            len(result.episodes),
+            result.episodes[0].video_id,
+            result.episodes[0].episode_number,
+        ) == (
+            200,
+            "测试短剧",
+            20,
+            2,
+            "v1",
+            1,
+        )
+    
+    def test_parse_video_info_invalid_json(self, cenguigui):
+        """测试视频信息解析失败时每次返回新的错误对象"""
+        first = cenguigui._parse_video_info("not json")
+        second = cenguigui._parse_video_info("not json")
         
-        assert result.code == 200
-        assert result.book_name == "测试剧"
-        assert result.total == 5
-        assert len(result.episodes) == 2
-        assert result.episodes[0].video_id == "v1"
-        assert result.episodes[0].episode_number == 1
+        assert (first.code, first.title) == (1, "解析错误")
+        assert second is not first
     
-    def test_parse_video_info(self):
+    def test_parse_video_info(self, cenguigui):
         """测试解析视频信息"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        json_str = json.dumps({
-            "code": 200,
-            "data": {
-                "url": "http://example.com/video.m3u8",
-                "pic": "http://example.com/pic.jpg",
-                "title": "第1集",
-                "info": {
-                    "quality": "1080p",
-                    "duration": "05:30",
-                    "size_str": "100MB"
-                }
-            }
-        })
-        
-        result = adapter._parse_video_info(json_str)
-        
-        assert result.code == 200
-        assert result.url == "http://example.com/video.m3u8"
-        assert result.quality == "1080p"
+        result = cenguigui._parse_video_info(_CENGUI_VIDEO_INFO_JSON)
+        
+        assert (
+            result.code,
+            result.url,
+            result.quality,
+        ) == (
+            200,
+            "https://example.com/video.m3u8",
+            "1080p",
+        )
 
 
 class TestCenguiguiAdapterAsync:
     """Cenguigui 适配器异步测试"""
     
-    @pytest.mark.asyncio
-    async def test_get_categories(self):
-        """测试获取分类"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        categories = await adapter.get_categories()
-        
-        assert len(categories) > 0
-        assert "推荐榜" in categories
-    
-    @pytest.mark.asyncio
-    async def test_search_parse(self):
+    def test_search_parse(self, cenguigui):
         """测试搜索结果解析"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        
         # 直接测试解析方法
-        json_str = json.dumps({
-            "code": 200,
-            "msg": "success",
-            "page": 1,
-            "data": [{"book_id": "1", "title": "测试", "cover": "", "episode_cnt": 10, "intro": "", "type": "", "author": "", "play_cnt": 0}]
-        })
-        
-        result = adapter._parse_search_result(json_str)
+        result = cenguigui._parse_search_result(_CENGUI_SEARCH_JSON)
         
-        assert result.code == 200
-        assert len(result.data) == 1
+        assert (result.code, len(result.data)) == (200, 1)
     
-    @pytest.mark.asyncio
-    async def test_get_episodes_parse(self):
+    def test_get_episodes_parse(self, cenguigui):
         """测试剧集解析"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        
         # 直接测试解析方法
-        json_str = json.dumps({
-            "code": 200,
-            "book_name": "测试剧",
-            "book_id": "1",
-            "total": 2,
-            "data": [
-                {"video_id": "v1", "title": "第1集", "chapter_word_number": 0},
-                {"video_id": "v2", "title": "第2集", "chapter_word_number": 0}
-            ]
-        })
-        
-        result = adapter._parse_episode_list(json_str)
+        result = cenguigui._parse_episode_list(_CENGUI_EPISODE_LIST_JSON)
         
-        assert result.code == 200
-        assert len(result.episodes) == 2
+        assert (result.code, len(result.episodes)) == (200, 2)
 
 
 class TestUuukaAdapter:
     """UuuKa 适配器测试"""
     
-    def test_init(self):
-        """测试初始化"""
-        from src.data.providers.adapters.uuuka_adapter import UuukaAdapter
-        
-        adapter = UuukaAdapter()
-        
-        assert adapter.info.id == "uuuka"
-        assert adapter.info.name == "即刻短剧API"
-        assert adapter.BASE_URL == "https://api.uuuka.com"
-    
-    def test_capabilities(self):
+    def test_capabilities(self, uuuka):
         """测试能力配置"""
-        from src.data.providers.adapters.uuuka_adapter import UuukaAdapter
-        
-        adapter = UuukaAdapter()
-        caps = adapter.info.capabilities
+        caps = uuuka.info.capabilities
         
         assert caps.supports_search is True
         assert caps.supports_episodes is False
         assert caps.supports_video_url is False
     
-    def test_content_types(self):
+    def test_content_types(self, uuuka):
         """测试内容类型映射"""
-        from src.data.providers.adapters.uuuka_adapter import UuukaAdapter
-        
-        adapter = UuukaAdapter()
+        assert "短剧" in uuuka.CONTENT_TYPES
+        assert uuuka.CONTENT_TYPES["短剧"] == "post"
+    
+    async def test_get_categories_fresh_list(self, uuuka):
+        """测试分类列表按映射顺序返回，且每次返回独立副本"""
+        first = await uuuka.get_categories()
         
-        assert "短剧" in adapter.CONTENT_TYPES
-        assert adapter.CONTENT_TYPES["短剧"] == "post"
+        assert first == list(uuuka.CONTENT_TYPES)
+        assert first is not await uuuka.get_categories()
     
-    def test_parse_item(self):
+    def test_parse_item(self, uuuka):
         """测试解析单个项目"""
-        from src.data.providers.adapters.uuuka_adapter import UuukaAdapter
-        
-        adapter = UuukaAdapter()
         item = {
             "title": "测试短剧",
             "source_link": "https://pan.quark.cn/s/xxx",
             "type": "post"
         }
         
-        drama = adapter._parse_item(item)
+        drama = uuuka._parse_item(item)
         
-        assert drama.title == "测试短剧"
-        assert drama.book_id == "https://pan.quark.cn/s/xxx"
+        assert (drama.title, drama.book_id) == ("测试短剧", "https://pan.quark.cn/s/xxx")
     
-    @pytest.mark.asyncio
-    async def test_get_categories(self):
-        """测试获取分类"""
-        from src.data.providers.adapters.uuuka_adapter import UuukaAdapter
+    def test_parse_item_without_link_uses_stable_id(self, uuuka):
+        """测试缺少链接时 book_id 由标题稳定生成"""
+        drama = uuuka._parse_item({"title": "测试短剧"})
         
-        adapter = UuukaAdapter()
-        categories = await adapter.get_categories()
+        assert drama.book_id == stable_id("测试短剧")
+    
+    def test_parse_item_null_title_without_link(self, uuuka):
+        """测试标题为 null 且缺少链接时仍能生成 book_id"""
+        drama = uuuka._parse_item({"title": None})
         
-        assert "短剧" in categories
+        assert drama.book_id == stable_id("")
     
-    @pytest.mark.asyncio
-    async def test_get_episodes_returns_link(self):
-        """测试获取剧集返回链接"""
-        from src.data.providers.adapters.uuuka_adapter import UuukaAdapter
+    def test_parse_search_result_null_link(self, uuuka):
+        """测试 source_link 为 null 的条目不会中断整页解析"""
+        result = uuuka._parse_search_result({
+            "success": True,
+            "data": {"items": [
+                {"title": "测试短剧", "source_link": None},
+                {"title": "正常短剧", "source_link": "https://pan.quark.cn/s/xxx"},
+            ]}
+        })
         
-        adapter = UuukaAdapter()
-        result = await adapter.get_episodes("https://pan.quark.cn/s/xxx")
+        assert [d.book_id for d in result.data] == [stable_id("测试短剧"), "https://pan.quark.cn/s/xxx"]
+    
+    async def test_get_episodes_returns_link(self, uuuka):
+        """测试获取剧集返回链接"""
+        result = await uuuka.get_episodes("https://pan.quark.cn/s/xxx")
         
         assert result.code == 0
         assert "网盘" in result.desc
     
-    @pytest.mark.asyncio
-    async def test_get_video_url_not_supported(self):
+    async def test_get_video_url_not_supported(self, uuuka):
         """测试获取视频地址不支持"""
-        from src.data.providers.adapters.uuuka_adapter import UuukaAdapter
-        
-        adapter = UuukaAdapter()
-        result = await adapter.get_video_url("xxx")
+        result = await uuuka.get_video_url("xxx")
         
         assert result.code == 1
         assert result.url == ""
+        # 每次调用返回新对象，调用方修改结果不会影响后续调用
+        result.url = "changed"
+        again = await uuuka.get_video_url("yyy")
+        assert again is not result
+        assert again.url == ""
+        assert again.title == result.title
 
 
 class TestDuanjuSearchAdapter:
     """短剧搜索适配器测试"""
     
-    def test_init(self):
-        """测试初始化"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
-        adapter = DuanjuSearchAdapter()
-        
-        assert adapter.info.id == "duanju_search"
-        assert adapter.info.name == "全网短剧API"
-    
     def test_init_custom_base_url(self):
         """测试自定义 base_url"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
         adapter = DuanjuSearchAdapter(base_url="https://custom.api.com")
         
         assert adapter.BASE_URL == "https://custom.api.com"
     
-    def test_capabilities(self):
+    def test_capabilities(self, duanju_search):
         """测试能力配置"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
-        adapter = DuanjuSearchAdapter()
-        caps = adapter.info.capabilities
+        caps = duanju_search.info.capabilities
         
         assert caps.supports_search is True
         assert caps.supports_episodes is False
         assert caps.supports_video_url is False
     
-    def test_categories(self):
+    def test_categories(self, duanju_search):
         """测试分类"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
-        adapter = DuanjuSearchAdapter()
-        
-        assert "今日更新" in adapter.CATEGORIES
-        assert "热门榜单" in adapter.CATEGORIES
+        assert "今日更新" in duanju_search.CATEGORIES
+        assert "热门榜单" in duanju_search.CATEGORIES
     
-    def test_parse_item(self):
+    def test_parse_item(self, duanju_search):
         """测试解析单个项目"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
-        adapter = DuanjuSearchAdapter()
         item = {
             "id": "123",
             "name": "测试短剧（90集）",
@@ -439,32 +491,54 @@ class TestDuanjuSearchAdapter:
             "episodes": "90"
         }
         
-        drama = adapter._parse_item(item)
+        drama = duanju_search._parse_item(item)
         
-        assert drama.title == "测试短剧（90集）"
-        assert drama.book_id == "https://pan.quark.cn/s/xxx"
-        assert drama.episode_cnt == 90
+        assert (
+            drama.title,
+            drama.book_id,
+            drama.episode_cnt,
+        ) == (
+            "测试短剧（90集）",
+            "https://pan.quark.cn/s/xxx",
+            90,
+        )
     
-    def test_parse_item_string_episodes(self):
+    def test_parse_item_string_episodes(self, duanju_search):
         """测试解析字符串集数"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
-        adapter = DuanjuSearchAdapter()
         item = {
             "name": "测试",
             "url": "https://pan.quark.cn/s/xxx",
             "episodes": "50集"
         }
         
-        drama = adapter._parse_item(item)
+        drama = duanju_search._parse_item(item)
         
         assert drama.episode_cnt == 50
     
-    def test_parse_search_result(self):
-        """测试解析搜索结果"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
+    @pytest.mark.parametrize("episodes,expected", [
+        (" 12 ", 12), ("12 集", 12), ("未知", 0), ("1-2集", 0),
+    ])
+    def test_parse_item_episodes_text(self, duanju_search, episodes, expected):
+        """测试集数文本去掉"集"与首尾空白后转换，无法转换时为 0"""
+        drama = duanju_search._parse_item({"name": "测试", "url": "", "episodes": episodes})
         
-        adapter = DuanjuSearchAdapter()
+        assert drama.episode_cnt == expected
+    
+    def test_parse_item_int_addtime(self, duanju_search):
+        """测试 addtime 为整数时间戳、url 为 null 时仍能解析"""
+        drama = duanju_search._parse_item({"name": "测试", "url": None, "addtime": 1719619200})
+        
+        assert "更新时间: 1719619200" in drama.intro
+        assert drama.book_id == stable_id("测试")
+    
+    def test_parse_item_invalid_episodes(self, duanju_search):
+        """测试无法解析的集数回退为 0"""
+        drama = duanju_search._parse_item({"name": "测试", "episodes": "未知"})
+        
+        assert drama.episode_cnt == 0
+    
+    def test_parse_search_result(self, duanju_search):
+        """测试解析搜索结果"""
         data = {
             "page": "1",
             "totalPages": 10,
@@ -473,62 +547,36 @@ class TestDuanjuSearchAdapter:
             ]
         }
         
-        result = adapter._parse_search_result(data, 1)
+        result = duanju_search._parse_search_result(data, 1)
         
-        assert result.code == 0
-        assert len(result.data) == 1
+        assert (result.code, len(result.data)) == (0, 1)
     
-    @pytest.mark.asyncio
-    async def test_get_categories(self):
-        """测试获取分类"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
-        adapter = DuanjuSearchAdapter()
-        categories = await adapter.get_categories()
-        
-        assert "今日更新" in categories
-    
-    @pytest.mark.asyncio
-    async def test_get_episodes_returns_link(self):
+    async def test_get_episodes_returns_link(self, duanju_search):
         """测试获取剧集返回链接"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
-        adapter = DuanjuSearchAdapter()
-        result = await adapter.get_episodes("https://pan.quark.cn/s/xxx")
+        result = await duanju_search.get_episodes("https://pan.quark.cn/s/xxx")
         
         assert result.code == 0
         assert "网盘" in result.desc
     
-    @pytest.mark.asyncio
-    async def test_get_video_url_not_supported(self):
+    async def test_get_video_url_not_supported(self, duanju_search):
         """测试获取视频地址不支持"""
-        from src.data.providers.adapters.duanju_search_adapter import DuanjuSearchAdapter
-        
-        adapter = DuanjuSearchAdapter()
-        result = await adapter.get_video_url("xxx")
+        result = await duanju_search.get_video_url("xxx")
         
         assert result.code == 1
         assert result.url == ""
+        assert await duanju_search.get_video_url("yyy") is not result
 
 
 class TestAdapterRateLimit:
     """适配器限流测试"""
     
-    @pytest.mark.asyncio
-    async def test_rate_limit_window(self):
+    def test_rate_limit_window(self, cenguigui):
         """测试限流窗口"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
-        adapter = CenguiguiAdapter()
-        
-        assert adapter.RATE_LIMIT_WINDOW == 10.0
-        assert adapter.RATE_LIMIT_MAX_REQUESTS == 5
+        assert cenguigui.RATE_LIMIT_WINDOW == 10.0
+        assert cenguigui.RATE_LIMIT_MAX_REQUESTS == 5
     
-    @pytest.mark.asyncio
     async def test_wait_for_rate_limit_no_wait(self):
         """测试无需等待的限流"""
-        from src.data.providers.adapters.cenguigui_adapter import CenguiguiAdapter
-        
         adapter = CenguiguiAdapter()
         adapter._request_timestamps.clear()
         
@@ -538,7 +586,6 @@ class TestAdapterRateLimit:
         assert len(adapter._request_timestamps) == 1
 
 
-
 # ============================================================
 # From: test_adapters_full.py
 # ============================================================
@@ -546,8 +593,9 @@ class TestCenguiguiAdapter_Full:
     """测试 Cenguigui 适配器"""
     
     @pytest.fixture
-    def adapter(self):
-        return CenguiguiAdapter(timeout=10000)
+    def adapter(self, cenguigui):
+        """复用模块级适配器实例（默认超时即 10000ms）"""
+        return cenguigui
     
     def test_adapter_info(self, adapter):
         assert adapter.info.id == "cenguigui"
@@ -560,119 +608,40 @@ class TestCenguiguiAdapter_Full:
         assert "推荐榜" in adapter.CATEGORIES
         assert "新剧" in adapter.CATEGORIES
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, adapter):
         categories = await adapter.get_categories()
-        assert categories == adapter.CATEGORIES
+        assert categories == list(adapter.CATEGORIES)
     
     def test_parse_search_result(self, adapter):
-        json_str = json.dumps({
-            "code": 200,
-            "msg": "success",
-            "page": 1,
-            "data": [
-                {
-                    "book_id": "123",
-                    "title": "测试短剧",
-                    "cover": "https://example.com/cover.jpg",
-                    "episode_cnt": 20,
-                    "intro": "简介",
-                    "type": "都市",
-                    "author": "作者",
-                    "play_cnt": 10000
-                }
-            ]
-        })
-        result = adapter._parse_search_result(json_str)
-        assert result.code == 200
-        assert len(result.data) == 1
+        result = adapter._parse_search_result(_CENGUI_SEARCH_JSON)
+        assert (result.code, len(result.data)) == (200, 1)
         assert result.data[0].title == "测试短剧"
     
     def test_parse_search_result_string_page(self, adapter):
-        json_str = json.dumps({
-            "code": 200,
-            "page": "2",
-            "data": []
-        })
-        result = adapter._parse_search_result(json_str)
+        result = adapter._parse_search_result(_CENGUI_SEARCH_STRING_PAGE_JSON)
         assert result.page == 2
     
     def test_parse_category_result(self, adapter):
-        json_str = json.dumps({
-            "code": 200,
-            "data": [
-                {
-                    "book_id": "456",
-                    "title": "分类短剧",
-                    "cover": "https://example.com/cover2.jpg",
-                    "episode_cnt": 15,
-                    "video_desc": "描述",
-                    "sub_title": "甜宠",
-                    "play_cnt": 5000
-                }
-            ]
-        })
-        result = adapter._parse_category_result(json_str, "都市")
+        result = adapter._parse_category_result(_CENGUI_CATEGORY_JSON, "都市")
         assert result.code == 200
         assert result.category == "都市"
         assert len(result.data) == 1
     
     def test_parse_recommendations(self, adapter):
-        json_str = json.dumps({
-            "code": 200,
-            "data": [
-                {
-                    "book_data": {
-                        "book_id": "789",
-                        "book_name": "推荐短剧",
-                        "thumb_url": "https://example.com/thumb.jpg",
-                        "serial_count": "30",
-                        "category": "悬疑"
-                    },
-                    "hot": 8000
-                }
-            ]
-        })
-        dramas = adapter._parse_recommendations(json_str)
+        dramas = adapter._parse_recommendations(_CENGUI_RECOMMENDATIONS_JSON)
         assert len(dramas) == 1
         assert dramas[0].title == "推荐短剧"
         assert dramas[0].episode_cnt == 30
     
     def test_parse_episode_list(self, adapter):
-        json_str = json.dumps({
-            "code": 200,
-            "book_name": "测试短剧",
-            "book_id": "123",
-            "total": "20",
-            "author": "作者",
-            "category": "都市",
-            "desc": "描述",
-            "data": [
-                {"video_id": "v1", "title": "第1集", "chapter_word_number": 0},
-                {"video_id": "v2", "title": "第2集", "chapter_word_number": 0}
-            ]
-        })
-        result = adapter._parse_episode_list(json_str)
+        result = adapter._parse_episode_list(_CENGUI_EPISODE_LIST_JSON)
         assert result.code == 200
         assert result.book_name == "测试短剧"
         assert len(result.episodes) == 2
         assert result.total == 20
     
     def test_parse_video_info(self, adapter):
-        json_str = json.dumps({
-            "code": 200,
-            "data": {
-                "url": "https://example.com/video.m3u8",
-                "pic": "https://example.com/pic.jpg",
-                "title": "第1集",
-                "info": {
-                    "quality": "1080p",
-                    "duration": "05:30",
-                    "size_str": "50MB"
-                }
-            }
-        })
-        result = adapter._parse_video_info(json_str)
+        result = adapter._parse_video_info(_CENGUI_VIDEO_INFO_JSON)
         assert result.code == 200
         assert result.url == "https://example.com/video.m3u8"
         assert result.quality == "1080p"
@@ -703,8 +672,9 @@ class TestUuukaAdapter_Full:
     """测试 UuuKa 适配器"""
     
     @pytest.fixture
-    def adapter(self):
-        return UuukaAdapter(timeout=10000)
+    def adapter(self, uuuka):
+        """复用模块级适配器实例（默认超时即 10000ms）"""
+        return uuuka
     
     def test_adapter_info(self, adapter):
         assert adapter.info.id == "uuuka"
@@ -716,7 +686,6 @@ class TestUuukaAdapter_Full:
         assert "短剧" in adapter.CONTENT_TYPES
         assert adapter.CONTENT_TYPES["短剧"] == "post"
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, adapter):
         categories = await adapter.get_categories()
         assert "短剧" in categories
@@ -737,8 +706,7 @@ class TestUuukaAdapter_Full:
             }
         }
         result = adapter._parse_search_result(data)
-        assert result.code == 0
-        assert len(result.data) == 1
+        assert (result.code, len(result.data)) == (0, 1)
     
     def test_parse_search_result_failed(self, adapter):
         data = {"success": False, "message": "error"}
@@ -782,18 +750,15 @@ class TestUuukaAdapter_Full:
         assert drama.title == "测试短剧"
         assert drama.book_id == "https://pan.example.com/xxx"
     
-    @pytest.mark.asyncio
     async def test_get_episodes(self, adapter):
         result = await adapter.get_episodes("https://pan.example.com/xxx")
         assert result.code == 0
         assert "网盘" in result.desc
     
-    @pytest.mark.asyncio
     async def test_get_episodes_invalid_link(self, adapter):
         result = await adapter.get_episodes("invalid_link")
         assert result.code == 1
     
-    @pytest.mark.asyncio
     async def test_get_video_url(self, adapter):
         result = await adapter.get_video_url("video_001")
         assert result.code == 1
@@ -804,8 +769,9 @@ class TestDuanjuSearchAdapter_Full:
     """测试 DuanjuSearch 适配器"""
     
     @pytest.fixture
-    def adapter(self):
-        return DuanjuSearchAdapter(timeout=10000)
+    def adapter(self, duanju_search):
+        """复用模块级适配器实例（默认超时即 10000ms）"""
+        return duanju_search
     
     def test_adapter_info(self, adapter):
         assert adapter.info.id == "duanju_search"
@@ -820,7 +786,6 @@ class TestDuanjuSearchAdapter_Full:
         assert "今日更新" in adapter.CATEGORIES
         assert "热门榜单" in adapter.CATEGORIES
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, adapter):
         categories = await adapter.get_categories()
         assert "今日更新" in categories
@@ -841,8 +806,7 @@ class TestDuanjuSearchAdapter_Full:
             ]
         }
         result = adapter._parse_search_result(data, 1)
-        assert result.code == 0
-        assert len(result.data) == 1
+        assert (result.code, len(result.data)) == (0, 1)
         assert result.data[0].title == "测试短剧"
     
     def test_parse_search_result_invalid(self, adapter):
@@ -903,18 +867,15 @@ class TestDuanjuSearchAdapter_Full:
         drama = adapter._parse_item(item)
         assert drama.book_id == "123"
     
-    @pytest.mark.asyncio
     async def test_get_episodes(self, adapter):
         result = await adapter.get_episodes("https://pan.quark.cn/s/xxx")
         assert result.code == 0
         assert "网盘" in result.desc
     
-    @pytest.mark.asyncio
     async def test_get_episodes_invalid(self, adapter):
         result = await adapter.get_episodes("invalid")
         assert result.code == 1
     
-    @pytest.mark.asyncio
     async def test_get_video_url(self, adapter):
         result = await adapter.get_video_url("video_001")
         assert result.code == 1
@@ -923,42 +884,35 @@ class TestDuanjuSearchAdapter_Full:
 class TestAdapterRateLimiting:
     """测试适配器限流功能"""
     
-    @pytest.mark.asyncio
     async def test_cenguigui_rate_limit(self):
         adapter = CenguiguiAdapter()
         adapter.RATE_LIMIT_WINDOW = 1.0
         adapter.RATE_LIMIT_MAX_REQUESTS = 2
         
-        # 快速调用两次
-        await adapter._wait_for_rate_limit()
-        await adapter._wait_for_rate_limit()
+        # 并发调用两次
+        await asyncio.gather(adapter._wait_for_rate_limit(), adapter._wait_for_rate_limit())
         
         assert len(adapter._request_timestamps) == 2
     
-    @pytest.mark.asyncio
     async def test_uuuka_rate_limit(self):
         adapter = UuukaAdapter()
         adapter.RATE_LIMIT_WINDOW = 1.0
         adapter.RATE_LIMIT_MAX_REQUESTS = 2
         
-        await adapter._wait_for_rate_limit()
-        await adapter._wait_for_rate_limit()
+        await asyncio.gather(adapter._wait_for_rate_limit(), adapter._wait_for_rate_limit())
         
         assert len(adapter._request_timestamps) == 2
     
-    @pytest.mark.asyncio
     async def test_duanju_search_rate_limit(self):
         adapter = DuanjuSearchAdapter()
         adapter.RATE_LIMIT_WINDOW = 1.0
         adapter.RATE_LIMIT_MAX_REQUESTS = 2
         
-        await adapter._wait_for_rate_limit()
-        await adapter._wait_for_rate_limit()
+        await asyncio.gather(adapter._wait_for_rate_limit(), adapter._wait_for_rate_limit())
         
         assert len(adapter._request_timestamps) == 2
 
 
-
 # ============================================================
 # From: test_adapters_coverage.py
 # ============================================================
@@ -967,46 +921,19 @@ class TestCenguiguiAdapterParsing:
     
     def test_parse_episode_number_standard(self):
         """测试标准集数解析"""
-        def parse_episode_number(title: str) -> int:
-            match = re.search(r'第(\d+)集', title)
-            if match:
-                return int(match.group(1))
-            match = re.search(r'(\d+)', title)
-            if match:
-                return int(match.group(1))
-            return 0
-        
-        assert parse_episode_number("第1集") == 1
-        assert parse_episode_number("第10集") == 10
-        assert parse_episode_number("第100集") == 100
+        assert CenguiguiAdapter._parse_episode_number("第1集") == 1
+        assert CenguiguiAdapter._parse_episode_number("第10集") == 10
+        assert CenguiguiAdapter._parse_episode_number("第100集") == 100
     
     def test_parse_episode_number_numeric_only(self):
         """测试纯数字集数解析"""
-        def parse_episode_number(title: str) -> int:
-            match = re.search(r'第(\d+)集', title)
-            if match:
-                return int(match.group(1))
-            match = re.search(r'(\d+)', title)
-            if match:
-                return int(match.group(1))
-            return 0
-        
-        assert parse_episode_number("1") == 1
-        assert parse_episode_number("Episode 5") == 5
+        assert CenguiguiAdapter._parse_episode_number("1") == 1
+        assert CenguiguiAdapter._parse_episode_number("Episode 5") == 5
     
     def test_parse_episode_number_no_number(self):
         """测试无数字标题"""
-        def parse_episode_number(title: str) -> int:
-            match = re.search(r'第(\d+)集', title)
-            if match:
-                return int(match.group(1))
-            match = re.search(r'(\d+)', title)
-            if match:
-                return int(match.group(1))
-            return 0
-        
-        assert parse_episode_number("序章") == 0
-        assert parse_episode_number("大结局") == 0
+        assert CenguiguiAdapter._parse_episode_number("序章") == 0
+        assert CenguiguiAdapter._parse_episode_number("大结局") == 0
     
     def test_parse_drama_item(self):
         """测试解析短剧项"""
@@ -1038,16 +965,8 @@ class TestCenguiguiAdapterParsing:
     
     def test_parse_search_result(self):
         """测试解析搜索结果"""
-        json_str = json.dumps({
-            "code": 200,
-            "msg": "success",
-            "page": 1,
-            "data": [
-                {"book_id": "1", "title": "短剧1", "cover": "", "episode_cnt": 10, "intro": "", "type": "", "author": "", "play_cnt": 0}
-            ]
-        })
         
-        data = json.loads(json_str)
+        data = json_loads(_CENGUI_SEARCH_JSON)
         dramas = []
         for item in data.get("data", []):
             dramas.append(DramaInfo(
@@ -1061,9 +980,7 @@ class TestCenguiguiAdapterParsing:
                 play_cnt=int(item.get("play_cnt", 0))
             ))
         
-        page = data.get("page", 1)
-        if isinstance(page, str):
-            page = int(page) if page.isdigit() else 1
+        page = to_int(data.get("page", 1), 1)
         
         result = SearchResult(
             code=data.get("code", 0),
@@ -1072,28 +989,19 @@ class TestCenguiguiAdapterParsing:
             page=page
         )
         
-        assert result.code == 200
-        assert len(result.data) == 1
+        assert (result.code, len(result.data)) == (200, 1)
         assert result.page == 1
     
     def test_parse_search_result_string_page(self):
         """测试解析字符串页码"""
         data = {"page": "5"}
-        page = data.get("page", 1)
-        if isinstance(page, str):
-            page = int(page) if page.isdigit() else 1
+        page = to_int(data.get("page", 1), 1)
         assert page == 5
     
     def test_parse_category_result(self):
         """测试解析分类结果"""
-        json_str = json.dumps({
-            "code": 200,
-            "data": [
-                {"book_id": "1", "title": "短剧1", "cover": "", "episode_cnt": 10, "video_desc": "描述", "sub_title": "都市", "play_cnt": 100}
-            ]
-        })
         
-        data = json.loads(json_str)
+        data = json_loads(_CENGUI_CATEGORY_JSON)
         category = "都市"
         dramas = []
         for item in data.get("data", []):
@@ -1120,28 +1028,12 @@ class TestCenguiguiAdapterParsing:
     
     def test_parse_recommendations(self):
         """测试解析推荐内容"""
-        json_str = json.dumps({
-            "data": [
-                {
-                    "book_data": {
-                        "book_id": "1",
-                        "book_name": "推荐短剧",
-                        "thumb_url": "https://example.com/thumb.jpg",
-                        "serial_count": "20",
-                        "category": "甜宠"
-                    },
-                    "hot": 5000
-                }
-            ]
-        })
         
-        data = json.loads(json_str)
+        data = json_loads(_CENGUI_RECOMMENDATIONS_JSON)
         dramas = []
         for item in data.get("data", []):
             book_data = item.get("book_data", {})
-            serial_count = book_data.get("serial_count", 0)
-            if isinstance(serial_count, str):
-                serial_count = int(serial_count) if serial_count.isdigit() else 0
+            serial_count = to_int(book_data.get("serial_count", 0))
             dramas.append(DramaInfo(
                 book_id=str(book_data.get("book_id", "")),
                 title=book_data.get("book_name", ""),
@@ -1155,42 +1047,23 @@ class TestCenguiguiAdapterParsing:
         
         assert len(dramas) == 1
         assert dramas[0].title == "推荐短剧"
-        assert dramas[0].episode_cnt == 20
+        assert dramas[0].episode_cnt == 30
     
     def test_parse_episode_list(self):
         """测试解析剧集列表"""
-        json_str = json.dumps({
-            "code": 200,
-            "book_name": "测试短剧",
-            "book_id": "123",
-            "total": "20",
-            "author": "作者",
-            "category": "都市",
-            "desc": "描述",
-            "duration": "05:00",
-            "book_pic": "https://example.com/pic.jpg",
-            "data": [
-                {"video_id": "v1", "title": "第1集", "chapter_word_number": 0},
-                {"video_id": "v2", "title": "第2集", "chapter_word_number": 0}
-            ]
-        })
         
-        data = json.loads(json_str)
+        data = json_loads(_CENGUI_EPISODE_LIST_JSON)
         episodes = []
         for item in data.get("data", []):
             title = item.get("title", "")
-            match = re.search(r'第(\d+)集', title)
-            ep_num = int(match.group(1)) if match else 0
             episodes.append(EpisodeInfo(
                 video_id=str(item.get("video_id", "")),
                 title=title,
-                episode_number=ep_num,
+                episode_number=CenguiguiAdapter._parse_episode_number(title),
                 chapter_word_number=int(item.get("chapter_word_number", 0))
             ))
         
-        total = data.get("total", 0)
-        if isinstance(total, str):
-            total = int(total) if total.isdigit() else 0
+        total = to_int(data.get("total", 0))
         
         result = EpisodeList(
             code=data.get("code", 0),
@@ -1211,21 +1084,8 @@ class TestCenguiguiAdapterParsing:
     
     def test_parse_video_info(self):
         """测试解析视频信息"""
-        json_str = json.dumps({
-            "code": 200,
-            "data": {
-                "url": "https://example.com/video.m3u8",
-                "pic": "https://example.com/pic.jpg",
-                "title": "第1集",
-                "info": {
-                    "quality": "1080p",
-                    "duration": "05:30",
-                    "size_str": "50MB"
-                }
-            }
-        })
         
-        data = json.loads(json_str)
+        data = json_loads(_CENGUI_VIDEO_INFO_JSON)
         video_data = data.get("data", {})
         info = video_data.get("info", {})
         
@@ -1281,7 +1141,7 @@ class TestUuukaAdapterParsing:
             dramas = []
             for item in items:
                 source_link = item.get("source_link", "")
-                book_id = source_link if source_link else str(hash(item.get("title", "")))
+                book_id = source_link if source_link else stable_id(item.get("title", ""))
                 dramas.append(DramaInfo(
                     book_id=book_id,
                     title=item.get("title", ""),
@@ -1295,8 +1155,7 @@ class TestUuukaAdapterParsing:
             page = data.get("data", {}).get("page", 1)
             result = SearchResult(code=0, msg=data.get("message", ""), data=dramas, page=page)
         
-        assert result.code == 0
-        assert len(result.data) == 1
+        assert (result.code, len(result.data)) == (0, 1)
     
     def test_parse_search_result_failure(self):
         """测试解析搜索结果失败"""
@@ -1322,7 +1181,7 @@ class TestUuukaAdapterParsing:
         }
         
         source_link = item.get("source_link", "")
-        book_id = source_link if source_link else str(hash(item.get("title", "")))
+        book_id = source_link if source_link else stable_id(item.get("title", ""))
         
         drama = DramaInfo(
             book_id=book_id,
@@ -1442,16 +1301,15 @@ class TestCenguiguiCategories:
         assert "霸总" in CATEGORIES
         assert len(CATEGORIES) > 10
     
-    def test_categories_copy(self):
-        """测试分类列表复制"""
-        CATEGORIES = ["推荐榜", "新剧"]
-        categories_copy = CATEGORIES.copy()
+    async def test_categories_copy(self, cenguigui):
+        """测试 get_categories 返回独立列表，修改不影响只读的类属性"""
+        categories = await cenguigui.get_categories()
         
-        categories_copy.append("新增")
+        categories.append("新增")
         
-        assert "新增" not in CATEGORIES
-        assert "新增" in categories_copy
-
+        assert isinstance(cenguigui.CATEGORIES, tuple)
+        assert "新增" not in cenguigui.CATEGORIES
+        assert "新增" in categories
 
 
 # ============================================================
@@ -1461,29 +1319,18 @@ class TestCenguiguiAdapterAsync_Async:
     """测试 Cenguigui 适配器异步方法"""
     
     @pytest.fixture
-    def adapter(self):
-        return CenguiguiAdapter(timeout=10000)
+    def adapter(self, cenguigui):
+        """复用模块级适配器实例，每个测试前清空限流记录"""
+        cenguigui._request_timestamps.clear()
+        return cenguigui
     
-    @pytest.mark.asyncio
     async def test_search_with_mock(self, adapter):
         """测试搜索（使用 mock）"""
-        mock_response = {
-            "code": 200,
-            "msg": "success",
-            "page": 1,
-            "data": [
-                {"book_id": "1", "title": "测试短剧", "cover": "", "episode_cnt": 10, "intro": "", "type": "", "author": "", "play_cnt": 0}
-            ]
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps(mock_response)
+        with patch.object(adapter, '_request', async_return(_CENGUI_SEARCH_JSON)):
             result = await adapter.search("测试", 1)
             
-            assert result.code == 200
-            assert len(result.data) == 1
+            assert (result.code, len(result.data)) == (200, 1)
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, adapter):
         """测试获取分类"""
         categories = await adapter.get_categories()
@@ -1492,99 +1339,52 @@ class TestCenguiguiAdapterAsync_Async:
         assert len(categories) > 0
         assert "推荐榜" in categories
     
-    @pytest.mark.asyncio
+    async def test_search_and_categories_parallel(self, adapter):
+        """测试相互独立的调用可通过 asyncio.gather 并发执行"""
+        with patch.object(adapter, '_request', async_return(_CENGUI_SEARCH_JSON)):
+            result, categories = await asyncio.gather(
+                adapter.search("测试", 1), adapter.get_categories()
+            )
+        
+        assert result.code == 200
+        assert "推荐榜" in categories
+    
     async def test_get_category_dramas_with_mock(self, adapter):
         """测试获取分类短剧（使用 mock）"""
-        mock_response = {
-            "code": 200,
-            "data": [
-                {"book_id": "1", "title": "短剧1", "cover": "", "episode_cnt": 10, "video_desc": "", "sub_title": "都市", "play_cnt": 0}
-            ]
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps(mock_response)
+        with patch.object(adapter, '_request', async_return(_CENGUI_CATEGORY_JSON)):
             result = await adapter.get_category_dramas("都市", 1)
             
             assert result.code == 200
             assert result.category == "都市"
     
-    @pytest.mark.asyncio
     async def test_get_recommendations_with_mock(self, adapter):
         """测试获取推荐（使用 mock）"""
-        mock_response = {
-            "data": [
-                {
-                    "book_data": {
-                        "book_id": "1",
-                        "book_name": "推荐短剧",
-                        "thumb_url": "",
-                        "serial_count": "20",
-                        "category": "甜宠"
-                    },
-                    "hot": 5000
-                }
-            ]
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps(mock_response)
+        with patch.object(adapter, '_request', async_return(_CENGUI_RECOMMENDATIONS_JSON)):
             result = await adapter.get_recommendations()
             
             assert isinstance(result, list)
             assert len(result) == 1
     
-    @pytest.mark.asyncio
     async def test_get_episodes_with_mock(self, adapter):
         """测试获取剧集（使用 mock）"""
-        mock_response = {
-            "code": 200,
-            "book_name": "测试短剧",
-            "book_id": "123",
-            "total": 20,
-            "data": [
-                {"video_id": "v1", "title": "第1集", "chapter_word_number": 0}
-            ]
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps(mock_response)
+        with patch.object(adapter, '_request', async_return(_CENGUI_EPISODE_LIST_JSON)):
             result = await adapter.get_episodes("123")
             
-            assert result.code == 200
-            assert len(result.episodes) == 1
+            assert (result.code, len(result.episodes)) == (200, 2)
     
-    @pytest.mark.asyncio
     async def test_get_video_url_with_mock(self, adapter):
-        """测试获取视频URL（使用 mock）"""
-        mock_response = {
-            "code": 200,
-            "data": {
-                "url": "https://example.com/video.m3u8",
-                "pic": "",
-                "title": "第1集",
-                "info": {"quality": "1080p", "duration": "05:00", "size_str": "50MB"}
-            }
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps(mock_response)
+        """测试获取视频URL（使用 mock）"""
+        with patch.object(adapter, '_request', async_return(_CENGUI_VIDEO_INFO_JSON)):
             result = await adapter.get_video_url("v1", "1080p")
             
             assert result.code == 200
             assert result.url == "https://example.com/video.m3u8"
     
-    @pytest.mark.asyncio
     async def test_rate_limit_wait(self, adapter):
-        """测试限流等待"""
-        # 清空时间戳
-        adapter._request_timestamps.clear()
-        
+        """测试限流等待（adapter 夹具已清空时间戳）"""
         # 添加一些时间戳
-        import time
         now = time.monotonic()
-        for i in range(3):
-            adapter._request_timestamps.append(now - i)
+        adapter._request_timestamps.extend((now - 2, now - 1, now))
         
         # 应该不需要等待
         await adapter._wait_for_rate_limit()
@@ -1596,45 +1396,25 @@ class TestUuukaAdapterAsync:
     """测试 Uuuka 适配器异步方法"""
     
     @pytest.fixture
-    def adapter(self):
-        return UuukaAdapter(timeout=10000)
+    def adapter(self, uuuka):
+        """复用模块级适配器实例，每个测试前清空限流记录"""
+        uuuka._request_timestamps.clear()
+        return uuuka
     
-    @pytest.mark.asyncio
     async def test_search_with_mock(self, adapter):
         """测试搜索（使用 mock）"""
-        mock_response = {
-            "success": True,
-            "message": "success",
-            "data": {
-                "items": [
-                    {"title": "测试短剧", "source_link": "https://pan.baidu.com/xxx", "type": "post"}
-                ],
-                "page": 1
-            }
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
+        with patch.object(adapter, '_request', async_return(_UUUKA_SEARCH)):
             result = await adapter.search("测试", 1)
             
-            assert result.code == 0
-            assert len(result.data) == 1
+            assert (result.code, len(result.data)) == (0, 1)
     
-    @pytest.mark.asyncio
     async def test_search_failure(self, adapter):
         """测试搜索失败"""
-        mock_response = {
-            "success": False,
-            "message": "搜索失败"
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
+        with patch.object(adapter, '_request', async_return(_UUUKA_SEARCH_FAILURE)):
             result = await adapter.search("测试", 1)
             
             assert result.code == 1
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, adapter):
         """测试获取分类"""
         categories = await adapter.get_categories()
@@ -1642,44 +1422,20 @@ class TestUuukaAdapterAsync:
         assert isinstance(categories, list)
         assert "短剧" in categories
     
-    @pytest.mark.asyncio
     async def test_get_category_dramas_with_mock(self, adapter):
         """测试获取分类短剧（使用 mock）"""
-        mock_response = {
-            "success": True,
-            "data": {
-                "items": [
-                    {"title": "短剧1", "source_link": "https://pan.baidu.com/1", "type": "post"}
-                ],
-                "page": 1
-            }
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
+        with patch.object(adapter, '_request', async_return(_UUUKA_SEARCH)):
             result = await adapter.get_category_dramas("短剧", 1)
             
             assert result.code == 0
     
-    @pytest.mark.asyncio
     async def test_get_recommendations_with_mock(self, adapter):
         """测试获取推荐（使用 mock）"""
-        mock_response = {
-            "success": True,
-            "data": {
-                "items": [
-                    {"title": "推荐短剧", "source_link": "https://pan.baidu.com/xxx", "type": "post"}
-                ]
-            }
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
+        with patch.object(adapter, '_request', async_return(_UUUKA_RECOMMENDATIONS)):
             result = await adapter.get_recommendations()
             
             assert isinstance(result, list)
     
-    @pytest.mark.asyncio
     async def test_get_episodes_valid_link(self, adapter):
         """测试获取剧集 - 有效链接"""
         result = await adapter.get_episodes("https://pan.baidu.com/xxx")
@@ -1687,14 +1443,12 @@ class TestUuukaAdapterAsync:
         assert result.code == 0
         assert "网盘" in result.book_name
     
-    @pytest.mark.asyncio
     async def test_get_episodes_invalid_link(self, adapter):
         """测试获取剧集 - 无效链接"""
         result = await adapter.get_episodes("invalid")
         
         assert result.code == 1
     
-    @pytest.mark.asyncio
     async def test_get_video_url_not_supported(self, adapter):
         """测试获取视频URL - 不支持"""
         result = await adapter.get_video_url("v1", "1080p")
@@ -1707,28 +1461,19 @@ class TestDuanjuSearchAdapterAsync:
     """测试 DuanjuSearch 适配器异步方法"""
     
     @pytest.fixture
-    def adapter(self):
-        return DuanjuSearchAdapter(timeout=10000)
+    def adapter(self, duanju_search):
+        """复用模块级适配器实例，每个测试前清空限流记录与最近数据缓存"""
+        duanju_search._request_timestamps.clear()
+        duanju_search._recent_cache = None
+        return duanju_search
     
-    @pytest.mark.asyncio
     async def test_search_with_mock(self, adapter):
         """测试搜索（使用 mock）"""
-        mock_response = {
-            "page": "1",
-            "totalPages": 10,
-            "data": [
-                {"name": "测试短剧", "url": "https://pan.quark.cn/xxx", "episodes": "10"}
-            ]
-        }
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_response
+        with patch.object(adapter, '_request', async_return(_DUANJU_SEARCH)):
             result = await adapter.search("测试", 1)
             
-            assert result.code == 0
-            assert len(result.data) == 1
+            assert (result.code, len(result.data)) == (0, 1)
     
-    @pytest.mark.asyncio
     async def test_search_fallback_to_local(self, adapter):
         """测试搜索回退到本地"""
         with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
@@ -1740,7 +1485,6 @@ class TestDuanjuSearchAdapterAsync:
                 
                 mock_local.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, adapter):
         """测试获取分类"""
         categories = await adapter.get_categories()
@@ -1748,33 +1492,20 @@ class TestDuanjuSearchAdapterAsync:
         assert isinstance(categories, list)
         assert "今日更新" in categories
     
-    @pytest.mark.asyncio
     async def test_get_category_dramas_with_mock(self, adapter):
         """测试获取分类短剧（使用 mock）"""
-        mock_data = [
-            {"name": "短剧1", "url": "https://pan.quark.cn/1", "episodes": "10"}
-        ]
-        
-        with patch.object(adapter, '_get_recent_data', new_callable=AsyncMock) as mock_recent:
-            mock_recent.return_value = mock_data
+        with patch.object(adapter, '_get_recent_data', async_return(_DUANJU_RECENT_DATA)):
             result = await adapter.get_category_dramas("今日更新", 1)
             
             assert result.code == 0
     
-    @pytest.mark.asyncio
     async def test_get_recommendations_with_mock(self, adapter):
         """测试获取推荐（使用 mock）"""
-        mock_data = [
-            {"name": "推荐短剧", "url": "https://pan.quark.cn/xxx", "episodes": "20"}
-        ]
-        
-        with patch.object(adapter, '_get_recent_data', new_callable=AsyncMock) as mock_recent:
-            mock_recent.return_value = mock_data
+        with patch.object(adapter, '_get_recent_data', async_return(_DUANJU_RECENT_DATA)):
             result = await adapter.get_recommendations()
             
             assert isinstance(result, list)
     
-    @pytest.mark.asyncio
     async def test_get_episodes_valid_link(self, adapter):
         """测试获取剧集 - 有效链接"""
         result = await adapter.get_episodes("https://pan.quark.cn/xxx")
@@ -1782,14 +1513,12 @@ class TestDuanjuSearchAdapterAsync:
         assert result.code == 0
         assert "网盘" in result.book_name
     
-    @pytest.mark.asyncio
     async def test_get_episodes_invalid_link(self, adapter):
         """测试获取剧集 - 无效链接"""
         result = await adapter.get_episodes("invalid")
         
         assert result.code == 1
     
-    @pytest.mark.asyncio
     async def test_get_video_url_not_supported(self, adapter):
         """测试获取视频URL - 不支持"""
         result = await adapter.get_video_url("v1", "1080p")
@@ -1797,38 +1526,34 @@ class TestDuanjuSearchAdapterAsync:
         assert result.code == 1
         assert result.url == ""
     
-    @pytest.mark.asyncio
     async def test_search_from_local(self, adapter):
         """测试本地搜索"""
-        mock_data = [
-            {"name": "测试短剧1"},
-            {"name": "其他短剧"},
-            {"name": "测试短剧2"}
-        ]
-        
-        with patch.object(adapter, '_get_recent_data', new_callable=AsyncMock) as mock_recent:
-            mock_recent.return_value = mock_data
+        with patch.object(adapter, '_get_recent_data', async_return(_DUANJU_LOCAL_SEARCH_DATA)):
             result = await adapter._search_from_local("测试", 1)
             
-            assert result.code == 0
-            assert len(result.data) == 2
+            assert (result.code, len(result.data)) == (0, 2)
+    
+    async def test_search_from_local_case_insensitive(self, adapter):
+        """测试本地搜索忽略大小写，且同一份数据只折叠一次名称"""
+        data = [{"name": "CEO 的逆袭"}, {"name": "其他短剧"}]
+        
+        with patch.object(adapter, '_get_recent_data', async_return(data)):
+            result = await adapter._search_from_local("ceo", 1)
+            names = adapter._folded_names[1]
+            await adapter._search_from_local("Ceo", 1)
+            
+            assert [d.title for d in result.data] == ["CEO 的逆袭"]
+            assert adapter._folded_names[1] is names
     
-    @pytest.mark.asyncio
     async def test_get_recent_data_with_mock(self, adapter):
         """测试获取最近数据（使用 mock）"""
-        mock_data = [
-            {"name": "短剧1", "url": "https://pan.quark.cn/1"}
-        ]
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = mock_data
+        with patch.object(adapter, '_request', async_return(_DUANJU_RECENT_DATA)):
             result = await adapter._get_recent_data()
             
             assert isinstance(result, list)
             assert len(result) == 1
 
 
-
 # ============================================================
 # From: test_adapters_request.py
 # ============================================================
@@ -1836,288 +1561,204 @@ class TestCenguiguiAdapterRequest:
     """测试 Cenguigui 适配器的 _request 方法"""
     
     @pytest.fixture
-    def adapter(self):
-        return CenguiguiAdapter(timeout=5000)
+    def adapter(self, cenguigui):
+        """复用模块级适配器实例，每个测试前清空限流记录"""
+        cenguigui._request_timestamps.clear()
+        return cenguigui
     
-    @pytest.mark.asyncio
-    async def test_request_success(self, adapter):
+    async def test_request_success(self, adapter, mock_aiohttp_session):
         """测试成功的请求"""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"code": 200, "data": []}')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with mock_aiohttp_session(200, b'{"code": 200, "data": []}'):
             result = await adapter._request({"name": "test"})
-            assert '{"code": 200' in result
-    
-    @pytest.mark.asyncio
-    async def test_request_http_error(self, adapter):
-        """测试 HTTP 错误"""
-        mock_response = MagicMock()
-        mock_response.status = 500
-        mock_response.text = AsyncMock(return_value='Internal Server Error')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            with pytest.raises(Exception) as exc_info:
-                await adapter._request({"name": "test"})
-            assert "HTTP Error: 500" in str(exc_info.value)
+            assert b'{"code": 200' in result
     
-    @pytest.mark.asyncio
-    async def test_request_network_error(self, adapter):
-        """测试网络错误"""
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(side_effect=aiohttp.ClientError("Connection failed"))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            with pytest.raises(Exception) as exc_info:
-                await adapter._request({"name": "test"})
-            assert "Connection failed" in str(exc_info.value)
-    
-    @pytest.mark.asyncio
-    async def test_request_api_error_code(self, adapter):
+    async def test_request_api_error_code(self, adapter, mock_aiohttp_session):
         """测试 API 返回错误码"""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"code": 400, "msg": "参数错误"}')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with mock_aiohttp_session(200, '{"code": 400, "msg": "参数错误"}'.encode()):
             # 应该返回响应文本，不抛出异常
             result = await adapter._request({"name": "test"})
-            assert "code" in result
+            assert b"code" in result
+    
+    async def test_request_utf8_charset_returns_bytes(self, adapter, mock_aiohttp_session):
+        """测试声明 UTF-8 编码的响应不解码，直接返回字节"""
+        with mock_aiohttp_session(200, b'{"code": 200}', charset="UTF-8"):
+            assert await adapter._request({"name": "test"}) == b'{"code": 200}'
+    
+    async def test_request_decodes_declared_charset(self, adapter, mock_aiohttp_session):
+        """测试非 UTF-8 响应按 Content-Type 声明的编码解码"""
+        body = '{"code": 200, "msg": "短剧"}'.encode("gbk")
+        with mock_aiohttp_session(200, body, charset="gbk"):
+            result = await adapter._request({"name": "test"})
+            assert json_loads(result)["msg"] == "短剧"
+    
+    async def test_request_reuses_shared_session(self, adapter, mock_aiohttp_session):
+        """测试 shared_session 块内的多次请求只创建一个会话"""
+        with mock_aiohttp_session(200, b'{"code": 200, "data": []}') as (session_cls, mock_session):
+            async with adapter.shared_session():
+                await adapter._request({"name": "a"})
+                await adapter._request({"name": "b"})
+            
+            assert session_cls.call_count == 1
+            assert mock_session.get.call_count == 2
 
 
 class TestUuukaAdapterRequest:
     """测试 Uuuka 适配器的 _request 方法"""
     
     @pytest.fixture
-    def adapter(self):
-        return UuukaAdapter(timeout=5000)
+    def adapter(self, uuuka):
+        """复用模块级适配器实例，每个测试前清空限流记录"""
+        uuuka._request_timestamps.clear()
+        return uuuka
     
-    @pytest.mark.asyncio
-    async def test_request_success(self, adapter):
+    async def test_request_success(self, adapter, mock_aiohttp_session):
         """测试成功的请求"""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"success": true, "data": {"items": []}}')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with mock_aiohttp_session(200, b'{"success": true, "data": {"items": []}}'):
             result = await adapter._request("/api/search", {"keyword": "test"})
             assert result["success"] == True
     
-    @pytest.mark.asyncio
-    async def test_request_http_error(self, adapter):
-        """测试 HTTP 错误"""
-        mock_response = MagicMock()
-        mock_response.status = 404
-        mock_response.text = AsyncMock(return_value='Not Found')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            with pytest.raises(Exception) as exc_info:
-                await adapter._request("/api/search", {"keyword": "test"})
-            assert "HTTP Error: 404" in str(exc_info.value)
-    
-    @pytest.mark.asyncio
-    async def test_request_network_error(self, adapter):
-        """测试网络错误"""
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(side_effect=aiohttp.ClientError("Connection refused"))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            with pytest.raises(Exception) as exc_info:
-                await adapter._request("/api/search", {"keyword": "test"})
-            assert "Connection refused" in str(exc_info.value)
-    
-    @pytest.mark.asyncio
-    async def test_request_json_error(self, adapter):
-        """测试 JSON 解析错误"""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='invalid json')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
-            with pytest.raises(Exception) as exc_info:
-                await adapter._request("/api/search", {"keyword": "test"})
-            assert "解析错误" in str(exc_info.value)
-    
-    @pytest.mark.asyncio
-    async def test_request_api_failure(self, adapter):
+    async def test_request_api_failure(self, adapter, mock_aiohttp_session):
         """测试 API 返回失败"""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"success": false, "message": "Error"}')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with mock_aiohttp_session(200, b'{"success": false, "message": "Error"}'):
             # 应该返回数据，不抛出异常
             result = await adapter._request("/api/search", {"keyword": "test"})
             assert result["success"] == False
+    
+    async def test_recommendations_fallback_shares_session(self, adapter, mock_aiohttp_session):
+        """测试今日更新为空时，回退请求与首个请求共用同一个会话"""
+        with mock_aiohttp_session(200, b'{"success": true, "data": {"items": []}}') as (session_cls, mock_session):
+            assert await adapter.get_recommendations() == []
+            
+            assert session_cls.call_count == 1
+            assert mock_session.get.call_count == 2
 
 
 class TestDuanjuSearchAdapterRequest:
     """测试 DuanjuSearch 适配器的 _request 方法"""
     
     @pytest.fixture
-    def adapter(self):
-        return DuanjuSearchAdapter(timeout=5000)
+    def adapter(self, duanju_search):
+        """复用模块级适配器实例，每个测试前清空限流记录"""
+        duanju_search._request_timestamps.clear()
+        return duanju_search
     
-    @pytest.mark.asyncio
-    async def test_request_success(self, adapter):
+    async def test_request_success(self, adapter, mock_aiohttp_session):
         """测试成功的请求"""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"page": 1, "data": []}')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with mock_aiohttp_session(200, b'{"page": 1, "data": []}'):
             result = await adapter._request("/duanju/api.php", {"name": "test"})
             assert result["page"] == 1
+
+
+# 三个适配器 _request 共有的错误路径：(fixture 名, _request 参数)
+_REQUEST_ERROR_CASES = [
+    ("cenguigui", ({"name": "test"},)),
+    ("uuuka", ("/api/search", {"keyword": "test"})),
+    ("duanju_search", ("/duanju/api.php", {"name": "test"})),
+]
+# Cenguigui 原样返回响应字节，不在 _request 内解析 JSON
+_JSON_REQUEST_ERROR_CASES = _REQUEST_ERROR_CASES[1:]
+
+
+@pytest.fixture
+def request_adapter(request, fixture_name):
+    """按 fixture 名取模块级适配器实例，并清空限流记录"""
+    adapter = request.getfixturevalue(fixture_name)
+    adapter._request_timestamps.clear()
+    return adapter
+
+
+@pytest.mark.parametrize(
+    "fixture_name,args",
+    _REQUEST_ERROR_CASES,
+    ids=[case[0] for case in _REQUEST_ERROR_CASES],
+)
+class TestAdapterRequestErrors:
+    """测试适配器 _request 的 HTTP 与网络错误"""
     
-    @pytest.mark.asyncio
-    async def test_request_http_error(self, adapter):
+    async def test_request_http_error(self, request_adapter, args, mock_aiohttp_session):
         """测试 HTTP 错误"""
-        mock_response = MagicMock()
-        mock_response.status = 503
-        mock_response.text = AsyncMock(return_value='Service Unavailable')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with mock_aiohttp_session(503, b'Service Unavailable'):
             with pytest.raises(Exception) as exc_info:
-                await adapter._request("/duanju/api.php", {"name": "test"})
+                await request_adapter._request(*args)
             assert "HTTP Error: 503" in str(exc_info.value)
     
-    @pytest.mark.asyncio
-    async def test_request_network_error(self, adapter):
+    async def test_request_network_error(self, request_adapter, args, mock_aiohttp_session):
         """测试网络错误"""
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(side_effect=aiohttp.ClientError("Timeout"))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with mock_aiohttp_session(side_effect=aiohttp.ClientError("Connection failed")):
             with pytest.raises(Exception) as exc_info:
-                await adapter._request("/duanju/api.php", {"name": "test"})
-            assert "Timeout" in str(exc_info.value)
+                await request_adapter._request(*args)
+            assert "Connection failed" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "fixture_name,args",
+    _JSON_REQUEST_ERROR_CASES,
+    ids=[case[0] for case in _JSON_REQUEST_ERROR_CASES],
+)
+class TestAdapterRequestJsonErrors:
+    """测试适配器 _request 的 JSON 解析错误"""
     
-    @pytest.mark.asyncio
-    async def test_request_json_error(self, adapter):
+    async def test_request_json_error(self, request_adapter, args, mock_aiohttp_session):
         """测试 JSON 解析错误"""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='not json')
-        
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_response)))
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch('aiohttp.ClientSession', return_value=mock_session):
+        with mock_aiohttp_session(200, b'not json'):
             with pytest.raises(Exception) as exc_info:
-                await adapter._request("/duanju/api.php", {"name": "test"})
+                await request_adapter._request(*args)
             assert "解析错误" in str(exc_info.value)
 
 
-class TestAdapterSearchWithMock:
-    """测试适配器搜索方法"""
-    
-    @pytest.mark.asyncio
-    async def test_cenguigui_search(self):
-        """测试 Cenguigui 搜索"""
-        adapter = CenguiguiAdapter()
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps({
-                "code": 200,
-                "msg": "success",
-                "page": 1,
-                "data": [
-                    {"book_id": "1", "title": "测试", "cover": "", "episode_cnt": 10}
-                ]
-            })
-            
-            result = await adapter.search("测试")
-            assert result.code == 200
-            assert len(result.data) == 1
+# 打桩后直接调用的适配器方法：(fixture 名, 被替换的方法, 返回值, 调用的方法, 参数, 期望摘要)
+_MOCKED_METHOD_CASES = [
+    ("cenguigui", "_request", _CENGUI_SEARCH_JSON, "search", ("测试",), (200, 1)),
+    ("uuuka", "_request", _UUUKA_SEARCH, "search", ("测试",), (0, 1)),
+    ("duanju_search", "_request", _DUANJU_SEARCH, "search", ("测试",), (0, 1)),
+    ("cenguigui", "_request", _CENGUI_CATEGORY_JSON,
+     "get_category_dramas", ("都市",), (200, "都市", 1)),
+    ("uuuka", "_request", _UUUKA_SEARCH,
+     "get_category_dramas", ("短剧",), (0, "短剧", 1)),
+    ("duanju_search", "_get_recent_data", [{"name": "热门短剧", "url": "http://test.com"}],
+     "get_category_dramas", ("热门榜单",), (0, "热门榜单", 1)),
+    ("duanju_search", "_get_recent_data", [{"name": "今日短剧", "url": "http://test.com"}],
+     "get_category_dramas", ("今日更新",), (0, "今日更新", 1)),
+    ("duanju_search", "_get_recent_data", [{"name": "全部短剧", "url": "http://test.com"}],
+     "get_category_dramas", ("全部短剧",), (0, "全部短剧", 1)),
+    ("cenguigui", "_request", _CENGUI_RECOMMENDATIONS_JSON, "get_recommendations", (), ["推荐短剧"]),
+    ("uuuka", "_request", _UUUKA_RECOMMENDATIONS, "get_recommendations", (), ["推荐短剧"]),
+    # 推荐最多 20 条
+    ("duanju_search", "_get_recent_data", _DUANJU_RECENT_25,
+     "get_recommendations", (), [f"短剧{i}" for i in range(20)]),
+]
+
+
+def _summarize(result):
+    """将适配器返回值归约为便于整体比较的摘要"""
+    if isinstance(result, list):
+        return [drama.title for drama in result]
+    if isinstance(result, CategoryResult):
+        return (result.code, result.category, len(result.data))
+    return (result.code, len(result.data))
+
+
+@pytest.mark.parametrize(
+    "fixture_name,patched,payload,method,args,expected",
+    _MOCKED_METHOD_CASES,
+    ids=[f"{case[0]}-{case[3]}" for case in _MOCKED_METHOD_CASES],
+)
+class TestAdapterMethodsWithMock:
+    """测试适配器搜索、分类、推荐方法（打桩数据源）"""
     
-    @pytest.mark.asyncio
-    async def test_uuuka_search(self):
-        """测试 Uuuka 搜索"""
-        adapter = UuukaAdapter()
+    async def test_method(self, request, fixture_name, patched, payload, method, args, expected):
+        """测试方法解析打桩返回值"""
+        adapter = request.getfixturevalue(fixture_name)
         
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {
-                "success": True,
-                "data": {
-                    "items": [{"title": "测试", "source_link": "http://test.com"}],
-                    "page": 1
-                }
-            }
-            
-            result = await adapter.search("测试")
-            assert result.code == 0
-            assert len(result.data) == 1
-    
-    @pytest.mark.asyncio
-    async def test_duanju_search_success(self):
-        """测试 DuanjuSearch 搜索成功"""
-        adapter = DuanjuSearchAdapter()
+        with patch.object(adapter, patched, async_return(payload)):
+            result = await getattr(adapter, method)(*args)
         
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {
-                "page": 1,
-                "data": [{"name": "测试", "url": "http://test.com", "episodes": "10"}]
-            }
-            
-            result = await adapter.search("测试")
-            assert result.code == 0
-            assert len(result.data) == 1
+        assert _summarize(result) == expected
+
+
+class TestAdapterFallbackWithMock:
+    """测试适配器回退与异常路径"""
     
-    @pytest.mark.asyncio
     async def test_duanju_search_fallback(self):
         """测试 DuanjuSearch 搜索失败后回退到本地搜索"""
         adapter = DuanjuSearchAdapter()
@@ -2137,118 +1778,7 @@ class TestAdapterSearchWithMock:
             result = await adapter.search("测试")
             # 应该返回本地搜索结果
             assert result.code == 0
-
-
-class TestAdapterCategoryWithMock:
-    """测试适配器分类方法"""
-    
-    @pytest.mark.asyncio
-    async def test_cenguigui_get_category_dramas(self):
-        """测试 Cenguigui 获取分类短剧"""
-        adapter = CenguiguiAdapter()
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps({
-                "code": 200,
-                "data": [
-                    {"book_id": "1", "title": "测试", "cover": "", "episode_cnt": 10, "video_desc": "描述"}
-                ]
-            })
-            
-            result = await adapter.get_category_dramas("都市")
-            assert result.code == 200
-            assert result.category == "都市"
-    
-    @pytest.mark.asyncio
-    async def test_uuuka_get_category_dramas(self):
-        """测试 Uuuka 获取分类短剧"""
-        adapter = UuukaAdapter()
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {
-                "success": True,
-                "data": {
-                    "items": [{"title": "测试", "source_link": "http://test.com"}],
-                    "page": 1
-                }
-            }
-            
-            result = await adapter.get_category_dramas("短剧")
-            assert result.code == 0
-            assert result.category == "短剧"
-    
-    @pytest.mark.asyncio
-    async def test_duanju_get_category_dramas_hot(self):
-        """测试 DuanjuSearch 获取热门分类"""
-        adapter = DuanjuSearchAdapter()
-        
-        with patch.object(adapter, '_get_recent_data', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = [{"name": "热门短剧", "url": "http://test.com"}]
-            
-            result = await adapter.get_category_dramas("热门榜单")
-            assert result.code == 0
-            assert result.category == "热门榜单"
-    
-    @pytest.mark.asyncio
-    async def test_duanju_get_category_dramas_today(self):
-        """测试 DuanjuSearch 获取今日更新"""
-        adapter = DuanjuSearchAdapter()
-        
-        with patch.object(adapter, '_get_recent_data', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = [{"name": "今日短剧", "url": "http://test.com"}]
-            
-            result = await adapter.get_category_dramas("今日更新")
-            assert result.code == 0
-    
-    @pytest.mark.asyncio
-    async def test_duanju_get_category_dramas_all(self):
-        """测试 DuanjuSearch 获取全部短剧"""
-        adapter = DuanjuSearchAdapter()
-        
-        with patch.object(adapter, '_get_recent_data', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = [{"name": "全部短剧", "url": "http://test.com"}]
-            
-            result = await adapter.get_category_dramas("全部短剧")
-            assert result.code == 0
-
-
-class TestAdapterRecommendationsWithMock:
-    """测试适配器推荐方法"""
-    
-    @pytest.mark.asyncio
-    async def test_cenguigui_get_recommendations(self):
-        """测试 Cenguigui 获取推荐"""
-        adapter = CenguiguiAdapter()
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps({
-                "code": 200,
-                "data": [
-                    {"book_data": {"book_id": "1", "book_name": "推荐", "serial_count": 10}, "hot": 1000}
-                ]
-            })
-            
-            result = await adapter.get_recommendations()
-            assert len(result) == 1
-            assert result[0].title == "推荐"
-    
-    @pytest.mark.asyncio
-    async def test_uuuka_get_recommendations_today(self):
-        """测试 Uuuka 获取今日推荐"""
-        adapter = UuukaAdapter()
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = {
-                "success": True,
-                "data": {
-                    "items": [{"title": "今日推荐", "source_link": "http://test.com"}]
-                }
-            }
-            
-            result = await adapter.get_recommendations()
-            assert len(result) == 1
     
-    @pytest.mark.asyncio
     async def test_uuuka_get_recommendations_fallback(self):
         """测试 Uuuka 今日推荐为空时回退"""
         adapter = UuukaAdapter()
@@ -2268,19 +1798,6 @@ class TestAdapterRecommendationsWithMock:
             result = await adapter.get_recommendations()
             assert len(result) == 1
     
-    @pytest.mark.asyncio
-    async def test_duanju_get_recommendations(self):
-        """测试 DuanjuSearch 获取推荐"""
-        adapter = DuanjuSearchAdapter()
-        
-        with patch.object(adapter, '_get_recent_data', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = [{"name": f"短剧{i}", "url": f"http://test{i}.com"} for i in range(25)]
-            
-            result = await adapter.get_recommendations()
-            # 应该限制为 20 条
-            assert len(result) == 20
-    
-    @pytest.mark.asyncio
     async def test_duanju_get_recommendations_error(self):
         """测试 DuanjuSearch 获取推荐失败"""
         adapter = DuanjuSearchAdapter()
@@ -2295,141 +1812,88 @@ class TestAdapterRecommendationsWithMock:
 class TestAdapterEpisodesAndVideo:
     """测试适配器剧集和视频方法"""
     
-    @pytest.mark.asyncio
     async def test_cenguigui_get_episodes(self):
         """测试 Cenguigui 获取剧集"""
         adapter = CenguiguiAdapter()
         
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps({
-                "code": 200,
-                "book_name": "测试短剧",
-                "book_id": "123",
-                "total": 10,
-                "data": [
-                    {"video_id": "v1", "title": "第1集"},
-                    {"video_id": "v2", "title": "第2集"}
-                ]
-            })
-            
+        with patch.object(adapter, '_request', async_return(_CENGUI_EPISODE_LIST_JSON)):
             result = await adapter.get_episodes("123")
-            assert result.code == 200
-            assert len(result.episodes) == 2
+            assert (result.code, len(result.episodes)) == (200, 2)
     
-    @pytest.mark.asyncio
     async def test_cenguigui_get_video_url(self):
         """测试 Cenguigui 获取视频地址"""
         adapter = CenguiguiAdapter()
         
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = json.dumps({
-                "code": 200,
-                "data": {
-                    "url": "http://video.com/test.m3u8",
-                    "pic": "http://pic.com/test.jpg",
-                    "title": "第1集",
-                    "info": {"quality": "1080p", "duration": "05:00"}
-                }
-            })
-            
+        with patch.object(adapter, '_request', async_return(_CENGUI_VIDEO_INFO_JSON)):
             result = await adapter.get_video_url("v1", "1080p")
             assert result.code == 200
             assert "m3u8" in result.url
     
-    @pytest.mark.asyncio
-    async def test_uuuka_get_episodes_valid_link(self):
-        """测试 Uuuka 获取剧集（有效链接）"""
-        adapter = UuukaAdapter()
-        
-        result = await adapter.get_episodes("http://pan.quark.cn/s/xxx")
-        assert result.code == 0
-        assert "网盘" in result.desc
-    
-    @pytest.mark.asyncio
-    async def test_uuuka_get_episodes_invalid_link(self):
-        """测试 Uuuka 获取剧集（无效链接）"""
-        adapter = UuukaAdapter()
-        
-        result = await adapter.get_episodes("invalid")
-        assert result.code == 1
-    
-    @pytest.mark.asyncio
-    async def test_duanju_get_episodes_valid_link(self):
-        """测试 DuanjuSearch 获取剧集（有效链接）"""
-        adapter = DuanjuSearchAdapter()
-        
-        result = await adapter.get_episodes("http://pan.quark.cn/s/xxx")
-        assert result.code == 0
-        assert "网盘" in result.desc
-    
-    @pytest.mark.asyncio
-    async def test_duanju_get_episodes_invalid_link(self):
-        """测试 DuanjuSearch 获取剧集（无效链接）"""
-        adapter = DuanjuSearchAdapter()
-        
-        result = await adapter.get_episodes("invalid")
-        assert result.code == 1
+    @pytest.mark.parametrize("adapter_cls", [UuukaAdapter, DuanjuSearchAdapter])
+    @pytest.mark.parametrize("link,expected_code", [
+        ("http://pan.quark.cn/s/xxx", 0),
+        ("invalid", 1),
+    ], ids=["valid_link", "invalid_link"])
+    async def test_link_only_get_episodes(self, adapter_cls, link, expected_code):
+        """测试仅提供网盘链接的适配器获取剧集（有效链接返回网盘资源，否则不支持播放）"""
+        result = await adapter_cls().get_episodes(link)
+        assert result.code == expected_code
+        assert ("网盘" in result.desc) is (expected_code == 0)
 
 
 class TestDuanjuSearchGetRecentData:
     """测试 DuanjuSearch 获取最近数据"""
     
-    @pytest.mark.asyncio
-    async def test_get_recent_data_first_day(self):
-        """测试获取今天的数据"""
-        adapter = DuanjuSearchAdapter()
-        
-        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = [{"name": "今日短剧", "url": "http://test.com"}]
-            
-            result = await adapter._get_recent_data()
-            assert len(result) == 1
-    
-    @pytest.mark.asyncio
-    async def test_get_recent_data_fallback(self):
-        """测试今天无数据时回退到前几天"""
+    @pytest.mark.parametrize("responses,expected", [
+        # 今天即有数据
+        ([[{"name": "今日短剧", "url": "http://test.com"}]], 1),
+        # 前两天无数据，回退到第三天
+        ([[], [], [{"name": "前几天短剧", "url": "http://test.com"}]], 1),
+        # 所有日期都无数据（序列耗尽后恒返回空列表）
+        ([], 0),
+        # 请求异常时继续尝试下一天
+        ([Exception("网络错误")] * 2 + [[{"name": "短剧", "url": "http://test.com"}]], 1),
+    ], ids=["first_day", "fallback", "all_empty", "exception"])
+    async def test_get_recent_data(self, responses, expected):
+        """测试按日期回退查找最近数据"""
         adapter = DuanjuSearchAdapter()
+        remaining = iter(responses)
         
-        call_count = 0
         async def mock_request(endpoint, params=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 2:
-                # 前两天无数据
-                return []
-            else:
-                # 第三天有数据
-                return [{"name": "前几天短剧", "url": "http://test.com"}]
+            value = next(remaining, [])
+            if isinstance(value, Exception):
+                raise value
+            return value
         
         with patch.object(adapter, '_request', side_effect=mock_request):
             result = await adapter._get_recent_data()
-            assert len(result) == 1
+            assert len(result) == expected
+            if not expected:
+                assert adapter._recent_cache is None
     
-    @pytest.mark.asyncio
-    async def test_get_recent_data_all_empty(self):
-        """测试所有日期都无数据"""
+    async def test_get_recent_data_requests_consecutive_days(self):
+        """测试从今天起逐日向前请求，日期格式为 YYYY-MM-DD"""
         adapter = DuanjuSearchAdapter()
         
         with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
-            mock_request.return_value = []
-            
-            result = await adapter._get_recent_data()
-            assert len(result) == 0
+            mock_request.side_effect = [[], [], [{"name": "短剧", "url": "http://test.com"}]]
+            await adapter._get_recent_data()
+        
+        today = date.today()
+        days = [call.args[1]["day"] for call in mock_request.call_args_list]
+        assert days == [(today - timedelta(days=n)).strftime("%Y-%m-%d") for n in range(3)]
     
-    @pytest.mark.asyncio
-    async def test_get_recent_data_exception(self):
-        """测试请求异常时继续尝试"""
+    async def test_get_recent_data_cached_within_ttl(self):
+        """测试有效期内复用最近数据，过期后重新获取"""
         adapter = DuanjuSearchAdapter()
         
-        call_count = 0
-        async def mock_request(endpoint, params=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 2:
-                raise Exception("网络错误")
-            else:
-                return [{"name": "短剧", "url": "http://test.com"}]
-        
-        with patch.object(adapter, '_request', side_effect=mock_request):
-            result = await adapter._get_recent_data()
-            assert len(result) == 1
+        with patch.object(adapter, '_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = [{"name": "今日短剧", "url": "http://test.com"}]
+            
+            first = await adapter._get_recent_data()
+            assert await adapter._get_recent_data() is first
+            assert mock_request.call_count == 1
+            
+            adapter._recent_cache = (time.monotonic() - adapter.RECENT_DATA_TTL, first)
+            await adapter._get_recent_data()
+            assert mock_request.call_count == 2
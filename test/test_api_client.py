@@ -2,13 +2,8 @@
 
 测试 src/data/api/api_client.py 中的 API 客户端实现。
 """
-import pytest
 import asyncio
 from unittest.mock import MagicMock, AsyncMock, patch
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.data.api_client import ApiClient
 from src.core.models import ApiResponse
@@ -56,7 +51,6 @@ class TestApiClient:
         client.set_base_url("https://new.api.com")
         assert client.base_url == "https://new.api.com"
     
-    @pytest.mark.asyncio
     async def test_get_success(self):
         """测试成功的 GET 请求"""
         with patch('aiohttp.ClientSession') as mock_session_class:
@@ -81,7 +75,6 @@ class TestApiClient:
             assert response.success is True
             assert response.body == '{"code": 200}'
     
-    @pytest.mark.asyncio
     async def test_get_timeout(self):
         """测试请求超时"""
         with patch('aiohttp.ClientSession') as mock_session_class:
@@ -98,7 +91,6 @@ class TestApiClient:
             assert response.success is False
             assert response.error == "请求超时"
     
-    @pytest.mark.asyncio
     async def test_close(self):
         """测试关闭客户端"""
         client = ApiClient()
@@ -3,16 +3,12 @@
 测试 src/core/utils/async_worker.py 中的异步工作线程。
 注意：这些测试需要 Qt 事件循环，部分测试可能需要跳过。
 """
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 from unittest.mock import MagicMock, patch, AsyncMock
 import asyncio
-import sys
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 
 class TestAsyncWorkerLogic:
     """AsyncWorker 逻辑测试（不依赖 Qt）"""
@@ -23,7 +19,6 @@ class TestAsyncWorkerLogic:
         assert loop is not None
         loop.close()
     
-    @pytest.mark.asyncio
     async def test_async_function_execution(self):
         """测试异步函数执行"""
         async def sample_async_func(x, y):
@@ -33,7 +28,6 @@ class TestAsyncWorkerLogic:
         result = await sample_async_func(1, 2)
         assert result == 3
     
-    @pytest.mark.asyncio
     async def test_async_exception_handling(self):
         """测试异步异常处理"""
         async def failing_func():
@@ -42,7 +36,6 @@ class TestAsyncWorkerLogic:
         with pytest.raises(ValueError):
             await failing_func()
     
-    @pytest.mark.asyncio
     async def test_async_with_args_kwargs(self):
         """测试带参数的异步函数"""
         async def func_with_args(a, b, c=0, d=0):
@@ -94,7 +87,6 @@ class TestAsyncWorkerIntegration:
         assert args == (5,)
         assert service_name == "TestService"
     
-    @pytest.mark.asyncio
     async def test_coroutine_result_handling(self):
         """测试协程结果处理"""
         results = []
@@ -108,7 +100,6 @@ class TestAsyncWorkerIntegration:
         assert len(results) == 1
         assert results[0]["data"] == "test"
     
-    @pytest.mark.asyncio
     async def test_coroutine_error_handling(self):
         """测试协程错误处理"""
         errors = []
@@ -128,7 +119,6 @@ class TestAsyncWorkerIntegration:
 class TestAsyncPatterns:
     """异步模式测试"""
     
-    @pytest.mark.asyncio
     async def test_concurrent_tasks(self):
         """测试并发任务"""
         results = []
@@ -142,7 +132,6 @@ class TestAsyncPatterns:
         
         assert results == [0, 2, 4, 6, 8]
     
-    @pytest.mark.asyncio
     async def test_task_cancellation(self):
         """测试任务取消"""
         async def long_running():
@@ -156,7 +145,6 @@ class TestAsyncPatterns:
         with pytest.raises(asyncio.CancelledError):
             await task
     
-    @pytest.mark.asyncio
     async def test_timeout_handling(self):
         """测试超时处理"""
         async def slow_func():
@@ -182,7 +170,6 @@ class TestAsyncWorkerLogic_Full:
         assert not loop.is_running()
         loop.close()
     
-    @pytest.mark.asyncio
     async def test_coroutine_execution(self):
         """测试协程执行"""
         async def sample_coro(x, y):
@@ -192,7 +179,6 @@ class TestAsyncWorkerLogic_Full:
         result = await sample_coro(1, 2)
         assert result == 3
     
-    @pytest.mark.asyncio
     async def test_coroutine_with_exception(self):
         """测试协程异常"""
         async def failing_coro():
@@ -219,7 +205,6 @@ class TestAsyncWorkerLogic_Full:
         
         assert loop.is_closed()
     
-    @pytest.mark.asyncio
     async def test_task_cancellation(self):
         """测试任务取消"""
         async def long_running():
@@ -232,7 +217,6 @@ class TestAsyncWorkerLogic_Full:
         with pytest.raises(asyncio.CancelledError):
             await task
     
-    @pytest.mark.asyncio
     async def test_gather_with_exceptions(self):
         """测试 gather 处理异常"""
         async def success():
@@ -261,7 +245,6 @@ class TestAsyncWorkerLogic_Full:
         result = sample_func(*args, **kwargs)
         assert result == 9
     
-    @pytest.mark.asyncio
     async def test_async_generator_shutdown(self):
         """测试异步生成器关闭"""
         async def async_gen():
@@ -331,7 +314,6 @@ class TestAsyncWorkerIntegration_Full:
         assert len(error_results) == 1
         assert isinstance(error_results[0], ValueError)
     
-    @pytest.mark.asyncio
     async def test_cleanup_pending_tasks(self):
         """测试清理待处理任务"""
         async def task1():
@@ -370,7 +352,6 @@ class TestAsyncWorkerIntegration_Full:
 class TestAsyncWorkerEdgeCases:
     """边界情况测试"""
     
-    @pytest.mark.asyncio
     async def test_empty_coroutine(self):
         """测试空协程"""
         async def empty_coro():
@@ -379,7 +360,6 @@ class TestAsyncWorkerEdgeCases:
         result = await empty_coro()
         assert result is None
     
-    @pytest.mark.asyncio
     async def test_coroutine_returning_none(self):
         """测试返回 None 的协程"""
         async def none_coro():
@@ -388,7 +368,6 @@ class TestAsyncWorkerEdgeCases:
         result = await none_coro()
         assert result is None
     
-    @pytest.mark.asyncio
     async def test_nested_coroutines(self):
         """测试嵌套协程"""
         async def inner():
@@ -401,7 +380,6 @@ class TestAsyncWorkerEdgeCases:
         result = await outer()
         assert result == "outer_inner"
     
-    @pytest.mark.asyncio
     async def test_multiple_awaits(self):
         """测试多次 await"""
         async def multi_await():
@@ -413,7 +391,6 @@ class TestAsyncWorkerEdgeCases:
         result = await multi_await()
         assert result == 6
     
-    @pytest.mark.asyncio
     async def test_concurrent_execution(self):
         """测试并发执行"""
         results = []
@@ -441,7 +418,6 @@ class TestAsyncWorkerEdgeCases:
         # 关闭未执行的协程以避免警告
         coro.close()
     
-    @pytest.mark.asyncio
     async def test_timeout_handling(self):
         """测试超时处理"""
         async def slow_task():
@@ -4,7 +4,6 @@
 """
 from pathlib import Path
 import json
-import sys
 import tempfile
 import time
 
@@ -12,8 +11,6 @@ import pytest
 
 from src.data.cache_manager import CacheManager
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.data.cache_manager import CacheManager, CacheEntry
 
 
@@ -2,16 +2,12 @@
 
 测试 src/services/category_service.py 中的分类服务。
 """
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch
 from unittest.mock import MagicMock, patch, AsyncMock
 import json
-import sys
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.core.models import CategoryResult, DramaInfo, ApiError
 
 
@@ -152,7 +148,6 @@ class TestCategoryServiceMock:
         provider.get_recommendations = AsyncMock(return_value=[])
         return provider
     
-    @pytest.mark.asyncio
     async def test_fetch_categories_from_provider(self, mock_provider):
         """测试从提供者获取分类"""
         categories = await mock_provider.get_categories()
@@ -161,7 +156,6 @@ class TestCategoryServiceMock:
         assert "都市" in categories
         mock_provider.get_categories.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_fetch_category_dramas_from_provider(self, mock_provider):
         """测试从提供者获取分类短剧"""
         result = await mock_provider.get_category_dramas("都市", 1)
@@ -170,7 +164,6 @@ class TestCategoryServiceMock:
         assert result.category == "都市"
         mock_provider.get_category_dramas.assert_called_once_with("都市", 1)
     
-    @pytest.mark.asyncio
     async def test_fetch_recommendations_from_provider(self, mock_provider):
         """测试从提供者获取推荐"""
         dramas = await mock_provider.get_recommendations()
@@ -507,7 +500,6 @@ class TestCategoryServiceMock_Full:
 class TestCategoryServiceAsync:
     """分类服务异步测试"""
     
-    @pytest.mark.asyncio
     @patch('src.services.category_service.get_current_provider')
     async def test_do_fetch_categories_with_provider(self, mock_get_provider):
         """测试使用 Provider 获取分类"""
@@ -528,7 +520,6 @@ class TestCategoryServiceAsync:
         assert result == ["分类1", "分类2"]
         mock_provider.get_categories.assert_called_once()
     
-    @pytest.mark.asyncio
     @patch('src.services.category_service.get_current_provider')
     async def test_do_fetch_categories_without_provider(self, mock_get_provider):
         """测试无 Provider 时获取分类"""
@@ -546,7 +537,6 @@ class TestCategoryServiceAsync:
         
         assert "推荐榜" in result
     
-    @pytest.mark.asyncio
     @patch('src.services.category_service.get_current_provider')
     async def test_do_fetch_category_dramas_with_provider(self, mock_get_provider):
         """测试使用 Provider 获取分类短剧"""
@@ -571,7 +561,6 @@ class TestCategoryServiceAsync:
         assert result[1].code == 200
         mock_provider.get_category_dramas.assert_called_once_with("霸总", 1)
     
-    @pytest.mark.asyncio
     @patch('src.services.category_service.get_current_provider')
     async def test_do_fetch_recommendations_with_provider(self, mock_get_provider):
         """测试使用 Provider 获取推荐"""
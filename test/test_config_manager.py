@@ -5,10 +5,6 @@
 import pytest
 import json
 import tempfile
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.data.config_manager import ConfigManager, QualityOption
 from src.core.models import AppConfig, ThemeMode
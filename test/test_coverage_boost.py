@@ -3,7 +3,6 @@
 本文件包含针对未覆盖代码路径的测试用例。
 使用 mock 技术隔离外部依赖（网络、文件系统、Qt组件）。
 """
-import sys
 import os
 import asyncio
 import json
@@ -15,10 +14,6 @@ from dataclasses import dataclass
 
 import pytest
 
-# 添加项目根目录到路径
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
 from src.core.models import (
     DramaInfo, EpisodeInfo, VideoInfo, SearchResult,
     EpisodeList, CategoryResult, ApiResponse, ApiError
@@ -272,7 +267,6 @@ class AsyncContextManager:
 class TestDownloadWorkerV2:
     """DownloadWorkerV2 测试类"""
     
-    @pytest.mark.asyncio
     async def test_process_tasks_concurrent_with_semaphore(
         self, mock_drama, mock_episode_list, temp_download_dir
     ):
@@ -317,7 +311,6 @@ class TestDownloadWorkerV2:
         # 验证最大并发数不超过限制
         assert max_concurrent <= 2, f"最大并发数 {max_concurrent} 超过限制 2"
     
-    @pytest.mark.asyncio
     async def test_process_single_task_cancelled(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -343,7 +336,6 @@ class TestDownloadWorkerV2:
         # 任务应该保持 PENDING 状态（未处理）
         assert task.status == DownloadStatus.PENDING
     
-    @pytest.mark.asyncio
     async def test_process_single_task_paused(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -369,7 +361,6 @@ class TestDownloadWorkerV2:
         # 任务应该保持 PENDING 状态
         assert task.status == DownloadStatus.PENDING
     
-    @pytest.mark.asyncio
     async def test_process_single_task_success(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -403,7 +394,6 @@ class TestDownloadWorkerV2:
         assert task.progress == 100.0
         assert task.id in completed_ids
     
-    @pytest.mark.asyncio
     async def test_process_single_task_failure(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -436,7 +426,6 @@ class TestDownloadWorkerV2:
         assert "网络错误" in task.error
         assert len(failed_tasks) == 1
     
-    @pytest.mark.asyncio
     async def test_fetch_video_url_no_provider(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -462,7 +451,6 @@ class TestDownloadWorkerV2:
             
             assert "没有可用的数据提供者" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_fetch_video_url_success(
         self, mock_drama, mock_episode, temp_download_dir, mock_video_info
     ):
@@ -491,7 +479,6 @@ class TestDownloadWorkerV2:
             assert url == mock_video_info.url
             mock_provider.get_video_url.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_download_video_http_200(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -545,7 +532,6 @@ class TestDownloadWorkerV2:
         assert task.total_bytes == len(video_data)
         assert task.downloaded_bytes > 0
     
-    @pytest.mark.asyncio
     async def test_download_video_http_206_resume(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -601,7 +587,6 @@ class TestDownloadWorkerV2:
         # 验证总大小被正确解析
         assert task.total_bytes == total_size
     
-    @pytest.mark.asyncio
     async def test_download_video_http_error(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -643,7 +628,6 @@ class TestDownloadWorkerV2:
             
             assert "HTTP 404" in str(exc_info.value)
     
-    @pytest.mark.asyncio
     async def test_download_video_speed_limit(
         self, mock_drama, mock_episode, temp_download_dir
     ):
@@ -949,7 +933,6 @@ class TestNetworkMonitor:
         # 由于 Qt mock，我们只验证方法不抛异常
         assert True
     
-    @pytest.mark.asyncio
     async def test_do_check_success_restores_connection(self):
         """测试 _do_check() 成功场景 - 连接恢复
         
@@ -987,7 +970,6 @@ class TestNetworkMonitor:
         assert monitor._is_connected
         assert len(restored_emitted) == 1
     
-    @pytest.mark.asyncio
     async def test_do_check_success_with_retry_callback(self):
         """测试 _do_check() 成功后执行重试回调
         
@@ -1025,7 +1007,6 @@ class TestNetworkMonitor:
         assert len(callback_called) == 1
         assert monitor._last_retry_callback is None
     
-    @pytest.mark.asyncio
     async def test_do_check_slow_network(self):
         """测试 _do_check() 慢网络信号
         
@@ -1062,7 +1043,6 @@ class TestNetworkMonitor:
         # 验证慢网络信号被发出
         assert len(slow_emitted) == 1
     
-    @pytest.mark.asyncio
     async def test_do_check_failure(self):
         """测试 _do_check() 失败场景
         
@@ -98,8 +98,6 @@ class TestLogManagerCoverage:
         logger = LogManager()
         
         # 1. 模拟 aiohttp.ClientError
-        import aiohttp
-        
         # Mock ConnectionKey for ClientConnectorError
         mock_key = MagicMock()
         mock_key.ssl = False
@@ -159,7 +157,6 @@ class TestBaseDataProviderCoverage:
         async def get_episodes(self, drama_id): pass
         async def get_video_url(self, episode_id, quality="1080p"): pass
 
-    @pytest.mark.asyncio
     async def test_request_missing_base_url(self):
         """测试请求缺少 base_url"""
         provider = self.MockProvider()
@@ -168,7 +165,6 @@ class TestBaseDataProviderCoverage:
         with pytest.raises(ValueError, match="未设置基础 URL"):
             await provider._request({})
 
-    @pytest.mark.asyncio
     async def test_request_http_error_handling(self):
         """测试 _request 方法的 HTTP 错误处理"""
         provider = self.MockProvider()
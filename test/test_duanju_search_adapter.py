@@ -8,6 +8,7 @@ import time
 from src.core.models import (
     DramaInfo, EpisodeInfo, EpisodeList, VideoInfo, SearchResult, CategoryResult
 )
+from src.utils.string_utils import stable_id
 
 
 class TestDuanjuSearchAdapterParsing:
@@ -28,7 +29,7 @@ class TestDuanjuSearchAdapterParsing:
         
         title = item.get("name") or item.get("title") or "未知短剧"
         source_link = item.get("url") or ""
-        book_id = source_link if source_link else item.get("id") or str(hash(title))
+        book_id = source_link if source_link else item.get("id") or stable_id(title)
         update_time = item.get("addtime") or ""
         
         episode_cnt = item.get("episodes") or 0
@@ -64,7 +65,7 @@ class TestDuanjuSearchAdapterParsing:
         
         title = item.get("name") or item.get("title") or "未知短剧"
         source_link = item.get("url") or ""
-        book_id = source_link if source_link else item.get("id") or str(hash(title))
+        book_id = source_link if source_link else item.get("id") or stable_id(title)
         
         episode_cnt = item.get("episodes") or 0
         if isinstance(episode_cnt, str):
@@ -128,7 +129,7 @@ class TestDuanjuSearchAdapterParsing:
                     episode_cnt = 0
             
             dramas.append(DramaInfo(
-                book_id=source_link or str(hash(title)),
+                book_id=source_link or stable_id(title),
                 title=title,
                 cover="",
                 episode_cnt=episode_cnt,
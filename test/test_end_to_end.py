@@ -5,11 +5,7 @@
 import pytest
 import json
 import time
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.core.models import (
     DramaInfo, EpisodeInfo, VideoInfo, SearchResult,
@@ -4,10 +4,6 @@
 """
 import pytest
 import time
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.error_handler import (
     ErrorQueue, get_user_friendly_message, format_exception_for_display,
@@ -5,10 +5,6 @@
 import pytest
 import json
 import time
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.data.favorites_manager import FavoritesManager
 from src.data.history_manager import HistoryManager
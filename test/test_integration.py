@@ -2,13 +2,8 @@
 
 测试各模块之间的集成和协作。
 """
-import pytest
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.core.models import (
     DramaInfo, SearchResult, EpisodeList, VideoInfo,
     CategoryResult, ApiResponse
@@ -190,7 +185,6 @@ class TestConfigIntegration:
         assert config.theme_mode == ThemeMode.DARK
 
 
-@pytest.mark.asyncio
 class TestAsyncIntegration:
     """异步集成测试"""
     
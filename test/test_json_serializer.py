@@ -4,20 +4,31 @@
 """
 import pytest
 import json
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.json_serializer import (
     serialize_config, deserialize_config,
     serialize_drama, deserialize_drama,
     serialize_episode, deserialize_episode,
-    serialize_dramas, deserialize_dramas
+    serialize_dramas, deserialize_dramas,
+    json_loads
 )
 from src.core.models import AppConfig, ThemeMode, DramaInfo, EpisodeInfo
 
 
+class TestJsonLoads:
+    """JSON 响应解析测试"""
+    
+    @pytest.mark.parametrize("text", ['{"code": 200}', b'{"code": 200}'])
+    def test_json_loads_str_and_bytes(self, text):
+        """测试 str 与 bytes 输入均可解析"""
+        assert json_loads(text) == {"code": 200}
+    
+    def test_json_loads_invalid(self):
+        """测试非法 JSON 抛出 json.JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b"not json")
+
+
 class TestConfigSerialization:
     """配置序列化测试"""
     
@@ -3,8 +3,6 @@
 测试 src/core/models.py 中定义的所有数据模型。
 """
 from dataclasses import asdict
-from pathlib import Path
-import sys
 
 import pytest
 
@@ -18,8 +16,6 @@ from src.core.models import (
     AppConfig, ThemeMode
 )
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.core.models import (
     DramaInfo, EpisodeInfo, VideoInfo, SearchResult,
     EpisodeList, CategoryResult, ApiResponse, ApiError,
@@ -3,7 +3,6 @@ from unittest.mock import MagicMock, AsyncMock, patch
 from unittest.mock import MagicMock, patch, AsyncMock
 import asyncio
 
-import pytest
 
 class TestNetworkMonitorLogic:
     """网络监控器逻辑测试"""
@@ -345,7 +344,6 @@ class TestNetworkMonitorMocked:
 class TestNetworkMonitorAsync_Full:
     """测试网络监控器异步方法"""
     
-    @pytest.mark.asyncio
     async def test_do_check_success(self):
         """测试连接检查成功"""
         is_connected = False
@@ -360,7 +358,6 @@ class TestNetworkMonitorAsync_Full:
         assert result == True
         assert is_connected == True
     
-    @pytest.mark.asyncio
     async def test_do_check_failure(self):
         """测试连接检查失败"""
         consecutive_failures = 0
@@ -377,7 +374,6 @@ class TestNetworkMonitorAsync_Full:
         assert result == False
         assert consecutive_failures == 1
     
-    @pytest.mark.asyncio
     async def test_do_check_slow_response(self):
         """测试慢响应检测"""
         import time
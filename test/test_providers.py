@@ -2,9 +2,7 @@
 
 测试 src/data/providers/ 中的提供者功能。
 """
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
-import sys
 
 import pytest
 
@@ -13,8 +11,6 @@ from src.data.providers.provider_base import (
     BaseDataProvider, ProviderInfo, ProviderCapabilities
 )
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.data.providers.provider_base import (
     BaseDataProvider, IDataProvider, ProviderInfo, ProviderCapabilities
 )
@@ -253,7 +249,6 @@ class TestMockDataProvider:
         
         return provider
     
-    @pytest.mark.asyncio
     async def test_search(self, mock_provider):
         """测试搜索接口"""
         result = await mock_provider.search("测试", 1)
@@ -262,7 +257,6 @@ class TestMockDataProvider:
         assert result.code == 200
         mock_provider.search.assert_called_once_with("测试", 1)
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, mock_provider):
         """测试获取分类接口"""
         result = await mock_provider.get_categories()
@@ -270,7 +264,6 @@ class TestMockDataProvider:
         assert isinstance(result, list)
         assert "都市" in result
     
-    @pytest.mark.asyncio
     async def test_get_category_dramas(self, mock_provider):
         """测试获取分类短剧接口"""
         result = await mock_provider.get_category_dramas("都市", 1)
@@ -278,14 +271,12 @@ class TestMockDataProvider:
         assert isinstance(result, CategoryResult)
         assert result.category == "都市"
     
-    @pytest.mark.asyncio
     async def test_get_recommendations(self, mock_provider):
         """测试获取推荐接口"""
         result = await mock_provider.get_recommendations()
         
         assert isinstance(result, list)
     
-    @pytest.mark.asyncio
     async def test_get_episodes(self, mock_provider):
         """测试获取剧集接口"""
         result = await mock_provider.get_episodes("123")
@@ -293,7 +284,6 @@ class TestMockDataProvider:
         assert isinstance(result, EpisodeList)
         mock_provider.get_episodes.assert_called_once_with("123")
     
-    @pytest.mark.asyncio
     async def test_get_video_url(self, mock_provider):
         """测试获取视频地址接口"""
         result = await mock_provider.get_video_url("v123", "1080p")
@@ -461,7 +451,6 @@ class TestBaseDataProvider:
         provider = ConcreteProvider(timeout=5000)
         assert provider._timeout == 5000
     
-    @pytest.mark.asyncio
     async def test_search(self, provider):
         """测试搜索"""
         result = await provider.search("测试")
@@ -469,7 +458,6 @@ class TestBaseDataProvider:
         assert result.code == 200
         assert result.page == 1
     
-    @pytest.mark.asyncio
     async def test_get_categories(self, provider):
         """测试获取分类"""
         categories = await provider.get_categories()
@@ -477,7 +465,6 @@ class TestBaseDataProvider:
         assert len(categories) == 2
         assert "分类1" in categories
     
-    @pytest.mark.asyncio
     async def test_get_category_dramas(self, provider):
         """测试获取分类短剧"""
         result = await provider.get_category_dramas("分类1", page=2)
@@ -486,14 +473,12 @@ class TestBaseDataProvider:
         assert result.category == "分类1"
         assert result.offset == 2
     
-    @pytest.mark.asyncio
     async def test_get_recommendations(self, provider):
         """测试获取推荐"""
         result = await provider.get_recommendations()
         
         assert isinstance(result, list)
     
-    @pytest.mark.asyncio
     async def test_get_episodes(self, provider):
         """测试获取剧集"""
         result = await provider.get_episodes("123")
@@ -501,7 +486,6 @@ class TestBaseDataProvider:
         assert result.code == 200
         assert result.book_name == "测试"
     
-    @pytest.mark.asyncio
     async def test_get_video_url(self, provider):
         """测试获取视频地址"""
         result = await provider.get_video_url("v1", "720p")
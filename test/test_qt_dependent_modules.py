@@ -98,7 +98,6 @@ class TestAsyncWorkerWithMock:
         loop.close()
         asyncio.set_event_loop(None)
     
-    @pytest.mark.asyncio
     async def test_coroutine_run(self):
         """测试协程运行"""
         async def sample_coro(x, y):
@@ -235,7 +234,6 @@ class TestNetworkMonitorWithMock:
         
         assert callback_called is True
     
-    @pytest.mark.asyncio
     async def test_async_check(self):
         """测试异步检查"""
         import time
@@ -2,9 +2,7 @@
 
 测试 src/data/api/response_parser.py 中的解析功能。
 """
-from pathlib import Path
 import json
-import sys
 
 import pytest
 
@@ -13,8 +11,6 @@ from src.core.models import (
 )
 from src.data.response_parser import ResponseParser
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.data.response_parser import ResponseParser, ApiResponseError
 from src.core.models import DramaInfo, EpisodeInfo, VideoInfo, SearchResult
 
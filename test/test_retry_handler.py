@@ -5,12 +5,8 @@
 import pytest
 import asyncio
 import time
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.utils.retry_handler import (
     RetryConfig, retry_async, with_retry, CircuitBreaker,
     DEFAULT_RETRY_CONFIG
@@ -56,7 +52,6 @@ class TestRetryConfig:
 class TestRetryAsync:
     """retry_async 测试"""
     
-    @pytest.mark.asyncio
     async def test_success_first_try(self):
         """测试首次成功"""
         async def success_func():
@@ -65,7 +60,6 @@ class TestRetryAsync:
         result = await retry_async(success_func)
         assert result == "success"
     
-    @pytest.mark.asyncio
     async def test_success_after_retry(self):
         """测试重试后成功"""
         call_count = 0
@@ -83,7 +77,6 @@ class TestRetryAsync:
         assert result == "success"
         assert call_count == 3
     
-    @pytest.mark.asyncio
     async def test_all_retries_fail(self):
         """测试所有重试都失败"""
         async def always_fail():
@@ -94,7 +87,6 @@ class TestRetryAsync:
         with pytest.raises(ValueError):
             await retry_async(always_fail, config=config)
     
-    @pytest.mark.asyncio
     async def test_on_retry_callback(self):
         """测试重试回调"""
         retry_attempts = []
@@ -113,7 +105,6 @@ class TestRetryAsync:
         assert len(retry_attempts) == 2
         assert retry_attempts == [1, 2]
     
-    @pytest.mark.asyncio
     async def test_non_retryable_exception(self):
         """测试不可重试的异常"""
         call_count = 0
@@ -135,7 +126,6 @@ class TestRetryAsync:
         # 不应该重试
         assert call_count == 1
     
-    @pytest.mark.asyncio
     async def test_with_args_and_kwargs(self):
         """测试带参数的函数"""
         async def add(a, b, c=0):
@@ -148,7 +138,6 @@ class TestRetryAsync:
 class TestWithRetryDecorator:
     """with_retry 装饰器测试"""
     
-    @pytest.mark.asyncio
     async def test_decorator_success(self):
         """测试装饰器成功"""
         @with_retry(RetryConfig(max_retries=2, base_delay=0.01))
@@ -158,7 +147,6 @@ class TestWithRetryDecorator:
         result = await success_func()
         assert result == "decorated success"
     
-    @pytest.mark.asyncio
     async def test_decorator_retry(self):
         """测试装饰器重试"""
         call_count = 0
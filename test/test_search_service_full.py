@@ -1,5 +1,4 @@
 """搜索服务完整测试"""
-import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
 
@@ -257,7 +256,6 @@ class TestSearchServiceMock:
 class TestSearchServiceAsync:
     """搜索服务异步测试"""
     
-    @pytest.mark.asyncio
     @patch('src.services.search_service.get_current_provider')
     async def test_do_search_with_provider(self, mock_get_provider):
         """测试使用 Provider 搜索"""
@@ -282,7 +280,6 @@ class TestSearchServiceAsync:
         assert result.code == 200
         mock_provider.search.assert_called_once_with("测试", 1)
     
-    @pytest.mark.asyncio
     @patch('src.services.search_service.get_current_provider')
     async def test_do_search_without_provider(self, mock_get_provider):
         """测试无 Provider 时的搜索"""
@@ -2,10 +2,8 @@
 
 测试 src/services/ 中的服务实现。
 """
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch
 import asyncio
-import sys
 
 import pytest
 
@@ -14,8 +12,6 @@ from src.core.models import (
     SearchResult, CategoryResult, ApiError
 )
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.core.models import (
     SearchResult, DramaInfo, EpisodeList, VideoInfo,
     CategoryResult, ApiResponse, ApiError
@@ -449,7 +445,6 @@ class TestApiErrorHandling:
 class TestAsyncServicePatterns:
     """测试异步服务模式"""
     
-    @pytest.mark.asyncio
     async def test_async_result_handling(self):
         """测试异步结果处理"""
         async def mock_fetch():
@@ -458,7 +453,6 @@ class TestAsyncServicePatterns:
         result = await mock_fetch()
         assert result["code"] == 200
     
-    @pytest.mark.asyncio
     async def test_async_error_handling(self):
         """测试异步错误处理"""
         async def mock_fetch_error():
@@ -467,7 +461,6 @@ class TestAsyncServicePatterns:
         with pytest.raises(Exception, match="Network error"):
             await mock_fetch_error()
     
-    @pytest.mark.asyncio
     async def test_async_cancellation(self):
         """测试异步取消"""
         async def long_running():
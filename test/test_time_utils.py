@@ -3,10 +3,6 @@
 测试 src/core/utils/time_utils.py 中的时间处理功能。
 """
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.time_utils import format_duration, parse_duration
 
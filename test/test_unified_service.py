@@ -357,7 +357,6 @@ class TestUnifiedServiceMock:
 class TestUnifiedServiceAsync:
     """统一服务异步测试"""
     
-    @pytest.mark.asyncio
     @patch('src.services.unified_service.get_current_provider')
     @patch('src.services.unified_service.get_registry')
     async def test_do_search(self, mock_registry, mock_get_provider):
@@ -380,7 +379,6 @@ class TestUnifiedServiceAsync:
         assert result.code == 200
         mock_provider.search.assert_called_once_with("测试", 1)
     
-    @pytest.mark.asyncio
     @patch('src.services.unified_service.get_current_provider')
     @patch('src.services.unified_service.get_registry')
     async def test_do_fetch_categories(self, mock_registry, mock_get_provider):
@@ -399,7 +397,6 @@ class TestUnifiedServiceAsync:
         
         assert result == ["分类1", "分类2"]
     
-    @pytest.mark.asyncio
     @patch('src.services.unified_service.get_current_provider')
     @patch('src.services.unified_service.get_registry')
     async def test_do_fetch_category_dramas(self, mock_registry, mock_get_provider):
@@ -421,7 +418,6 @@ class TestUnifiedServiceAsync:
         
         assert result.code == 200
     
-    @pytest.mark.asyncio
     @patch('src.services.unified_service.get_current_provider')
     @patch('src.services.unified_service.get_registry')
     async def test_do_fetch_recommendations(self, mock_registry, mock_get_provider):
@@ -440,7 +436,6 @@ class TestUnifiedServiceAsync:
         
         assert result == []
     
-    @pytest.mark.asyncio
     @patch('src.services.unified_service.get_current_provider')
     @patch('src.services.unified_service.get_registry')
     async def test_do_fetch_episodes(self, mock_registry, mock_get_provider):
@@ -462,7 +457,6 @@ class TestUnifiedServiceAsync:
         
         assert result.code == 200
     
-    @pytest.mark.asyncio
     @patch('src.services.unified_service.get_current_provider')
     @patch('src.services.unified_service.get_registry')
     async def test_do_fetch_video_url(self, mock_registry, mock_get_provider):
@@ -484,7 +478,6 @@ class TestUnifiedServiceAsync:
         
         assert result.code == 200
     
-    @pytest.mark.asyncio
     @patch('src.services.unified_service.get_current_provider')
     @patch('src.services.unified_service.get_registry')
     async def test_get_provider_raises_error(self, mock_registry, mock_get_provider):
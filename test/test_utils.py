@@ -3,14 +3,11 @@
 测试 src/core/utils/ 中的工具函数。
 """
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.string_utils import (
     trim, is_blank, split, truncate, 
-    sanitize_filename, format_file_size
+    sanitize_filename, format_file_size, to_int, stable_id,
+    intern_label, is_net_link
 )
 
 
@@ -129,4 +126,61 @@ class TestStringUtils:
         def test_format_terabytes(self):
             """测试 TB 格式化"""
             assert format_file_size(1024 * 1024 * 1024 * 1024) == "1.0 TB"
-
+    
+    class TestToInt:
+        """to_int 函数测试"""
+        
+        def test_to_int_int_and_digit_string(self):
+            """测试整数和数字字符串"""
+            assert to_int(5) == 5
+            assert to_int("20") == 20
+        
+        def test_to_int_invalid_uses_default(self):
+            """测试无法转换时返回默认值"""
+            assert to_int("invalid") == 0
+            assert to_int("", 1) == 1
+            assert to_int(None, 1) == 1
+    
+    class TestStableId:
+        """stable_id 函数测试"""
+        
+        def test_stable_id_deterministic(self):
+            """测试相同输入得到相同的 16 位十六进制标识"""
+            assert stable_id("测试短剧") == stable_id("测试短剧")
+            assert len(stable_id("测试短剧")) == 16
+        
+        def test_stable_id_distinct(self):
+            """测试不同输入得到不同标识"""
+            assert stable_id("短剧A") != stable_id("短剧B")
+        
+        def test_stable_id_none(self):
+            """测试 None 按空字符串处理"""
+            assert stable_id(None) == stable_id("")
+    
+    class TestIsNetLink:
+        """is_net_link 函数测试"""
+        
+        @pytest.mark.parametrize("link,expected", [
+            ("http://pan.quark.cn/s/xxx", True),
+            ("https://pan.baidu.com/s/xxx", True),
+            ("invalid", False),
+            ("", False),
+        ])
+        def test_is_net_link(self, link, expected):
+            """测试网盘链接判定"""
+            assert is_net_link(link) is expected
+    
+    class TestInternLabel:
+        """intern_label 函数测试"""
+        
+        def test_intern_label_shares_object(self):
+            """测试相同标签（含中文）返回同一对象"""
+            a = "".join(["都", "市"])
+            b = "".join(["都", "市"])
+            assert a is not b
+            assert intern_label(a) is intern_label(b)
+        
+        def test_intern_label_non_str_passthrough(self):
+            """测试非字符串原样返回"""
+            assert intern_label(None) is None
+            assert intern_label(3) == 3
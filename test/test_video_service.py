@@ -2,16 +2,12 @@
 
 测试 src/services/video_service.py 中的视频服务。
 """
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 from unittest.mock import MagicMock, patch, AsyncMock
 import json
-import sys
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.core.models import EpisodeList, EpisodeInfo, VideoInfo, ApiError
 
 
@@ -145,7 +141,6 @@ class TestVideoServiceMock:
         ))
         return provider
     
-    @pytest.mark.asyncio
     async def test_fetch_episodes_from_provider(self, mock_provider):
         """测试从提供者获取剧集"""
         result = await mock_provider.get_episodes("123")
@@ -154,7 +149,6 @@ class TestVideoServiceMock:
         assert len(result.episodes) == 2
         mock_provider.get_episodes.assert_called_once_with("123")
     
-    @pytest.mark.asyncio
     async def test_fetch_video_url_from_provider(self, mock_provider):
         """测试从提供者获取视频地址"""
         result = await mock_provider.get_video_url("v1", "1080p")
@@ -163,7 +157,6 @@ class TestVideoServiceMock:
         assert result.url.startswith("http")
         mock_provider.get_video_url.assert_called_once_with("v1", "1080p")
     
-    @pytest.mark.asyncio
     async def test_quality_selection(self, mock_provider):
         """测试清晰度选择"""
         qualities = ["1080p", "720p", "480p"]
@@ -445,7 +438,6 @@ class TestVideoServiceMock_Full:
 class TestVideoServiceAsync:
     """视频服务异步测试"""
     
-    @pytest.mark.asyncio
     @patch('src.services.video_service.get_current_provider')
     async def test_do_fetch_episodes_with_provider(self, mock_get_provider):
         """测试使用 Provider 获取剧集"""
@@ -469,7 +461,6 @@ class TestVideoServiceAsync:
         assert result[1].code == 200
         mock_provider.get_episodes.assert_called_once_with("book_123")
     
-    @pytest.mark.asyncio
     @patch('src.services.video_service.get_current_provider')
     async def test_do_fetch_video_url_with_provider(self, mock_get_provider):
         """测试使用 Provider 获取视频地址"""
@@ -493,14 +484,12 @@ class TestVideoServiceAsync:
         assert result[1].code == 200
         mock_provider.get_video_url.assert_called_once_with("video_123", "1080p")
     
-    @pytest.mark.asyncio
     @patch('src.services.video_service.get_current_provider')
     async def test_do_fetch_episodes_without_provider(self, mock_get_provider):
         """测试无 Provider 时获取剧集"""
         from src.services.video_service import VideoService
         from src.data.api_client import ApiClient
         from src.core.models import ApiResponse
-        import json
         
         mock_get_provider.return_value = None
         
@@ -522,14 +511,12 @@ class TestVideoServiceAsync:
         assert result[0] == "episodes"
         api_client.get.assert_called_once()
     
-    @pytest.mark.asyncio
     @patch('src.services.video_service.get_current_provider')
     async def test_do_fetch_video_url_without_provider(self, mock_get_provider):
         """测试无 Provider 时获取视频地址"""
         from src.services.video_service import VideoService
         from src.data.api_client import ApiClient
         from src.core.models import ApiResponse
-        import json
         
         mock_get_provider.return_value = None
         